@@ -0,0 +1,54 @@
+"""
+
+Performance benchmarks for cryptolib
+
+    python -m benchmarks run [-k PATTERN] [--quick] [-o results.json]
+    python -m benchmarks compare base.json new.json [--threshold 0.1]
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+
+from benchmarks import bench_cipher, bench_pubkey, bench_factor, bench_attack  # noqa: F401 (registration)
+from benchmarks.harness import compare, format_params, run_benchmarks
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    sub = parser.add_subparsers(dest='command', required=True)
+    run = sub.add_parser('run', help='run benchmarks')
+    run.add_argument('-k', dest='pattern', default='', help='only benchmarks whose name contains PATTERN')
+    run.add_argument('--quick', action='store_true', help='smaller parameter grid')
+    run.add_argument('--min-time', type=float, default=0.2, help='seconds per timed batch')
+    run.add_argument('--repeat', type=int, default=3, help='timed batches per case (best is kept)')
+    run.add_argument('-o', dest='output', help='write results as JSON')
+    cmp = sub.add_parser('compare', help='compare two JSON results')
+    cmp.add_argument('base')
+    cmp.add_argument('new')
+    cmp.add_argument('--threshold', type=float, default=0.1, help='relative slowdown counted as regression')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run_benchmarks(args.pattern, args.quick, args.min_time, args.repeat)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+        return 0
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    rows = compare(base, new, args.threshold)
+    for row in rows:
+        mark = 'REGRESSION' if row['regression'] else ''
+        print(f"{row['name']:32} {format_params(row['params']):40} "
+              f"{row['base']:12.3f} -> {row['new']:12.3f} {row['unit']:7} x{row['ratio']:.2f} {mark}")
+    regressions = sum(row['regression'] for row in rows)
+    print(f'{len(rows)} compared, {regressions} regressions (threshold {args.threshold:.0%})')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+from __future__ import annotations
+import random
+import gmpy2
+
+from benchmarks.harness import benchmark
+from benchmarks.keys import fixed_prime, fixed_semiprime
+from cryptolib.attack.block_cipher import des_key_search, ecb_oracle_attack
+from cryptolib.attack.RSA import common_modulus_attack, hasteds_broadcast_attack, wieners_attack
+from cryptolib.cipher import AES, DES
+from cryptolib.pubkey import RSA
+
+
+@benchmark('attack.des_key_search', 'keys/s', lanes=[256, 1024, 4096], quick={'lanes': [1024]})
+def des_key_search_rate(lanes):
+    # a key outside the candidates: every candidate is tried
+    plain = bytes(8)
+    cipher = DES.encrypt(plain, b'\xfe' * 8)
+    count = 4 * lanes
+    keys = [(2 * i).to_bytes(8, 'big') for i in range(count)]
+    return lambda: des_key_search(plain, cipher, keys, lanes), count
+
+
+@benchmark('attack.ecb_oracle', 'ops/s', secret_len=[16, 32])
+def ecb_oracle(secret_len):
+    aes = AES.new(bytes(16), AES.MODE_ECB, padding='pkcs7')
+    secret = bytes(random.randrange(32, 127) for _ in range(secret_len))
+    return lambda: ecb_oracle_attack(16, lambda plain: aes.encrypt(plain + secret)), 1
+
+
+@benchmark('attack.wiener', 'ops/s', bits=[512, 1024, 2048], quick={'bits': [1024]})
+def wiener(bits):
+    p, q = fixed_semiprime(bits)
+    phi = (p - 1) * (q - 1)
+    d = fixed_prime(bits // 4 - 2)
+    while gmpy2.gcd(d, phi) != 1:
+        d = fixed_prime(bits // 4 - 2)
+    e = int(gmpy2.invert(d, phi))
+    return lambda: wieners_attack(e, p * q), 1
+
+
+@benchmark('attack.hastad', 'ops/s', bits=[512, 1024, 2048], quick={'bits': [1024]})
+def hastad(bits):
+    e = 3
+    m = random.getrandbits(bits - 8)
+    ni = []
+    while len(ni) < e:
+        p, q = fixed_semiprime(bits)
+        if gmpy2.gcd(e, (p - 1) * (q - 1)) == 1:
+            ni.append(p * q)
+    ci = [pow(m, e, n) for n in ni]
+    return lambda: hasteds_broadcast_attack(e, ni, ci), 1
+
+
+@benchmark('attack.common_modulus', 'ops/s', bits=[1024, 2048], quick={'bits': [2048]})
+def common_modulus(bits):
+    p, q = fixed_semiprime(bits)
+    n = p * q
+    m = random.getrandbits(bits - 8)
+    e1, e2 = 65537, 257
+    c1, c2 = RSA.encrypt(m, e1, n), RSA.encrypt(m, e2, n)
+    return lambda: common_modulus_attack(n, e1, e2, c1, c2), 1
@@ -0,0 +1,96 @@
+from __future__ import annotations
+import random
+
+from benchmarks.harness import benchmark
+from cryptolib.cipher import AES, DES, TDES
+
+
+MODES = {
+    'ECB': AES.MODE_ECB,
+    'CBC': AES.MODE_CBC,
+    'OFB': AES.MODE_OFB,
+    'CFB': AES.MODE_CFB,
+    'CTR': AES.MODE_CTR,
+    'GCM': AES.MODE_GCM,
+    'XTS': AES.MODE_XTS,
+}
+ALGOS = {
+    'AES-128': (AES.AESAlgo, 16),
+    'AES-192': (AES.AESAlgo, 24),
+    'AES-256': (AES.AESAlgo, 32),
+    'DES': (DES.DESAlgo, 8),
+    'TDES': (TDES.TDESAlgo, 24),
+}
+SIZES = [1 << 10, 1 << 16, 1 << 20]
+
+
+def randbytes(n: int) -> bytes:
+    return random.getrandbits(8 * n).to_bytes(n, 'big') if n else b''
+
+
+@benchmark('cipher.block', 'ops/s', algo=list(ALGOS), quick={'algo': ['AES-128', 'DES']})
+def block(algo):
+    cls, key_size = ALGOS[algo]
+    cipher = cls(randbytes(key_size))
+    data = randbytes(cls.block_size)
+    return lambda: cipher.encrypt_block(data), 1
+
+
+@benchmark('cipher.key_schedule', 'ops/s', algo=list(ALGOS), quick={'algo': ['AES-128', 'DES']})
+def key_schedule(algo):
+    cls, key_size = ALGOS[algo]
+    key = randbytes(key_size)
+    return lambda: cls(key), 1
+
+
+@benchmark('cipher.aes.encrypt', 'ops/s', key_bits=[128, 192, 256])
+def aes_encrypt(key_bits):
+    # one-shot module function: key schedule and one block
+    key, data = randbytes(key_bits // 8), randbytes(16)
+    return lambda: AES.encrypt(data, key), 1
+
+
+@benchmark('cipher.des.crypt', 'ops/s', process=['encrypt', 'decrypt'])
+def des_crypt(process):
+    key, data = randbytes(8), randbytes(8)
+    flag = DES.DES_ENC if process == 'encrypt' else DES.DES_DEC
+    return lambda: DES.crypt(data, key, flag), 1
+
+
+@benchmark('cipher.aes.mode', 'MB/s', mode=list(MODES), size=SIZES, key_bits=[128, 256],
+           direction=['encrypt', 'decrypt'],
+           quick={'mode': list(MODES), 'size': [1 << 16], 'key_bits': [128], 'direction': ['encrypt']})
+def aes_mode(mode, size, key_bits, direction):
+    key = randbytes(key_bits // 8 * (2 if mode == 'XTS' else 1))
+    iv = randbytes(12 if mode == 'GCM' else 16)
+    cipher = AES.new(key, MODES[mode], iv)
+    data = randbytes(size)
+    if mode == 'GCM' and direction == 'decrypt':
+        data, tag = cipher.encrypt_and_digest(data)
+        return lambda: cipher.decrypt_and_verify(data, tag), size
+    run = cipher.encrypt_and_digest if mode == 'GCM' else getattr(cipher, direction)
+    return lambda: run(data), size
+
+
+@benchmark('cipher.des.mode', 'MB/s', algo=['DES', 'TDES'], mode=['ECB', 'CBC', 'CTR'], size=SIZES[:2],
+           quick={'algo': ['DES', 'TDES'], 'mode': ['CBC'], 'size': [1 << 16]})
+def des_mode(algo, mode, size):
+    module = DES if algo == 'DES' else TDES
+    cipher = module.new(randbytes(ALGOS[algo][1]), MODES[mode], randbytes(8))
+    data = randbytes(size)
+    return lambda: cipher.encrypt(data), size
+
+
+@benchmark('cipher.aes.stream', 'MB/s', mode=['CBC', 'CTR', 'GCM'], chunk=[64, 1024, 16384],
+           quick={'mode': ['CTR'], 'chunk': [64, 16384]})
+def aes_stream(mode, chunk):
+    # many small updates: per-call overhead of the contexts
+    cipher = AES.new(randbytes(16), MODES[mode], randbytes(12 if mode == 'GCM' else 16))
+    data = memoryview(randbytes(1 << 16))
+
+    def run():
+        ctx = cipher.encryptor()
+        for i in range(0, len(data), chunk):
+            ctx.update(data[i:i+chunk])
+        ctx.finalize()
+    return run, len(data)
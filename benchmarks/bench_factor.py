@@ -0,0 +1,49 @@
+from __future__ import annotations
+import random
+import gmpy2
+
+from benchmarks.harness import benchmark
+from benchmarks.keys import fixed_prime, fixed_semiprime
+from cryptolib.factor.ecm import ecm
+from cryptolib.factor.fermat import fermat_factor
+from cryptolib.factor.pollard import pollard_rho, pollard_rho_brent, pollard_pm1
+
+
+METHODS = {
+    'rho': pollard_rho,
+    'brent': pollard_rho_brent,
+    'ecm': ecm,
+}
+
+
+@benchmark('factor.generic', 'ops/s', method=list(METHODS), bits=[32, 40, 48],
+           quick={'method': list(METHODS), 'bits': [32]})
+def generic(method, bits):
+    p, q = fixed_semiprime(bits)
+    return lambda: METHODS[method](p * q), 1
+
+
+@benchmark('factor.fermat', 'ops/s', bits=[256, 512, 1024], quick={'bits': [512]})
+def fermat(bits):
+    # close primes
+    p = fixed_prime(bits // 2)
+    q = int(gmpy2.next_prime(p + random.getrandbits(bits // 8)))
+    return lambda: fermat_factor(p * q), 1
+
+
+def smooth_prime(bits: int, bound: int) -> int:
+    # p with p - 1 made of primes below bound
+    primes = [p for p in range(2, bound) if gmpy2.is_prime(p)]
+    while True:
+        m = 2
+        while m.bit_length() < bits:
+            m *= random.choice(primes)
+        if gmpy2.is_prime(m + 1):
+            return m + 1
+
+
+@benchmark('factor.pm1', 'ops/s', bits=[128, 256, 512], quick={'bits': [256]})
+def pm1(bits):
+    p = smooth_prime(bits // 2, 200)
+    q = fixed_prime(bits // 2)
+    return lambda: pollard_pm1(p * q), 1
@@ -0,0 +1,71 @@
+from __future__ import annotations
+import math
+import random
+
+from benchmarks.harness import benchmark
+from benchmarks.keys import fixed_prime, fixed_semiprime
+from cryptolib.number import get_prime
+from cryptolib.pubkey import RSA
+
+
+@benchmark('number.get_prime', 'ops/s', bits=[512, 1024, 2048], quick={'bits': [1024]})
+def prime(bits):
+    return lambda: get_prime(bits), 1
+
+
+@benchmark('rsa.generate', 'ops/s', bits=[512, 1024, 2048], quick={'bits': [512, 1024]})
+def generate(bits):
+    return lambda: RSA.generate(bits), 1
+
+
+@benchmark('rsa.encrypt', 'ops/s', bits=[1024, 2048, 4096], quick={'bits': [2048]})
+def encrypt(bits):
+    p, q = fixed_semiprime(bits)
+    rsa = RSA.construct(p * q, 65537, p, q)
+    m = random.getrandbits(bits - 8)
+    return lambda: rsa.encrypt(m), 1
+
+
+@benchmark('rsa.decrypt', 'ops/s', bits=[1024, 2048, 4096], quick={'bits': [2048]})
+def decrypt(bits):
+    p, q = fixed_semiprime(bits)
+    rsa = RSA.construct(p * q, 65537, p, q)
+    c = rsa.encrypt(random.getrandbits(bits - 8))
+    return lambda: rsa.decrypt(c), 1
+
+
+@benchmark('rsa.decrypt_multiprime', 'ops/s', bits=[2048, 4096], primes=[2, 3, 4],
+           quick={'bits': [4096], 'primes': [2, 4]})
+def decrypt_multiprime(bits, primes):
+    rs = [fixed_prime(bits // primes) for _ in range(primes)]
+    rsa = RSA.construct(math.prod(rs), 65537, rs[0], rs[1], other_primes=rs[2:])
+    c = rsa.encrypt(random.getrandbits(bits // 2))
+    return lambda: rsa.decrypt(c), 1
+
+
+@benchmark('rsa.encrypt_many', 'ops/s', bits=[2048], count=[256])
+def encrypt_many(bits, count):
+    p, q = fixed_semiprime(bits)
+    rsa = RSA.construct(p * q, 65537, p, q)
+    ms = [random.getrandbits(bits - 8) for _ in range(count)]
+    return lambda: rsa.encrypt_many(ms), count
+
+
+@benchmark('rsa.decrypt_many', 'ops/s', bits=[2048], count=[256], exponents=[1, 4])
+def decrypt_many(bits, count, exponents):
+    # exponents > 1: batch RSA over that many small public exponents
+    p, q = fixed_semiprime(bits)
+    rsa = RSA.construct(p * q, 65537, p, q)
+    phi = (p - 1) * (q - 1)
+    es = [e for e in range(3, 1000, 2) if math.gcd(e, phi) == 1 and all(e % f for f in range(3, e, 2))][:exponents]
+    exps = [es[i % exponents] for i in range(count)] if exponents > 1 else [65537] * count
+    cs = [pow(random.getrandbits(bits - 8), e, p * q) for e in exps]
+    return lambda: rsa.decrypt_many(cs, exps if exponents > 1 else None), count
+
+
+@benchmark('rsa.construct', 'ops/s', bits=[1024, 2048], quick={'bits': [1024]})
+def construct(bits):
+    # recovering p and q from d
+    p, q = fixed_semiprime(bits)
+    d = RSA.calc_privatekey(p, q, 65537)
+    return lambda: RSA.construct(p * q, 65537, d=d), 1
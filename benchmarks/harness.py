@@ -0,0 +1,154 @@
+from __future__ import annotations
+from itertools import product
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import json
+import platform
+import random
+import sys
+import time
+
+
+# divisor of the work amount per unit
+UNITS = {
+    'MB/s': 1e6,
+    'ops/s': 1,
+    'keys/s': 1,
+}
+
+Result = Dict[str, Any]
+# a case returns the callable to time and the work it does per call
+Case = Callable[..., Tuple[Callable[[], Any], int]]
+
+
+class Benchmark:
+    def __init__(self, name: str, unit: str, fn: Case, params: Dict[str, List[Any]],
+                 quick: Optional[Dict[str, List[Any]]]) -> None:
+        if unit not in UNITS:
+            raise ValueError('invalid unit')
+        self.name = name
+        self.unit = unit
+        self.fn = fn
+        self.params = params
+        self.quick = quick if quick is not None else {k: v[:1] for k, v in params.items()}
+
+    def cases(self, quick: bool = False) -> Iterator[Dict[str, Any]]:
+        grid = self.quick if quick else self.params
+        keys = list(grid)
+        for values in product(*[grid[k] for k in keys]):
+            yield dict(zip(keys, values))
+
+
+REGISTRY: List[Benchmark] = []
+
+
+def benchmark(name: str, unit: str, quick: Optional[Dict[str, List[Any]]] = None,
+              **params: List[Any]) -> Callable[[Case], Case]:
+    """
+
+    register a benchmark over the product of the parameter lists
+
+    Args:
+        name (str): dotted name, e.g. 'cipher.aes.mode'
+        unit (str): 'MB/s' (work in bytes), 'ops/s' or 'keys/s'
+        quick (Dict[str, List[Any]], optional): smaller grid for --quick (default: first value of each list)
+        params (List[Any]): parameter values
+    """
+    def register(fn: Case) -> Case:
+        REGISTRY.append(Benchmark(name, unit, fn, params, quick))
+        return fn
+    return register
+
+
+def measure(run: Callable[[], Any], min_time: float, repeat: int) -> float:
+    """
+
+    best time of one call; calls are batched so a batch lasts about min_time
+
+    Returns:
+        float: seconds per call
+    """
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    number = max(1, int(min_time / elapsed)) if elapsed > 0 else 1000
+    best = elapsed
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def case_key(result: Result) -> str:
+    return result['name'] + json.dumps(result['params'], sort_keys=True)
+
+
+def run_benchmarks(pattern: str = '', quick: bool = False, min_time: float = 0.2, repeat: int = 3,
+                   log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+
+    run the registered benchmarks whose name contains pattern
+
+    Returns:
+        Dict[str, Any]: {'meta': ..., 'results': [{'name', 'params', 'unit', 'value', 'seconds'}]}
+    """
+    results = []
+    for bench in REGISTRY:
+        if pattern not in bench.name:
+            continue
+        for params in bench.cases(quick):
+            # inputs built from random are the same on every run
+            random.seed(0)
+            run, amount = bench.fn(**params)
+            seconds = measure(run, min_time, repeat)
+            value = amount / seconds / UNITS[bench.unit]
+            results.append({'name': bench.name, 'params': params, 'unit': bench.unit,
+                            'value': value, 'seconds': seconds})
+            log(f'{bench.name:32} {format_params(params):40} {value:14.3f} {bench.unit}')
+    return {
+        'meta': {
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'quick': quick,
+        },
+        'results': results,
+    }
+
+
+def format_params(params: Dict[str, Any]) -> str:
+    return ' '.join(f'{k}={v}' for k, v in params.items())
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float = 0.1) -> List[Dict[str, Any]]:
+    """
+
+    match the results of two runs; every unit is higher-is-better
+
+    Args:
+        base (Dict[str, Any]): reference run
+        new (Dict[str, Any]): run to check
+        threshold (float): relative slowdown reported as a regression
+
+    Returns:
+        List[Dict[str, Any]]: name, params, unit, base, new, ratio and regression of common cases
+    """
+    old = {case_key(r): r for r in base['results']}
+    rows = []
+    for result in new['results']:
+        ref = old.get(case_key(result))
+        if ref is None:
+            continue
+        ratio = result['value'] / ref['value'] if ref['value'] else float('inf')
+        rows.append({
+            'name': result['name'],
+            'params': result['params'],
+            'unit': result['unit'],
+            'base': ref['value'],
+            'new': result['value'],
+            'ratio': ratio,
+            'regression': ratio < 1 - threshold,
+        })
+    return rows
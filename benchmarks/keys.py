@@ -0,0 +1,17 @@
+from __future__ import annotations
+from typing import Tuple
+import random
+import gmpy2
+
+
+def fixed_prime(bits: int) -> int:
+    # deterministic under random.seed, unlike number.get_prime
+    return int(gmpy2.next_prime(random.getrandbits(bits) | 1 << (bits - 1)))
+
+
+def fixed_semiprime(bits: int) -> Tuple[int, int]:
+    p = fixed_prime(bits // 2)
+    q = fixed_prime(bits - bits // 2)
+    while q == p:
+        q = fixed_prime(bits - bits // 2)
+    return p, q
@@ -1,4 +1,7 @@
-from typing import Callable
+from itertools import islice
+from typing import Callable, Iterable, Optional
+
+from cryptolib.cipher import DES
 
 def ecb_oracle_attack(block_size: int, oracle: Callable[[bytes], bytes], block_max: int = 4) -> bytes:
     """
@@ -32,3 +35,44 @@ def ecb_oracle_attack(block_size: int, oracle: Callable[[bytes], bytes], block_m
         if is_finished:
             return found
         idx += 1
+
+
+def des_key_search(plain: bytes, cipher: bytes, keys: Iterable[bytes], lanes: int = 1024) -> Optional[bytes]:
+    """
+
+        DES key search
+
+    Encrypts `plain` under `lanes` candidate keys per bitsliced pass and
+    compares every lane with `cipher` at once.
+
+    Args:
+        plain (bytes): known 8 bytes plaintext
+        cipher (bytes): its 8 bytes ciphertext
+        keys (Iterable[bytes]): candidate 8 bytes keys
+        lanes (int): candidate keys per pass
+
+    Returns:
+        Optional[bytes]: the first matching key
+    """
+    lanes = -(-lanes // 8) * 8
+    ones = (1 << lanes) - 1
+    p, c = int.from_bytes(plain, 'big'), int.from_bytes(cipher, 'big')
+    plain_planes = [ones if p >> (63 - i) & 1 else 0 for i in range(64)]
+    cipher_planes = [ones if c >> (63 - i) & 1 else 0 for i in range(64)]
+
+    candidates = iter(keys)
+    while True:
+        batch = list(islice(candidates, lanes))
+        if not batch:
+            return None
+        data = b''.join(batch)
+        if len(data) != 8 * len(batch):
+            raise ValueError('invalid key length')
+        round_keys = DES.bitslice_key_planes(DES.to_planes(data, lanes))
+        out = DES.bitslice_crypt(plain_planes, round_keys, ones)
+        mismatch = 0
+        for x, y in zip(out, cipher_planes):
+            mismatch |= x ^ y
+        found = ~mismatch & ((1 << len(batch)) - 1)
+        if found:
+            return batch[(found & -found).bit_length() - 1]
@@ -1,6 +1,13 @@
 from __future__ import annotations
 from functools import lru_cache
-from typing import List, Tuple, TYPE_CHECKING
+from operator import itemgetter
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
 
 from cryptolib.util.binary import xor_bytes
 from cryptolib.cipher._block_cipher import create_cipher
@@ -11,56 +18,62 @@ from cryptolib.cipher._block_common import (
     MODE_OFB,
     MODE_CFB,
     MODE_CTR,
+    MODE_GCM,
+    MODE_XTS,
 )
 
 
 if TYPE_CHECKING:
-    from cryptolib.cipher._block_common import BlockCipherMode
+    from cryptolib.cipher._block_common import BlockCipherMode, Buffer
 
 
 class ByteMatrix:
+    """
+
+    AES state as a flat bytearray in column-major order, the order of the
+    input bytes: row r of column c is state[c * size + r]. Indexing keeps
+    the old (column, row) convention, e.g. st[:, r] is row r.
+    """
+    __slots__ = ('size', 'state')
+
     def __init__(self, data: bytes, size=4) -> None:
         assert(size ** 2 == len(data))
 
         self.size = size
-        self.matrix = []
-        for j in range(size):
-            row = []
-            for i in range(size):
-                row.append(data[i*size+j])
-            self.matrix.append(row)
+        self.state = bytearray(data)
 
     def pprint(self) -> None:
         for j in range(self.size):
             for i in range(self.size):
-                print("%02x " % self.matrix[j][i], end="")
+                print("%02x " % self.state[i*self.size+j], end="")
             print()
         print()
 
     def at(self, x: int, y: int) -> int:
-        return self.matrix[y][x]
+        return self.state[x*self.size+y]
 
     def bytes(self) -> bytes:
-        rslt = [0] * pow(self.size, 2)
-        for j in range(self.size):
-            for i in range(self.size):
-                rslt[i*self.size+j] = self.matrix[j][i]
-        return bytes(rslt)
+        return bytes(self.state)
+
+    def _indices(self, key) -> List[int]:
+        col, row = key
+        cols = range(self.size)[col] if isinstance(col, slice) else [col]
+        rows = range(self.size)[row] if isinstance(row, slice) else [row]
+        return [c * self.size + r for r in rows for c in cols]
 
     def __setitem__(self, key, value):
-        row, col = key
-        if isinstance(col, slice):
-            for idx, r in enumerate(self.matrix[col]):
-                r[row] = value[idx]
+        col, row = key
+        if isinstance(col, slice) or isinstance(row, slice):
+            for idx, v in zip(self._indices(key), value):
+                self.state[idx] = v
         else:
-            self.matrix[col][row] = value
+            self.state[col*self.size+row] = value
 
     def __getitem__(self, item):
-        row, col = item
-        if isinstance(col, int):
-            return self.matrix[col][row]
-        elif isinstance(col, slice):
-            return [c[row] for c in self.matrix[col]]
+        col, row = item
+        if isinstance(col, slice) or isinstance(row, slice):
+            return [self.state[idx] for idx in self._indices(item)]
+        return self.state[col*self.size+row]
 
     @classmethod
     def from_words(cls, words, size=4):
@@ -156,6 +169,37 @@ INV_SBOX = [
 ]
 
 
+def _rotr8(w: int) -> int:
+    return ((w >> 8) | (w << 24)) & 0xffffffff
+
+
+def _gen_enc_tables() -> Tuple[List[int], ...]:
+    te0 = []
+    for s in SBOX:
+        te0.append(poly_mul(s, 2) << 24 | s << 16 | s << 8 | poly_mul(s, 3))
+    te1 = [_rotr8(w) for w in te0]
+    te2 = [_rotr8(w) for w in te1]
+    te3 = [_rotr8(w) for w in te2]
+    return te0, te1, te2, te3
+
+
+def _gen_dec_tables() -> Tuple[List[int], ...]:
+    td0 = []
+    for s in INV_SBOX:
+        td0.append(
+            poly_mul(s, 14) << 24 | poly_mul(s, 9) << 16 | poly_mul(s, 13) << 8 | poly_mul(s, 11)
+        )
+    td1 = [_rotr8(w) for w in td0]
+    td2 = [_rotr8(w) for w in td1]
+    td3 = [_rotr8(w) for w in td2]
+    return td0, td1, td2, td3
+
+
+# T-tables: SubBytes, ShiftRows and MixColumns folded into four 32-bit lookups per column
+TE0, TE1, TE2, TE3 = _gen_enc_tables()
+TD0, TD1, TD2, TD3 = _gen_dec_tables()
+
+
 def sub_word(b_array: bytes) -> bytes:
     return bytes([SBOX[(b >> 4) * 16 + (b & 0xf)] for b in b_array])
 
@@ -164,55 +208,61 @@ def rot_word(b: bytes) -> bytes:
     return b[1:] + b[:1]
 
 
+# ShiftRows as a gather over the column-major state: byte r + 4c <- r + 4(c + r)
+SHIFT_ROWS_PERM = [r + 4 * ((c + r) % 4) for c in range(4) for r in range(4)]
+INV_SHIFT_ROWS_PERM = [r + 4 * ((c - r) % 4) for c in range(4) for r in range(4)]
+# rotations inside each column: byte r + 4c <- (r + k) % 4 + 4c
+COLUMN_ROT_PERMS = [[(r + k) % 4 + 4 * c for c in range(4) for r in range(4)] for k in range(4)]
+
+_shift_rows = itemgetter(*SHIFT_ROWS_PERM)
+_inv_shift_rows = itemgetter(*INV_SHIFT_ROWS_PERM)
+_rot1, _rot2, _rot3 = (itemgetter(*perm) for perm in COLUMN_ROT_PERMS[1:])
+
+SBOX_BYTES = bytes(SBOX)
+INV_SBOX_BYTES = bytes(INV_SBOX)
+MUL2, MUL3, MUL9, MUL11, MUL13, MUL14 = (
+    bytes(poly_mul(x, k) for x in range(256)) for k in (2, 3, 9, 11, 13, 14)
+)
+
+
 def add_round_key(st: ByteMatrix, key: ByteMatrix):
-    for j in range(4):
-        for i in range(4):
-            st[i, j] = st.at(i, j) ^ key.at(i, j)
+    s, k = st.state, key.state
+    for i in range(len(s)):
+        s[i] ^= k[i]
 
 
 def mix_columns(st: ByteMatrix):
-    for j in range(4):
-        c0, c1 = st.at(j, 0), st.at(j, 1)
-        c2, c3 = st.at(j, 2), st.at(j, 3)
-        st[j, 0] = poly_mul(2, c0) ^ poly_mul(3, c1) ^ c2 ^ c3
-        st[j, 1] = c0 ^ poly_mul(2, c1) ^ poly_mul(3, c2) ^ c3
-        st[j, 2] = c0 ^ c1 ^ poly_mul(2, c2) ^ poly_mul(3, c3)
-        st[j, 3] = poly_mul(3, c0) ^ c1 ^ c2 ^ poly_mul(2, c3)
+    s = st.state
+    s[:] = bytes(
+        MUL2[a0] ^ MUL3[a1] ^ a2 ^ a3
+        for a0, a1, a2, a3 in zip(s, _rot1(s), _rot2(s), _rot3(s))
+    )
 
 
 def shift_rows(st: ByteMatrix):
-    for i in range(4):
-        st[:, i] = st[i:, i] + st[:i, i]
+    st.state[:] = bytes(_shift_rows(st.state))
 
 
 def sub_bytes(st: ByteMatrix):
-    for j in range(4):
-        for i in range(4):
-            st[i, j] = SBOX[(st.at(i, j) >> 4) * 16 + (st.at(i, j) & 0xf)]
+    st.state[:] = st.state.translate(SBOX_BYTES)
 
 
 def inv_sub_bytes(st: ByteMatrix):
-    for j in range(4):
-        for i in range(4):
-            st[i, j] = INV_SBOX[(st.at(i, j) >> 4) * 16 + (st.at(i, j) & 0xf)]
+    st.state[:] = st.state.translate(INV_SBOX_BYTES)
 
 
 def inv_shift_rows(st: ByteMatrix):
-    for i in range(4):
-        st[:, i] = st[-i:, i] + st[:-i, i]
+    st.state[:] = bytes(_inv_shift_rows(st.state))
 
 
 def inv_mix_columns(st: ByteMatrix):
-    for j in range(4):
-        c0, c1 = st.at(j, 0), st.at(j, 1)
-        c2, c3 = st.at(j, 2), st.at(j, 3)
-        st[j, 0] = poly_mul(14, c0) ^ poly_mul(11, c1) ^ poly_mul(13, c2) ^ poly_mul(9, c3)
-        st[j, 1] = poly_mul(9, c0) ^ poly_mul(14, c1) ^ poly_mul(11, c2) ^ poly_mul(13, c3)
-        st[j, 2] = poly_mul(13, c0) ^ poly_mul(9, c1) ^ poly_mul(14, c2) ^ poly_mul(11, c3)
-        st[j, 3] = poly_mul(11, c0) ^ poly_mul(13, c1) ^ poly_mul(9, c2) ^ poly_mul(14, c3)
+    s = st.state
+    s[:] = bytes(
+        MUL14[a0] ^ MUL11[a1] ^ MUL13[a2] ^ MUL9[a3]
+        for a0, a1, a2, a3 in zip(s, _rot1(s), _rot2(s), _rot3(s))
+    )
 
 
-@lru_cache
 def subkey_gen(key: bytes, nr: int) -> List[ByteMatrix]:
     kw = len(key) // 4
     round_num = int(nr / (kw / 4))
@@ -235,68 +285,275 @@ def subkey_gen(key: bytes, nr: int) -> List[ByteMatrix]:
     return subkeys
 
 
-def _encrypt(plain: bytes, key: bytes, Nr: int) -> bytes:
-    subkeys = subkey_gen(key, Nr)
-    s = ByteMatrix(plain)
-    add_round_key(s, subkeys[0])
-
-    for i in range(1, Nr):
-        sub_bytes(s)
-        shift_rows(s)
-        mix_columns(s)
-        add_round_key(s, subkeys[i])
-
-    sub_bytes(s)
-    shift_rows(s)
-    add_round_key(s, subkeys[-1])
-    return s.bytes()
+def _sub_word32(w: int) -> int:
+    return (
+        SBOX[w >> 24] << 24 | SBOX[(w >> 16) & 0xff] << 16
+        | SBOX[(w >> 8) & 0xff] << 8 | SBOX[w & 0xff]
+    )
 
 
-def _decrypt(plain: bytes, key: bytes, Nr: int) -> bytes:
-    subkeys = [*reversed(subkey_gen(key, Nr))]
-    s = ByteMatrix(plain)
+def key_expansion(key: bytes, nr: int) -> List[int]:
+    """
+
+    AES key expansion on 32-bit words (FIPS-197 5.2)
+
+    Args:
+        key (bytes): cipher key
+        nr (int): number of rounds
+
+    Returns:
+        List[int]: 4 * (nr + 1) round key words
+    """
+    nk = len(key) // 4
+    w = [int.from_bytes(key[i:i+4], 'big') for i in range(0, len(key), 4)]
+    rcon = 1
+    for i in range(nk, 4 * (nr + 1)):
+        temp = w[i - 1]
+        if i % nk == 0:
+            temp = _sub_word32(((temp << 8) | (temp >> 24)) & 0xffffffff) ^ (rcon << 24)
+            rcon = poly_mul(rcon, 2)
+        elif nk > 6 and i % nk == 4:
+            temp = _sub_word32(temp)
+        w.append(w[i - nk] ^ temp)
+    return w
+
+
+def inv_key_expansion(w: List[int], nr: int) -> List[int]:
+    """
+
+    round keys for the equivalent inverse cipher (FIPS-197 5.3.5)
+
+    Args:
+        w (List[int]): round key words from key_expansion
+        nr (int): number of rounds
+
+    Returns:
+        List[int]: 4 * (nr + 1) round key words in decryption order
+    """
+    dw = []
+    for r in range(nr, -1, -1):
+        for k in w[4*r:4*r+4]:
+            if 0 < r < nr:
+                k = (
+                    TD0[SBOX[k >> 24]] ^ TD1[SBOX[(k >> 16) & 0xff]]
+                    ^ TD2[SBOX[(k >> 8) & 0xff]] ^ TD3[SBOX[k & 0xff]]
+                )
+            dw.append(k)
+    return dw
+
+
+def _encrypt_block(plain: bytes, rk: Sequence[int], Nr: int) -> bytes:
+    s0, s1, s2, s3 = struct.unpack('>4I', plain)
+    s0 ^= rk[0]
+    s1 ^= rk[1]
+    s2 ^= rk[2]
+    s3 ^= rk[3]
+
+    for k in range(4, 4 * Nr, 4):
+        s0, s1, s2, s3 = (
+            TE0[s0 >> 24] ^ TE1[(s1 >> 16) & 0xff] ^ TE2[(s2 >> 8) & 0xff] ^ TE3[s3 & 0xff] ^ rk[k],
+            TE0[s1 >> 24] ^ TE1[(s2 >> 16) & 0xff] ^ TE2[(s3 >> 8) & 0xff] ^ TE3[s0 & 0xff] ^ rk[k+1],
+            TE0[s2 >> 24] ^ TE1[(s3 >> 16) & 0xff] ^ TE2[(s0 >> 8) & 0xff] ^ TE3[s1 & 0xff] ^ rk[k+2],
+            TE0[s3 >> 24] ^ TE1[(s0 >> 16) & 0xff] ^ TE2[(s1 >> 8) & 0xff] ^ TE3[s2 & 0xff] ^ rk[k+3],
+        )
+
+    k = 4 * Nr
+    return struct.pack(
+        '>4I',
+        (SBOX[s0 >> 24] << 24 | SBOX[(s1 >> 16) & 0xff] << 16
+         | SBOX[(s2 >> 8) & 0xff] << 8 | SBOX[s3 & 0xff]) ^ rk[k],
+        (SBOX[s1 >> 24] << 24 | SBOX[(s2 >> 16) & 0xff] << 16
+         | SBOX[(s3 >> 8) & 0xff] << 8 | SBOX[s0 & 0xff]) ^ rk[k+1],
+        (SBOX[s2 >> 24] << 24 | SBOX[(s3 >> 16) & 0xff] << 16
+         | SBOX[(s0 >> 8) & 0xff] << 8 | SBOX[s1 & 0xff]) ^ rk[k+2],
+        (SBOX[s3 >> 24] << 24 | SBOX[(s0 >> 16) & 0xff] << 16
+         | SBOX[(s1 >> 8) & 0xff] << 8 | SBOX[s2 & 0xff]) ^ rk[k+3],
+    )
 
-    for i in range(Nr):
-        add_round_key(s, subkeys[i])
-        if i:
-            inv_mix_columns(s)
-        inv_shift_rows(s)
-        inv_sub_bytes(s)
 
-    add_round_key(s, subkeys[-1])
-    return s.bytes()
+def _decrypt_block(cipher: bytes, dk: Sequence[int], Nr: int) -> bytes:
+    s0, s1, s2, s3 = struct.unpack('>4I', cipher)
+    s0 ^= dk[0]
+    s1 ^= dk[1]
+    s2 ^= dk[2]
+    s3 ^= dk[3]
+
+    for k in range(4, 4 * Nr, 4):
+        s0, s1, s2, s3 = (
+            TD0[s0 >> 24] ^ TD1[(s3 >> 16) & 0xff] ^ TD2[(s2 >> 8) & 0xff] ^ TD3[s1 & 0xff] ^ dk[k],
+            TD0[s1 >> 24] ^ TD1[(s0 >> 16) & 0xff] ^ TD2[(s3 >> 8) & 0xff] ^ TD3[s2 & 0xff] ^ dk[k+1],
+            TD0[s2 >> 24] ^ TD1[(s1 >> 16) & 0xff] ^ TD2[(s0 >> 8) & 0xff] ^ TD3[s3 & 0xff] ^ dk[k+2],
+            TD0[s3 >> 24] ^ TD1[(s2 >> 16) & 0xff] ^ TD2[(s1 >> 8) & 0xff] ^ TD3[s0 & 0xff] ^ dk[k+3],
+        )
+
+    k = 4 * Nr
+    return struct.pack(
+        '>4I',
+        (INV_SBOX[s0 >> 24] << 24 | INV_SBOX[(s3 >> 16) & 0xff] << 16
+         | INV_SBOX[(s2 >> 8) & 0xff] << 8 | INV_SBOX[s1 & 0xff]) ^ dk[k],
+        (INV_SBOX[s1 >> 24] << 24 | INV_SBOX[(s0 >> 16) & 0xff] << 16
+         | INV_SBOX[(s3 >> 8) & 0xff] << 8 | INV_SBOX[s2 & 0xff]) ^ dk[k+1],
+        (INV_SBOX[s2 >> 24] << 24 | INV_SBOX[(s1 >> 16) & 0xff] << 16
+         | INV_SBOX[(s0 >> 8) & 0xff] << 8 | INV_SBOX[s3 & 0xff]) ^ dk[k+2],
+        (INV_SBOX[s3 >> 24] << 24 | INV_SBOX[(s2 >> 16) & 0xff] << 16
+         | INV_SBOX[(s1 >> 8) & 0xff] << 8 | INV_SBOX[s0 & 0xff]) ^ dk[k+3],
+    )
 
 
-def encrypt(plain: bytes, key: bytes) -> bytes:
+def rounds_for_key(key: bytes) -> int:
     key_length = len(key)
     if key_length == 16:
-        Nr = 10
+        return 10
     elif key_length == 24:
-        Nr = 12
+        return 12
     elif key_length == 32:
-        Nr = 14
-    else:
-        raise ValueError('invalid key length')
-    return _encrypt(plain, key, Nr)
+        return 14
+    raise ValueError('invalid key length')
+
+
+# blocks from which encrypt_blocks/decrypt_blocks switch to the numpy engine
+NUMPY_MIN_BLOCKS = 32
+
+if np is not None:
+    NP_SBOX = np.array(SBOX, dtype=np.uint8)
+    NP_INV_SBOX = np.array(INV_SBOX, dtype=np.uint8)
+    NP_XTIME = np.array([poly_mul(x, 2) for x in range(256)], dtype=np.uint8)
+
+
+def _np_mix_columns(s: np.ndarray) -> np.ndarray:
+    a = s.reshape(-1, 4, 4)
+    a0, a1, a2, a3 = a[:, :, 0], a[:, :, 1], a[:, :, 2], a[:, :, 3]
+    t = a0 ^ a1 ^ a2 ^ a3
+    out = np.empty_like(a)
+    out[:, :, 0] = a0 ^ t ^ NP_XTIME[a0 ^ a1]
+    out[:, :, 1] = a1 ^ t ^ NP_XTIME[a1 ^ a2]
+    out[:, :, 2] = a2 ^ t ^ NP_XTIME[a2 ^ a3]
+    out[:, :, 3] = a3 ^ t ^ NP_XTIME[a3 ^ a0]
+    return out.reshape(-1, 16)
+
+
+def _np_inv_mix_columns(s: np.ndarray) -> np.ndarray:
+    # InvMixColumns = MixColumns after folding 4*(a0 ^ a2) / 4*(a1 ^ a3) into the column
+    a = s.reshape(-1, 4, 4).copy()
+    u = NP_XTIME[NP_XTIME[a[:, :, 0] ^ a[:, :, 2]]]
+    v = NP_XTIME[NP_XTIME[a[:, :, 1] ^ a[:, :, 3]]]
+    a[:, :, 0] ^= u
+    a[:, :, 1] ^= v
+    a[:, :, 2] ^= u
+    a[:, :, 3] ^= v
+    return _np_mix_columns(a)
+
+
+def encrypt_array(blocks: np.ndarray, round_keys: np.ndarray, Nr: int) -> np.ndarray:
+    """
+
+    encrypt N blocks at once with numpy
+
+    Args:
+        blocks (np.ndarray): (N, 16) uint8 array
+        round_keys (np.ndarray): (Nr + 1, 16) uint8 array
+        Nr (int): number of rounds
+
+    Returns:
+        np.ndarray: (N, 16) uint8 array
+    """
+    s = blocks ^ round_keys[0]
+    for r in range(1, Nr):
+        s = _np_mix_columns(NP_SBOX[s[:, SHIFT_ROWS_PERM]])
+        s ^= round_keys[r]
+    s = NP_SBOX[s[:, SHIFT_ROWS_PERM]]
+    s ^= round_keys[Nr]
+    return s
+
+
+def decrypt_array(blocks: np.ndarray, round_keys: np.ndarray, Nr: int) -> np.ndarray:
+    s = blocks ^ round_keys[Nr]
+    for r in range(Nr - 1, 0, -1):
+        s = NP_INV_SBOX[s[:, INV_SHIFT_ROWS_PERM]]
+        s ^= round_keys[r]
+        s = _np_inv_mix_columns(s)
+    s = NP_INV_SBOX[s[:, INV_SHIFT_ROWS_PERM]]
+    s ^= round_keys[0]
+    return s
+
+
+class AESAlgo(BlockCipherAlgo):
+    """
+
+    AES bound to one key; the round keys are expanded once per instance
+
+    Args:
+        key (bytes): 16, 24 or 32 bytes key
+    """
+    __slots__ = ('nr', '_rk', '_dk', '_rk_array')
+    block_size = 16
+
+    def __init__(self, key: bytes) -> None:
+        self.nr = rounds_for_key(key)
+        rk = key_expansion(key, self.nr)
+        self._rk = tuple(rk)
+        self._dk = tuple(inv_key_expansion(rk, self.nr))
+        self._rk_array = None
+
+    def encrypt_block(self, block: bytes) -> bytes:
+        return _encrypt_block(block, self._rk, self.nr)
+
+    def decrypt_block(self, block: bytes) -> bytes:
+        return _decrypt_block(block, self._dk, self.nr)
+
+    def _round_key_array(self) -> np.ndarray:
+        if self._rk_array is None:
+            packed = struct.pack('>%dI' % len(self._rk), *self._rk)
+            self._rk_array = np.frombuffer(packed, dtype=np.uint8).reshape(-1, 16)
+        return self._rk_array
+
+    def encrypt_array(self, blocks: np.ndarray) -> np.ndarray:
+        """
+
+        encrypt an (N, 16) uint8 array of blocks (requires numpy)
+        """
+        return encrypt_array(blocks, self._round_key_array(), self.nr)
+
+    def decrypt_array(self, blocks: np.ndarray) -> np.ndarray:
+        return decrypt_array(blocks, self._round_key_array(), self.nr)
+
+    def encrypt_blocks(self, data: Buffer) -> bytes:
+        if np is None or len(data) < NUMPY_MIN_BLOCKS * self.block_size:
+            return super().encrypt_blocks(data)
+        blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, self.block_size)
+        return self.encrypt_array(blocks).tobytes()
+
+    def decrypt_blocks(self, data: Buffer) -> bytes:
+        if np is None or len(data) < NUMPY_MIN_BLOCKS * self.block_size:
+            return super().decrypt_blocks(data)
+        blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, self.block_size)
+        return self.decrypt_array(blocks).tobytes()
+
+
+def encrypt(plain: bytes, key: bytes) -> bytes:
+    return AESAlgo(key).encrypt_block(plain)
 
 
 def decrypt(plain: bytes, key: bytes) -> bytes:
-    key_length = len(key)
-    if key_length == 16:
-        Nr = 10
-    elif key_length == 24:
-        Nr = 12
-    elif key_length == 32:
-        Nr = 14
-    else:
-        raise ValueError('invalid key length')
-    return _decrypt(plain, key, Nr)
+    return AESAlgo(key).decrypt_block(plain)
 
 
-def new(key: bytes, mode: int, iv: bytes = None) -> BlockCipherMode:
-    AES_algo = BlockCipherAlgo(
-        16,
-        encrypt,
-        decrypt,
-    )
-    return create_cipher(key, AES_algo, mode, iv)
+def new(key: bytes, mode: int, iv: bytes = None, workers: Optional[int] = None,
+        segment_size: Optional[int] = None, padding: Optional[str] = None) -> BlockCipherMode:
+    """
+
+    create AES cipher object
+
+    Args:
+        key (bytes): cipher key
+        mode (int): MODE_ECB, MODE_CBC, MODE_OFB, MODE_CFB, MODE_CTR, MODE_GCM or MODE_XTS
+        iv (bytes, optional): IV, initial counter block in CTR mode, nonce in GCM mode
+            or tweak in XTS mode (the key is then two AES keys)
+        workers (int, optional): processes used for CTR/GCM keystream and CBC/CFB decryption
+        segment_size (int, optional): CFB segment size in bits (default 8)
+        padding (str, optional): 'pkcs7', 'iso10126' or 'zero' in ECB and CBC mode
+
+    Returns:
+        BlockCipherMode
+    """
+    return create_cipher(key, AESAlgo, mode, iv, workers, segment_size, padding)
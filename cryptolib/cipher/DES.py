@@ -1,8 +1,8 @@
 from __future__ import annotations
-from typing import List, Tuple, TYPE_CHECKING
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
 import struct
 
-from cryptolib.util.binary import long2bytes, bytes2long
+from cryptolib.util.binary import bytes2long
 from cryptolib.cipher._block_cipher import create_cipher
 from cryptolib.cipher._block_common import (
     BlockCipherAlgo,
@@ -15,7 +15,7 @@ from cryptolib.cipher._block_common import (
 
 
 if TYPE_CHECKING:
-    from cryptolib.cipher._block_common import BlockCipherMode
+    from cryptolib.cipher._block_common import BlockCipherMode, Buffer
 
 
 IP = [
@@ -159,14 +159,66 @@ def shift_right(x, size):
     return (x >> size) | (x << (28 - size) & 0xfffffff)
 
 
+def permute_tables(table: List[int], size: int) -> List[List[int]]:
+    """
+
+    byte-indexed lookup tables for permute(table, size, x): the result
+    is the OR of tables[j][byte j of x] over the size // 8 bytes of x
+
+    Args:
+        table (List[int]): permutation table (1 origin, MSB first)
+        size (int): input size in bits, a multiple of 8
+
+    Returns:
+        List[List[int]]
+    """
+    single = [permute(table, size, 1 << (size - 1 - b)) for b in range(size)]
+    tables = []
+    for j in range(size // 8):
+        t = [0] * 256
+        for v in range(1, 256):
+            low = v & -v
+            t[v] = t[v ^ low] | single[8 * j + 8 - low.bit_length()]
+        tables.append(t)
+    return tables
+
+
+def sp_tables() -> List[List[int]]:
+    # S-box i followed by P: 6-bit group -> its contribution to the 32-bit round output
+    tables = []
+    for i, box in enumerate(SBOX):
+        t = []
+        for group in range(64):
+            y = box[(group & 0b100000) >> 4 | (group & 1)][(group & 0b011110) >> 1]
+            t.append(permute(P, 32, y << (28 - 4 * i)))
+        tables.append(t)
+    return tables
+
+
+IP_TABLES = permute_tables(IP, 64)
+INV_IP_TABLES = permute_tables(INV_IP, 64)
+PC1_TABLES = permute_tables(PC1, 64)
+PC2_TABLES = permute_tables(PC2, 56)
+E_TABLES = permute_tables(E, 32)
+SP_TABLES = sp_tables()
+
+
 def subkey_gen(key: int) -> List[int]:
     subkeys = []
-    reduce_key = permute(PC1, 64, key)
+    p0, p1, p2, p3, p4, p5, p6, p7 = PC1_TABLES
+    q0, q1, q2, q3, q4, q5, q6 = PC2_TABLES
+    reduce_key = (
+        p0[key >> 56] | p1[(key >> 48) & 0xff] | p2[(key >> 40) & 0xff] | p3[(key >> 32) & 0xff]
+        | p4[(key >> 24) & 0xff] | p5[(key >> 16) & 0xff] | p6[(key >> 8) & 0xff] | p7[key & 0xff]
+    )
     Ci, Di = split(reduce_key, 28)
     for i in range(16):
-        Ci, Di = map(lambda x: shift_left(x, SHIFT_TABLE[i]), [Ci, Di])
-        subkey = permute(PC2, 56, merge(Ci, Di, 28))
-        subkeys.append(subkey)
+        Ci, Di = shift_left(Ci, SHIFT_TABLE[i]), shift_left(Di, SHIFT_TABLE[i])
+        cd = merge(Ci, Di, 28)
+        subkeys.append(
+            q0[cd >> 48] | q1[(cd >> 40) & 0xff] | q2[(cd >> 32) & 0xff] | q3[(cd >> 24) & 0xff]
+            | q4[(cd >> 16) & 0xff] | q5[(cd >> 8) & 0xff] | q6[cd & 0xff]
+        )
     return subkeys
 
 
@@ -180,37 +232,247 @@ def merge(a: int, b: int, size: int) -> int:
 
 
 def round_f(x: int, sub_key: int) -> int:
-    _x = permute(E, 32, x)
-    _x ^= sub_key
-    y = 0
-    mask = 0xfc0000000000
+    e0, e1, e2, e3 = E_TABLES
+    s0, s1, s2, s3, s4, s5, s6, s7 = SP_TABLES
+    e = (e0[x >> 24] | e1[(x >> 16) & 0xff] | e2[(x >> 8) & 0xff] | e3[x & 0xff]) ^ sub_key
+    return (
+        s0[e >> 42] | s1[(e >> 36) & 0x3f] | s2[(e >> 30) & 0x3f] | s3[(e >> 24) & 0x3f]
+        | s4[(e >> 18) & 0x3f] | s5[(e >> 12) & 0x3f] | s6[(e >> 6) & 0x3f] | s7[e & 0x3f]
+    )
+
+
+def _crypt_block(block: bytes, sub_keys: Sequence[int]) -> bytes:
+    e0, e1, e2, e3 = E_TABLES
+    s0, s1, s2, s3, s4, s5, s6, s7 = SP_TABLES
+    t0, t1, t2, t3, t4, t5, t6, t7 = IP_TABLES
+    x = int.from_bytes(block, 'big')
+    x = (
+        t0[x >> 56] | t1[(x >> 48) & 0xff] | t2[(x >> 40) & 0xff] | t3[(x >> 32) & 0xff]
+        | t4[(x >> 24) & 0xff] | t5[(x >> 16) & 0xff] | t6[(x >> 8) & 0xff] | t7[x & 0xff]
+    )
+    L, R = x >> 32, x & 0xffffffff
+    # sub_keys may chain several DES stages (16 rounds each); the FP/IP pair
+    # between stages cancels out, leaving only the unswapped last round
+    for i in range(0, len(sub_keys), 16):
+        for k in sub_keys[i:i+16]:
+            e = (e0[R >> 24] | e1[(R >> 16) & 0xff] | e2[(R >> 8) & 0xff] | e3[R & 0xff]) ^ k
+            L, R = R, L ^ (
+                s0[e >> 42] | s1[(e >> 36) & 0x3f] | s2[(e >> 30) & 0x3f] | s3[(e >> 24) & 0x3f]
+                | s4[(e >> 18) & 0x3f] | s5[(e >> 12) & 0x3f] | s6[(e >> 6) & 0x3f] | s7[e & 0x3f]
+            )
+        L, R = R, L
+    x = L << 32 | R
+    t0, t1, t2, t3, t4, t5, t6, t7 = INV_IP_TABLES
+    x = (
+        t0[x >> 56] | t1[(x >> 48) & 0xff] | t2[(x >> 40) & 0xff] | t3[(x >> 32) & 0xff]
+        | t4[(x >> 24) & 0xff] | t5[(x >> 16) & 0xff] | t6[(x >> 8) & 0xff] | t7[x & 0xff]
+    )
+    return struct.pack('>Q', x)
+
+
+# Bitsliced DES: plane i holds bit i + 1 of every block, one block per bit
+# (lane) of a Python integer, so each boolean operation below runs the
+# whole batch at once. IP, E, P and the key schedule become renumbering
+# of planes; only the S-boxes cost real work.
+
+# blocks from which DESAlgo.encrypt_blocks/decrypt_blocks use the bitsliced engine
+BITSLICE_MIN_BLOCKS = 128
+# lanes per bitsliced pass for bulk encryption
+BITSLICE_LANES = 4096
+
+
+def _sbox_terms(box: List[List[int]], bit: int) -> List[Tuple[int, Tuple[int, ...], bool]]:
+    # output bit as OR over minterms of (b1, b2, b3) of ORs over minterms of (b4, b5, b6)
+    terms = []
+    for h in range(8):
+        lows = []
+        for lo in range(8):
+            x = h << 3 | lo
+            if box[(x >> 4) & 2 | x & 1][(x >> 1) & 0xf] & (8 >> bit):
+                lows.append(lo)
+        if len(lows) > 4:
+            terms.append((h, tuple(lo for lo in range(8) if lo not in lows), True))
+        elif lows:
+            terms.append((h, tuple(lows), False))
+    return terms
+
+
+SBOX_TERMS = [[_sbox_terms(box, bit) for bit in range(4)] for box in SBOX]
+
+
+def _key_schedule_bits() -> List[List[int]]:
+    # key bit (1 origin) feeding each bit of each round subkey
+    cd = PC1[:]
+    schedule = []
+    for shift in SHIFT_TABLE:
+        cd = cd[shift:28] + cd[:shift] + cd[28+shift:] + cd[28:28+shift]
+        schedule.append([cd[i - 1] for i in PC2])
+    return schedule
+
+
+KEY_SCHEDULE_BITS = _key_schedule_bits()
+
+# byte -> one bit of it moved to position `m`, for (un)transposing 8 lanes per byte
+_TO_PLANE = [[bytes(((v >> (7 - t)) & 1) << m for v in range(256)) for m in range(8)] for t in range(8)]
+_FROM_PLANE = [[bytes(((v >> m) & 1) << (7 - t) for v in range(256)) for t in range(8)] for m in range(8)]
+
+
+def _minterms3(a: int, b: int, c: int, ones: int) -> List[int]:
+    na, nb, nc = a ^ ones, b ^ ones, c ^ ones
+    ab = (na & nb, na & b, a & nb, a & b)
+    return [x & y for x in ab for y in (nc, c)]
+
+
+def _bitslice_sboxes(e: List[int], ones: int) -> List[int]:
+    y = []
     for i in range(8):
-        group = (_x & mask) >> (48 - (i + 1) * 6)
-        row = (group & 0b100000) >> 4 | (group & 1)
-        col = (group & 0b011110) >> 1
-        y |= SBOX[i][row][col]
-        y <<= 4
-        mask >>= 6
-    y >>= 4
-    return permute(P, 32, y)
+        hi = _minterms3(e[6*i], e[6*i+1], e[6*i+2], ones)
+        lo = _minterms3(e[6*i+3], e[6*i+4], e[6*i+5], ones)
+        for terms in SBOX_TERMS[i]:
+            acc = 0
+            for h, lows, invert in terms:
+                g = 0
+                for j in lows:
+                    g |= lo[j]
+                acc |= hi[h] & (g ^ ones if invert else g)
+            y.append(acc)
+    return y
+
+
+def to_planes(data: bytes, lanes: int) -> List[int]:
+    """
+
+    transpose blocks into 64 bit planes
+
+    Args:
+        data (bytes): up to `lanes` 8-byte blocks
+        lanes (int): number of lanes, a multiple of 8
+
+    Returns:
+        List[int]: plane i has bit i + 1 of block j at bit j
+    """
+    data = bytes(data).ljust(lanes * 8, b'\x00')
+    planes = []
+    for j in range(8):
+        columns = [data[j+8*m::64] for m in range(8)]
+        for t in range(8):
+            plane = 0
+            for m in range(8):
+                plane |= int.from_bytes(columns[m].translate(_TO_PLANE[t][m]), 'little')
+            planes.append(plane)
+    return planes
+
+
+def from_planes(planes: List[int], lanes: int) -> bytes:
+    """
+
+    transpose 64 bit planes back into `lanes` 8-byte blocks
+    """
+    size = lanes // 8
+    out = bytearray(lanes * 8)
+    for j in range(8):
+        rows = [planes[8*j+t].to_bytes(size, 'little') for t in range(8)]
+        for m in range(8):
+            column = 0
+            for t in range(8):
+                column |= int.from_bytes(rows[t].translate(_FROM_PLANE[m][t]), 'little')
+            out[j+8*m::64] = column.to_bytes(size, 'little')
+    return bytes(out)
+
+
+def bitslice_crypt(planes: List[int], round_keys: List[List[int]], ones: int) -> List[int]:
+    """
+
+    run DES on every lane of 64 bit planes
+
+    Args:
+        planes (List[int]): input block planes
+        round_keys (List[List[int]]): 48 subkey planes per round, in the order they are applied;
+            a multiple of 16 rounds chains DES stages without the inner FP/IP
+        ones (int): all lanes set
+
+    Returns:
+        List[int]: output block planes
+    """
+    lr = [planes[i - 1] for i in IP]
+    L, R = lr[:32], lr[32:]
+    for n, k in enumerate(round_keys, 1):
+        e = [R[E[i] - 1] ^ k[i] for i in range(48)]
+        y = _bitslice_sboxes(e, ones)
+        L, R = R, [L[i] ^ y[P[i] - 1] for i in range(32)]
+        if n % 16 == 0:
+            L, R = R, L
+    preoutput = L + R
+    return [preoutput[i - 1] for i in INV_IP]
+
+
+def bitslice_round_keys(sub_keys: Sequence[int], ones: int) -> List[List[int]]:
+    # subkeys shared by every lane become constant planes
+    return [[ones if sk >> (47 - i) & 1 else 0 for i in range(48)] for sk in sub_keys]
+
+
+def bitslice_key_planes(key_planes: List[int]) -> List[List[int]]:
+    # one key per lane: subkey planes are key planes picked by the key schedule
+    return [[key_planes[b - 1] for b in bits] for bits in KEY_SCHEDULE_BITS]
+
+
+def _bitslice_blocks(data: Buffer, sub_keys: Sequence[int]) -> bytes:
+    view = memoryview(data)
+    out = []
+    for i in range(0, len(view), BITSLICE_LANES * 8):
+        chunk = view[i:i+BITSLICE_LANES*8]
+        lanes = -(-len(chunk) // 64) * 8
+        ones = (1 << lanes) - 1
+        planes = bitslice_crypt(to_planes(chunk, lanes), bitslice_round_keys(sub_keys, ones), ones)
+        out.append(from_planes(planes, lanes)[:len(chunk)])
+    return b''.join(out)
+
+
+def check_key(key: bytes) -> None:
+    if len(key) != 8:
+        raise ValueError('invalid key length')
+
+
+class DESAlgo(BlockCipherAlgo):
+    """
+
+    DES bound to one key; the 16 subkeys are generated once per instance
+
+    Args:
+        key (bytes): 8 bytes key
+    """
+    __slots__ = ('_ek', '_dk')
+    block_size = 8
+
+    def __init__(self, key: bytes) -> None:
+        check_key(key)
+        self._ek = tuple(subkey_gen(bytes2long(key)))
+        self._dk = self._ek[::-1]
+
+    def encrypt_block(self, block: bytes) -> bytes:
+        return _crypt_block(block, self._ek)
+
+    def decrypt_block(self, block: bytes) -> bytes:
+        return _crypt_block(block, self._dk)
+
+    def encrypt_blocks(self, data: Buffer) -> bytes:
+        if len(data) < BITSLICE_MIN_BLOCKS * 8:
+            return super().encrypt_blocks(data)
+        return _bitslice_blocks(data, self._ek)
+
+    def decrypt_blocks(self, data: Buffer) -> bytes:
+        if len(data) < BITSLICE_MIN_BLOCKS * 8:
+            return super().decrypt_blocks(data)
+        return _bitslice_blocks(data, self._dk)
 
 
 def crypt(plain: bytes, key: bytes, process: int) -> bytes:
-    _plain, _key = map(bytes2long, [plain, key])
-    _plain = permute(IP, 64, _plain)
-    L, R = split(_plain, 32)
-    sub_keys = subkey_gen(_key)
-    for i in range(16):
-        if process == DES_ENC:
-            y = round_f(R, sub_keys[i])
-        elif process == DES_DEC:
-            y = round_f(R, sub_keys[15 - i])
-        if i != 15:
-            L, R = R, L ^ y
-        else:
-            L = L ^ y
-    result = permute(INV_IP, 64, merge(L, R, 32))
-    return struct.pack('>Q', result)
+    algo = DESAlgo(key)
+    if process == DES_ENC:
+        return algo.encrypt_block(plain)
+    elif process == DES_DEC:
+        return algo.decrypt_block(plain)
+    raise ValueError('invalid process')
 
 
 def encrypt(plain: bytes, key: bytes) -> bytes:
@@ -221,10 +483,21 @@ def decrypt(cipher: bytes, key: bytes) -> bytes:
     return crypt(cipher, key, DES_DEC)
 
 
-def new(key: bytes, mode: int, iv: bytes = None) -> BlockCipherMode:
-    DES_algo = BlockCipherAlgo(
-        8,
-        encrypt,
-        decrypt,
-    )
-    return create_cipher(key, DES_algo, mode, iv)
+def new(key: bytes, mode: int, iv: bytes = None, workers: Optional[int] = None,
+        segment_size: Optional[int] = None, padding: Optional[str] = None) -> BlockCipherMode:
+    """
+
+    create DES cipher object
+
+    Args:
+        key (bytes): cipher key
+        mode (int): MODE_ECB, MODE_CBC, MODE_OFB, MODE_CFB or MODE_CTR
+        iv (bytes, optional): IV, or initial counter block in CTR mode
+        workers (int, optional): processes used for CTR keystream and CBC/CFB decryption
+        segment_size (int, optional): CFB segment size in bits (default 8)
+        padding (str, optional): 'pkcs7', 'iso10126' or 'zero' in ECB and CBC mode
+
+    Returns:
+        BlockCipherMode
+    """
+    return create_cipher(key, DESAlgo, mode, iv, workers, segment_size, padding)
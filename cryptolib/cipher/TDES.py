@@ -0,0 +1,91 @@
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+
+from cryptolib.util.binary import bytes2long
+from cryptolib.cipher import DES
+from cryptolib.cipher._block_cipher import create_cipher
+from cryptolib.cipher._block_common import (
+    BlockCipherAlgo,
+    MODE_ECB,
+    MODE_CBC,
+    MODE_OFB,
+    MODE_CFB,
+    MODE_CTR,
+)
+
+
+if TYPE_CHECKING:
+    from cryptolib.cipher._block_common import BlockCipherMode, Buffer
+
+
+def check_key(key: bytes) -> None:
+    if len(key) not in (16, 24):
+        raise ValueError('invalid key length')
+
+
+class TDESAlgo(BlockCipherAlgo):
+    """
+
+    Triple-DES (EDE) bound to one key. A 16 bytes key is EDE2 (K1, K2, K1),
+    a 24 bytes key is EDE3 (K1, K2, K3). The 48 subkeys of the three stages
+    are generated once and run as one 48 round DES, skipping the FP/IP pairs
+    between stages.
+
+    Args:
+        key (bytes): 16 or 24 bytes key
+    """
+    __slots__ = ('_ek', '_dk')
+    block_size = 8
+
+    def __init__(self, key: bytes) -> None:
+        check_key(key)
+        k1, k2 = key[:8], key[8:16]
+        k3 = key[16:] or k1
+        ek1, ek2, ek3 = (tuple(DES.subkey_gen(bytes2long(k))) for k in (k1, k2, k3))
+        # E(K1) D(K2) E(K3); decryption runs the stages backwards
+        self._ek = ek1 + ek2[::-1] + ek3
+        self._dk = ek3[::-1] + ek2 + ek1[::-1]
+
+    def encrypt_block(self, block: bytes) -> bytes:
+        return DES._crypt_block(block, self._ek)
+
+    def decrypt_block(self, block: bytes) -> bytes:
+        return DES._crypt_block(block, self._dk)
+
+    def encrypt_blocks(self, data: Buffer) -> bytes:
+        if len(data) < DES.BITSLICE_MIN_BLOCKS * 8:
+            return super().encrypt_blocks(data)
+        return DES._bitslice_blocks(data, self._ek)
+
+    def decrypt_blocks(self, data: Buffer) -> bytes:
+        if len(data) < DES.BITSLICE_MIN_BLOCKS * 8:
+            return super().decrypt_blocks(data)
+        return DES._bitslice_blocks(data, self._dk)
+
+
+def encrypt(plain: bytes, key: bytes) -> bytes:
+    return TDESAlgo(key).encrypt_block(plain)
+
+
+def decrypt(cipher: bytes, key: bytes) -> bytes:
+    return TDESAlgo(key).decrypt_block(cipher)
+
+
+def new(key: bytes, mode: int, iv: bytes = None, workers: Optional[int] = None,
+        segment_size: Optional[int] = None, padding: Optional[str] = None) -> BlockCipherMode:
+    """
+
+    create Triple-DES cipher object
+
+    Args:
+        key (bytes): cipher key (16 bytes for EDE2, 24 bytes for EDE3)
+        mode (int): MODE_ECB, MODE_CBC, MODE_OFB, MODE_CFB or MODE_CTR
+        iv (bytes, optional): IV, or initial counter block in CTR mode
+        workers (int, optional): processes used for CTR keystream and CBC/CFB decryption
+        segment_size (int, optional): CFB segment size in bits (default 8)
+        padding (str, optional): 'pkcs7', 'iso10126' or 'zero' in ECB and CBC mode
+
+    Returns:
+        BlockCipherMode
+    """
+    return create_cipher(key, TDESAlgo, mode, iv, workers, segment_size, padding)
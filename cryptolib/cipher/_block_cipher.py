@@ -1,16 +1,20 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Optional, Type, TYPE_CHECKING
 from cryptolib.cipher._ecb import ECBMode
 from cryptolib.cipher._cbc import CBCMode
 from cryptolib.cipher._ofb import OFBMode
 from cryptolib.cipher._cfb import CFBMode
 from cryptolib.cipher._ctr import CTRMode
+from cryptolib.cipher._gcm import GCMMode
+from cryptolib.cipher._xts import XTSMode
 from cryptolib.cipher._block_common import (
     MODE_ECB,
     MODE_CBC,
     MODE_OFB,
     MODE_CFB,
     MODE_CTR,
+    MODE_GCM,
+    MODE_XTS,
 )
 
 
@@ -18,16 +22,48 @@ if TYPE_CHECKING:
     from cryptolib.cipher._block_common import BlockCipherAlgo, BlockCipherMode
 
 
-def create_cipher(key: bytes, algo: BlockCipherAlgo, mode: int, iv: bytes = None) -> BlockCipherMode:
+# modes that accept each optional argument of create_cipher
+OPTION_MODES = {
+    'segment_size': ((MODE_CFB,), 'CFB mode'),
+    'padding': ((MODE_ECB, MODE_CBC), 'ECB and CBC mode'),
+    'workers': ((MODE_CBC, MODE_CFB, MODE_CTR, MODE_GCM), 'CBC, CFB, CTR and GCM mode'),
+}
+
+
+def _check_options(mode: int, **options: object) -> None:
+    for name, value in options.items():
+        modes, supported = OPTION_MODES[name]
+        if value is not None and mode not in modes:
+            raise ValueError(f'{name} is only supported in {supported}')
+
+
+def _xts_mode(key: bytes, algo: Type[BlockCipherAlgo], iv: bytes) -> XTSMode:
+    # the key is the data key followed by the tweak key
+    if len(key) % 2:
+        raise ValueError('invalid key length')
+    half = len(key) // 2
+    return XTSMode(algo(key[:half]), algo(key[half:]), iv)
+
+
+def create_cipher(key: bytes, algo: Type[BlockCipherAlgo], mode: int, iv: bytes = None,
+                  workers: Optional[int] = None, segment_size: Optional[int] = None,
+                  padding: Optional[str] = None) -> BlockCipherMode:
+    if iv is None and mode == MODE_GCM:
+        raise ValueError('GCM mode requires a nonce')
     iv = b'\x00' * algo.block_size if iv is None else iv
+    _check_options(mode, segment_size=segment_size, padding=padding, workers=workers)
     if mode == MODE_ECB:
-        return ECBMode(key, algo)
+        return ECBMode(algo(key), padding)
     elif mode == MODE_CBC:
-        return CBCMode(key, algo, iv)
+        return CBCMode(algo(key), iv, workers, padding)
     elif mode == MODE_OFB:
-        return OFBMode(key, algo, iv)
+        return OFBMode(algo(key), iv)
     elif mode == MODE_CFB:
-        return CFBMode(key, algo, iv)
+        return CFBMode(algo(key), iv, 8 if segment_size is None else segment_size, workers)
     elif mode == MODE_CTR:
-        return CTRMode(key, algo, iv)
+        return CTRMode(algo(key), iv, workers)
+    elif mode == MODE_GCM:
+        return GCMMode(algo(key), iv, workers)
+    elif mode == MODE_XTS:
+        return _xts_mode(key, algo, iv)
     raise ValueError('Invalid mode')
@@ -1,8 +1,8 @@
-from typing import Callable, Iterator, NamedTuple
+from typing import Optional, Union
 from abc import ABCMeta, abstractmethod
 
-EncryptFunc = Callable[[bytes, bytes], bytes]
-DecryptFunc = Callable[[bytes, bytes], bytes]
+from cryptolib.cipher._parallel import WorkerPool
+from cryptolib.cipher._padding import PADDING_ZERO, pad, unpad_length
 
 
 MODE_ECB = 0
@@ -10,29 +10,329 @@ MODE_CBC = 1
 MODE_OFB = 2
 MODE_CFB = 3
 MODE_CTR = 4
+MODE_GCM = 5
+MODE_XTS = 6
 
 
-class BlockCipherAlgo(NamedTuple):
-    block_size: int
-    encrypt: EncryptFunc
-    decrypt: DecryptFunc
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class BlockCipherAlgo(metaclass=ABCMeta):
+    __slots__ = ()
+    block_size = 0
+
+    @abstractmethod
+    def __init__(self, key: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def encrypt_block(self, block: Buffer) -> bytes:
+        pass
+
+    @abstractmethod
+    def decrypt_block(self, block: Buffer) -> bytes:
+        pass
+
+    def encrypt_blocks(self, data: Buffer) -> bytes:
+        """
+
+        encrypt independent blocks (ECB over a whole buffer)
+
+        Args:
+            data (Buffer): a multiple of block_size bytes
+
+        Returns:
+            bytes
+        """
+        bs = self.block_size
+        encrypt_block = self.encrypt_block
+        view = memoryview(data)
+        return b''.join([encrypt_block(view[i:i+bs]) for i in range(0, len(view), bs)])
+
+    def decrypt_blocks(self, data: Buffer) -> bytes:
+        bs = self.block_size
+        decrypt_block = self.decrypt_block
+        view = memoryview(data)
+        return b''.join([decrypt_block(view[i:i+bs]) for i in range(0, len(view), bs)])
+
+
+class BlockCipherContext(metaclass=ABCMeta):
+    """
+
+    Incremental encryption/decryption state of a block cipher mode.
+    Input is buffered until a whole `unit` is available, so callers
+    may feed chunks of any size.
+    """
+    unit = 1
+    # padding scheme added on finalize; a context with `unpad` strips it instead
+    padding: Optional[str] = None
+    unpad = False
+
+    def __init__(self) -> None:
+        self._pending = bytearray()
+        self._finalized = False
+
+    def update_size(self, length: int) -> int:
+        total = len(self._pending) + length
+        if self.unpad:
+            # the last block is kept for finalize, which strips the padding
+            total -= 1
+        return max(0, total // self.unit * self.unit)
+
+    def finalize_size(self) -> int:
+        if self.padding is not None and not self.unpad:
+            return self.unit
+        return len(self._pending)
+
+    def update(self, data: Buffer) -> bytes:
+        """
+
+        process a chunk of data
+
+        Args:
+            data (Buffer): chunk
+
+        Returns:
+            bytes: output for every complete unit buffered so far
+        """
+        dst = bytearray(self.update_size(len(data)))
+        self.update_into(data, dst)
+        return bytes(dst)
+
+    def update_into(self, data: Buffer, dst: Buffer) -> int:
+        if self._finalized:
+            raise ValueError('context is already finalized')
+        src = input_view(data)
+        size = self.update_size(len(src))
+        out = output_view(dst, size)
+        pending = self._pending
+        if not size:
+            pending += src
+            return 0
+        pos, n = 0, 0
+        if pending:
+            pos = self.unit - len(pending)
+            pending += src[:pos]
+            self._process(bytes(pending), out[:self.unit])
+            pending.clear()
+            n = self.unit
+        end = pos + size - n
+        self._process(src[pos:end], out[n:size])
+        pending += src[end:]
+        return size
+
+    def finalize(self) -> bytes:
+        """
+
+        process the buffered tail and close the context
+
+        Returns:
+            bytes: remaining output
+        """
+        dst = bytearray(self.finalize_size())
+        n = self.finalize_into(dst)
+        return bytes(dst[:n])
+
+    def finalize_into(self, dst: Buffer) -> int:
+        if self._finalized:
+            raise ValueError('context is already finalized')
+        out = output_view(dst, self.finalize_size())
+        self._finalized = True
+        tail = bytes(self._pending)
+        self._pending.clear()
+        if self.padding is not None:
+            return self._finish_padding(tail, out)
+        return self._finish(tail, out)
+
+    @abstractmethod
+    def _process(self, src: memoryview, dst: memoryview) -> None:
+        pass
+
+    def _finish(self, tail: bytes, dst: memoryview) -> int:
+        if tail:
+            raise ValueError('data length is not a multiple of the block size')
+        return 0
+
+    def _finish_padding(self, tail: bytes, dst: memoryview) -> int:
+        bs = self.unit
+        if self.unpad:
+            if not tail and self.padding == PADDING_ZERO:
+                return 0
+            if len(tail) != bs:
+                raise ValueError('data length is not a multiple of the block size')
+            # unpad in the output buffer itself
+            self._process(memoryview(tail), dst[:bs])
+            return bs - unpad_length(dst[:bs], self.padding)
+        block = pad(tail, bs, self.padding)
+        if block:
+            self._process(memoryview(block), dst[:bs])
+        return len(block)
+
+
+class KeystreamContext(BlockCipherContext):
+    """
+
+    Context of a mode that XORs the data with a keystream (OFB, CTR).
+    Unused keystream bytes are carried over to the next update.
+    """
+    window = 1024
+
+    def __init__(self, block_size: int) -> None:
+        super().__init__()
+        self.block_size = block_size
+        self._ks = memoryview(b'')
+
+    @abstractmethod
+    def _keystream(self, nblocks: int) -> bytes:
+        pass
+
+    @abstractmethod
+    def _seek_block(self, index: int) -> None:
+        pass
+
+    def seek(self, offset: int) -> None:
+        """
+
+        move to a byte offset of the stream
+
+        Args:
+            offset (int): byte offset from the start of the message
+        """
+        if self._finalized:
+            raise ValueError('context is already finalized')
+        if offset < 0:
+            raise ValueError('offset must not be negative')
+        index, rem = divmod(offset, self.block_size)
+        self._seek_block(index)
+        self._ks = memoryview(b'')
+        if rem:
+            self._ks = memoryview(self._keystream(1))[rem:]
+
+    def _process(self, src: memoryview, dst: memoryview) -> None:
+        n = len(src)
+        pos = min(len(self._ks), n)
+        if pos:
+            xor_into(dst[:pos], src[:pos], self._ks[:pos])
+            self._ks = self._ks[pos:]
+        while pos < n:
+            nblocks = min(-(-(n - pos) // self.block_size), self.window)
+            ks = memoryview(self._keystream(nblocks))
+            k = min(len(ks), n - pos)
+            xor_into(dst[pos:pos+k], src[pos:pos+k], ks[:k])
+            self._ks = ks[k:]
+            pos += k
 
 
 class BlockCipherMode(metaclass=ABCMeta):
-    def __init__(self, key: bytes, cipher_algo: BlockCipherAlgo) -> None:
-        self.key = key
+    padding: Optional[str] = None
+
+    def __init__(self, cipher_algo: BlockCipherAlgo, workers: Optional[int] = None) -> None:
         self.cipher_algo = cipher_algo
+        self.pool = WorkerPool(workers) if workers and workers > 1 else None
+
+    def __getstate__(self) -> dict:
+        # a copy sent to another process runs serially there
+        state = self.__dict__.copy()
+        state['pool'] = None
+        return state
+
+    def close(self) -> None:
+        """
+
+        shut down the worker pool, if any
+        """
+        if self.pool is not None:
+            self.pool.close()
+
+    def __enter__(self) -> 'BlockCipherMode':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     @abstractmethod
-    def encrypt(self, plain: bytes) -> bytes:
+    def encryptor(self) -> BlockCipherContext:
         pass
 
     @abstractmethod
-    def decrypt(self, cipher: bytes) -> bytes:
+    def decryptor(self) -> BlockCipherContext:
         pass
 
+    def encrypt(self, plain: Buffer) -> bytes:
+        src = input_view(plain)
+        dst = bytearray(len(src) + (self.cipher_algo.block_size if self.padding is not None else 0))
+        n = self.encrypt_into(src, dst)
+        return bytes(dst[:n])
+
+    def decrypt(self, cipher: Buffer) -> bytes:
+        src = input_view(cipher)
+        dst = bytearray(len(src))
+        n = self.decrypt_into(src, dst)
+        return bytes(dst[:n])
+
+    def encrypt_into(self, plain: Buffer, dst: Buffer) -> int:
+        return crypt_into(self.encryptor(), plain, dst)
+
+    def decrypt_into(self, cipher: Buffer, dst: Buffer) -> int:
+        return crypt_into(self.decryptor(), cipher, dst)
+
+
+class KeystreamMode(BlockCipherMode):
+    """
+
+    Mode whose encryption and decryption are the same keystream XOR,
+    which allows processing a byte range without the data before it.
+    """
+
+    @abstractmethod
+    def encryptor(self) -> KeystreamContext:
+        pass
+
+    def decryptor(self) -> KeystreamContext:
+        return self.encryptor()
+
+    def decrypt_range(self, cipher: Buffer, offset: int) -> bytes:
+        """
+
+        decrypt a slice of the message
+
+        Args:
+            cipher (Buffer): ciphertext bytes starting at `offset`
+            offset (int): byte offset of `cipher` in the whole message
+
+        Returns:
+            bytes: plaintext of the same range
+        """
+        ctx = self.decryptor()
+        ctx.seek(offset)
+        return ctx.update(cipher) + ctx.finalize()
+
+    def encrypt_range(self, plain: Buffer, offset: int) -> bytes:
+        return self.decrypt_range(plain, offset)
+
+
+def crypt_into(ctx: BlockCipherContext, data: Buffer, dst: Buffer) -> int:
+    src = input_view(data)
+    out = output_view(dst, len(src))
+    n = ctx.update_into(src, out)
+    return n + ctx.finalize_into(out[n:])
+
+
+def input_view(data: Buffer) -> memoryview:
+    view = memoryview(data)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view
+
+
+def output_view(dst: Buffer, size: int) -> memoryview:
+    view = input_view(dst)
+    if view.readonly:
+        raise TypeError('output buffer is read-only')
+    if len(view) < size:
+        raise ValueError('output buffer is too small')
+    return view
+
 
-def split_block(data: bytes, cipher_algo: BlockCipherAlgo) -> Iterator[bytes]:
-    bs = cipher_algo.block_size
-    for i in range(0, len(data) // bs):
-        yield data[i*bs:i*bs+bs]
+def xor_into(dst: memoryview, a: Buffer, b: Buffer) -> None:
+    dst[:] = (int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')).to_bytes(len(dst), 'big')
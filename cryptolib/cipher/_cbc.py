@@ -1,32 +1,73 @@
 from __future__ import annotations
-from cryptolib.cipher._block_common import BlockCipherMode, split_block
-from cryptolib.util.binary import xor_bytes
-from typing import TYPE_CHECKING
+from cryptolib.cipher._block_common import BlockCipherMode, BlockCipherContext, xor_into
+from cryptolib.cipher._parallel import CHUNK_BLOCKS, decrypt_blocks
+from cryptolib.cipher._padding import check_padding
+from typing import Optional, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
     from cryptolib.cipher._block_common import BlockCipherAlgo
+    from cryptolib.cipher._parallel import WorkerPool
+
+
+class CBCEncryptContext(BlockCipherContext):
+    def __init__(self, cipher_algo: BlockCipherAlgo, iv: bytes, padding: Optional[str] = None) -> None:
+        super().__init__()
+        self.unit = cipher_algo.block_size
+        self.cipher_algo = cipher_algo
+        self.padding = padding
+        self._register = int.from_bytes(iv, 'big')
+
+    def _process(self, src: memoryview, dst: memoryview) -> None:
+        bs = self.unit
+        encrypt_block = self.cipher_algo.encrypt_block
+        tmp = self._register
+        for i in range(0, len(src), bs):
+            block = (int.from_bytes(src[i:i+bs], 'big') ^ tmp).to_bytes(bs, 'big')
+            enc = encrypt_block(block)
+            dst[i:i+bs] = enc
+            tmp = int.from_bytes(enc, 'big')
+        self._register = tmp
+
+
+class CBCDecryptContext(BlockCipherContext):
+    """
+
+    CBC decryption has no dependency between blocks: every ciphertext
+    window is decrypted as a batch (in `pool` if given) and then XORed
+    with the same window shifted back by one block.
+    """
+
+    def __init__(self, cipher_algo: BlockCipherAlgo, iv: bytes, pool: Optional[WorkerPool] = None,
+                 padding: Optional[str] = None) -> None:
+        super().__init__()
+        self.unit = cipher_algo.block_size
+        self.cipher_algo = cipher_algo
+        self.pool = pool
+        self.padding = padding
+        self.unpad = padding is not None
+        self.window = self.unit * CHUNK_BLOCKS * (pool.workers if pool is not None else 1)
+        self._register = bytes(iv)
+
+    def _process(self, src: memoryview, dst: memoryview) -> None:
+        bs = self.unit
+        for i in range(0, len(src), self.window):
+            block = src[i:i+self.window]
+            dec = decrypt_blocks(self.pool, self.cipher_algo, block)
+            xor_into(dst[i:i+len(block)], dec, self._register + block[:-bs])
+            self._register = bytes(block[-bs:])
 
 
 class CBCMode(BlockCipherMode):
-    def __init__(self, key: bytes, cipher_algo: BlockCipherAlgo, iv: bytes) -> None:
-        super().__init__(key, cipher_algo)
+    def __init__(self, cipher_algo: BlockCipherAlgo, iv: bytes, workers: Optional[int] = None,
+                 padding: Optional[str] = None) -> None:
+        check_padding(padding)
+        super().__init__(cipher_algo, workers)
         self.iv = iv
+        self.padding = padding
+
+    def encryptor(self) -> CBCEncryptContext:
+        return CBCEncryptContext(self.cipher_algo, self.iv, self.padding)
 
-    def encrypt(self, plain: bytes) -> bytes:
-        rslt = b''
-        tmp = self.iv
-        for block in split_block(plain, self.cipher_algo):
-            block = xor_bytes(block, tmp)
-            tmp = self.cipher_algo.encrypt(block, self.key)
-            rslt += tmp
-        return rslt
-
-    def decrypt(self, cipher: bytes) -> bytes:
-        rslt = b''
-        tmp = self.iv
-        for block in split_block(cipher, self.cipher_algo):
-            dec = self.cipher_algo.decrypt(block, self.key)
-            rslt += xor_bytes(tmp, dec)
-            tmp = block
-        return rslt
+    def decryptor(self) -> CBCDecryptContext:
+        return CBCDecryptContext(self.cipher_algo, self.iv, self.pool, self.padding)
@@ -1,32 +1,122 @@
 from __future__ import annotations
-from cryptolib.cipher._block_common import BlockCipherMode, split_block
-from cryptolib.util.binary import xor_bytes
-from typing import TYPE_CHECKING
+from cryptolib.cipher._block_common import BlockCipherMode, BlockCipherContext, xor_into
+from cryptolib.cipher._parallel import CHUNK_BLOCKS, encrypt_blocks
+from typing import Optional, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
     from cryptolib.cipher._block_common import BlockCipherAlgo
+    from cryptolib.cipher._parallel import WorkerPool
+
+
+# bytes of ciphertext history kept behind the shift register before it is rewound
+RING_SIZE = 4096
+
+
+class CFBEncryptContext(BlockCipherContext):
+    """
+
+    The shift register is the last block_size bytes of a fixed ring
+    buffer; each segment of ciphertext is appended in place and the
+    ring is rewound once it is full.
+    """
+
+    def __init__(self, cipher_algo: BlockCipherAlgo, iv: bytes, segment: int) -> None:
+        super().__init__()
+        bs = cipher_algo.block_size
+        self.unit = segment
+        self.cipher_algo = cipher_algo
+        self._ring = bytearray(bs + RING_SIZE)
+        self._ring[:bs] = iv
+        self._pos = bs
+
+    def _process(self, src: memoryview, dst: memoryview) -> None:
+        bs, s = self.cipher_algo.block_size, self.unit
+        encrypt_block = self.cipher_algo.encrypt_block
+        ring, pos = memoryview(self._ring), self._pos
+        for i in range(0, len(src), s):
+            if pos + s > len(ring):
+                ring[:bs] = ring[pos-bs:pos]
+                pos = bs
+            ks = encrypt_block(ring[pos-bs:pos])
+            if s == 1:
+                ring[pos] = dst[i] = src[i] ^ ks[0]
+            else:
+                xor_into(ring[pos:pos+s], src[i:i+s], ks[:s])
+                dst[i:i+s] = ring[pos:pos+s]
+            pos += s
+        self._pos = pos
+
+    def _finish(self, tail: bytes, dst: memoryview) -> int:
+        if tail:
+            ks = self.cipher_algo.encrypt_block(self._ring[self._pos-self.cipher_algo.block_size:self._pos])
+            xor_into(dst[:len(tail)], tail, ks[:len(tail)])
+        return len(tail)
+
+
+class CFBDecryptContext(BlockCipherContext):
+    """
+
+    Every CFB shift register during decryption is a window of the
+    ciphertext already at hand, so the registers of a whole chunk are
+    encrypted as one batch (in `pool` if given).
+    """
+
+    def __init__(self, cipher_algo: BlockCipherAlgo, iv: bytes, segment: int,
+                 pool: Optional[WorkerPool] = None) -> None:
+        super().__init__()
+        self.unit = segment
+        self.cipher_algo = cipher_algo
+        self.pool = pool
+        self.window = segment * CHUNK_BLOCKS * (pool.workers if pool is not None else 1)
+        self._register = bytes(iv)
+
+    def _process(self, src: memoryview, dst: memoryview) -> None:
+        bs, s = self.cipher_algo.block_size, self.unit
+        for i in range(0, len(src), self.window):
+            segment = src[i:i+self.window]
+            history = self._register + segment
+            if s == bs:
+                registers = history[:len(segment)]
+            else:
+                registers = b''.join([history[j:j+bs] for j in range(0, len(segment), s)])
+            keystream = encrypt_blocks(self.pool, self.cipher_algo, registers)
+            if s == 1:
+                keystream = keystream[::bs]
+            elif s != bs:
+                keystream = b''.join([keystream[j:j+s] for j in range(0, len(keystream), bs)])
+            xor_into(dst[i:i+len(segment)], segment, keystream)
+            self._register = history[-bs:]
+
+    def _finish(self, tail: bytes, dst: memoryview) -> int:
+        if tail:
+            ks = self.cipher_algo.encrypt_block(self._register)
+            xor_into(dst[:len(tail)], tail, ks[:len(tail)])
+        return len(tail)
 
 
 class CFBMode(BlockCipherMode):
-    def __init__(self, key: bytes, cipher_algo: BlockCipherAlgo, iv: bytes) -> None:
-        super().__init__(key, cipher_algo)
+    """
+
+    CFB mode
+
+    Args:
+        cipher_algo (BlockCipherAlgo): keyed block cipher
+        iv (bytes): initialization vector
+        segment_size (int): bits shifted into the register per step (CFB-8, CFB-64, CFB-128, ...)
+        workers (int, optional): processes used for decryption
+    """
+
+    def __init__(self, cipher_algo: BlockCipherAlgo, iv: bytes, segment_size: int = 8,
+                 workers: Optional[int] = None) -> None:
+        super().__init__(cipher_algo, workers)
+        if segment_size % 8 != 0 or not 8 <= segment_size <= cipher_algo.block_size * 8:
+            raise ValueError('invalid segment size')
         self.iv = iv
+        self.segment_size = segment_size
+
+    def encryptor(self) -> CFBEncryptContext:
+        return CFBEncryptContext(self.cipher_algo, self.iv, self.segment_size // 8)
 
-    def encrypt(self, plain: bytes) -> bytes:
-        rslt = b''
-        x = self.iv
-        for m in plain:
-            ci = bytes([m ^ self.cipher_algo.encrypt(x, self.key)[0]])
-            x = x[1:] + ci
-            rslt += ci
-        return rslt
-
-    def decrypt(self, cipher: bytes) -> bytes:
-        rslt = b''
-        x = self.iv
-        for c in cipher:
-            mi = bytes([c ^ self.cipher_algo.encrypt(x, self.key)[0]])
-            x = x[1:] + bytes([c])
-            rslt += mi
-        return rslt
+    def decryptor(self) -> CFBDecryptContext:
+        return CFBDecryptContext(self.cipher_algo, self.iv, self.segment_size // 8, self.pool)
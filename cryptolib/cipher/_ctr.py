@@ -1,34 +1,64 @@
 from __future__ import annotations
-from cryptolib.cipher._block_common import BlockCipherMode, split_block
-from typing import TYPE_CHECKING
-from cryptolib.util.binary import xor_bytes, bytes2long, long2bytes
+from cryptolib.cipher._block_common import KeystreamMode, KeystreamContext
+from cryptolib.cipher._parallel import CHUNK_BLOCKS, chunk_ranges
+from typing import Optional, TYPE_CHECKING
+from itertools import repeat
+from cryptolib.util.binary import bytes2long
 
 
 if TYPE_CHECKING:
     from cryptolib.cipher._block_common import BlockCipherAlgo
+    from cryptolib.cipher._parallel import WorkerPool
 
 
-class CTRMode(BlockCipherMode):
-    def __init__(self, key: bytes, cipher_algo: BlockCipherAlgo, nonce: bytes) -> None:
-        super().__init__(key, cipher_algo)
+def ctr_keystream(cipher_algo: BlockCipherAlgo, counter: int, nblocks: int,
+                  counter_bits: Optional[int] = None) -> bytes:
+    bs = cipher_algo.block_size
+    counter_max = pow(2, bs * 8 if counter_bits is None else counter_bits)
+    # only the low counter_bits of the block are incremented
+    prefix, low = counter - counter % counter_max, counter % counter_max
+    counters = b''.join([(prefix + c % counter_max).to_bytes(bs, 'big') for c in range(low, low + nblocks)])
+    return cipher_algo.encrypt_blocks(counters)
+
+
+class CTRContext(KeystreamContext):
+    def __init__(self, cipher_algo: BlockCipherAlgo, nonce: bytes, pool: Optional[WorkerPool] = None,
+                 counter_bits: Optional[int] = None) -> None:
+        super().__init__(cipher_algo.block_size)
+        self.cipher_algo = cipher_algo
+        self.pool = pool
+        self.counter_bits = counter_bits
+        self._initial = bytes2long(nonce)
+        self._counter = self._initial
+        self._counter_max = pow(2, self.block_size * 8 if counter_bits is None else counter_bits)
+        if pool is not None:
+            self.window = pool.workers * CHUNK_BLOCKS
+
+    def _advance(self, counter: int, n: int) -> int:
+        return counter - counter % self._counter_max + (counter + n) % self._counter_max
+
+    def _seek_block(self, index: int) -> None:
+        self._counter = self._advance(self._initial, index)
+
+    def _keystream(self, nblocks: int) -> bytes:
+        counter = self._counter
+        self._counter = self._advance(counter, nblocks)
+        if self.pool is None or nblocks < 2 * CHUNK_BLOCKS:
+            return ctr_keystream(self.cipher_algo, counter, nblocks, self.counter_bits)
+        chunks = chunk_ranges(nblocks)
+        return b''.join(self.pool.map(
+            ctr_keystream,
+            repeat(self.cipher_algo),
+            [self._advance(counter, r.start) for r in chunks],
+            [len(r) for r in chunks],
+            repeat(self.counter_bits),
+        ))
+
+
+class CTRMode(KeystreamMode):
+    def __init__(self, cipher_algo: BlockCipherAlgo, nonce: bytes, workers: Optional[int] = None) -> None:
+        super().__init__(cipher_algo, workers)
         self.nonce = nonce
 
-    def encrypt(self, plain: bytes) -> bytes:
-        bs = self.cipher_algo.block_size
-        rslt = b''
-        counter = bytes2long(self.nonce)
-        counter_max = pow(2, bs * 8)
-
-        for block in split_block(plain, self.cipher_algo):
-            ctr = self.cipher_algo.encrypt(counter.to_bytes(bs, "big"), self.key)
-            rslt += xor_bytes(ctr, block)
-            counter = (counter + 1) % counter_max
-
-        rem = len(plain) % bs
-        if rem != 0:
-            ctr = self.cipher_algo.encrypt(counter.to_bytes(bs, "big"), self.key)
-            rslt += xor_bytes(ctr[:rem], plain[-rem:])
-        return rslt
-
-    def decrypt(self, cipher: bytes) -> bytes:
-        return self.encrypt(cipher)
+    def encryptor(self) -> CTRContext:
+        return CTRContext(self.cipher_algo, self.nonce, self.pool)
@@ -1,24 +1,35 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
-from cryptolib.cipher._block_common import BlockCipherMode, split_block
+from typing import Callable, Optional, TYPE_CHECKING
+from cryptolib.cipher._block_common import BlockCipherMode, BlockCipherContext
+from cryptolib.cipher._padding import check_padding
 
 
 if TYPE_CHECKING:
-    from cryptolib.cipher._block_common import BlockCipherAlgo
+    from cryptolib.cipher._block_common import BlockCipherAlgo, Buffer
+
+
+class ECBContext(BlockCipherContext):
+    def __init__(self, block_size: int, crypt_blocks: Callable[[Buffer], bytes],
+                 padding: Optional[str] = None, unpad: bool = False) -> None:
+        super().__init__()
+        self.unit = block_size
+        self.crypt_blocks = crypt_blocks
+        self.padding = padding
+        self.unpad = unpad and padding is not None
+
+    def _process(self, src: memoryview, dst: memoryview) -> None:
+        if src:
+            dst[:] = self.crypt_blocks(src)
 
 
 class ECBMode(BlockCipherMode):
-    def __init__(self, key: bytes, cipher_algo: BlockCipherAlgo) -> None:
-        super().__init__(key, cipher_algo)
-
-    def encrypt(self, plain: bytes) -> bytes:
-        rslt = b''
-        for block in split_block(plain, self.cipher_algo):
-            rslt += self.cipher_algo.encrypt(block, self.key)
-        return rslt
-
-    def decrypt(self, cipher: bytes) -> bytes:
-        rslt = b''
-        for block in split_block(cipher, self.cipher_algo):
-            rslt += self.cipher_algo.decrypt(block, self.key)
-        return rslt
+    def __init__(self, cipher_algo: BlockCipherAlgo, padding: Optional[str] = None) -> None:
+        check_padding(padding)
+        super().__init__(cipher_algo)
+        self.padding = padding
+
+    def encryptor(self) -> ECBContext:
+        return ECBContext(self.cipher_algo.block_size, self.cipher_algo.encrypt_blocks, self.padding)
+
+    def decryptor(self) -> ECBContext:
+        return ECBContext(self.cipher_algo.block_size, self.cipher_algo.decrypt_blocks, self.padding, True)
@@ -0,0 +1,275 @@
+from __future__ import annotations
+from cryptolib.cipher._block_common import BlockCipherMode, BlockCipherContext, input_view
+from cryptolib.cipher._ctr import CTRContext
+from typing import List, Optional, Tuple, TYPE_CHECKING
+from hmac import compare_digest
+from cryptolib.util.binary import bytes2long
+
+
+if TYPE_CHECKING:
+    from cryptolib.cipher._block_common import BlockCipherAlgo, Buffer
+    from cryptolib.cipher._parallel import WorkerPool
+
+
+UNAUTHENTICATED = 'GCM mode needs the tag: use encrypt_and_digest and decrypt_and_verify'
+
+# x^128 + x^7 + x^2 + x + 1 in GCM bit order (x^0 is the MSB)
+GF128_R = 0xe1 << 120
+
+
+def gf128_mul(x: int, y: int) -> int:
+    """
+
+    bit-serial multiplication in GF(2^128), the reference for the tables
+    """
+    z = 0
+    for i in range(127, -1, -1):
+        if y >> i & 1:
+            z ^= x
+        x = (x >> 1) ^ GF128_R if x & 1 else x >> 1
+    return z
+
+
+def ghash_tables(h: int, table_bits: int = 8) -> List[List[int]]:
+    """
+
+    Shoup multiplication tables for the hash key H: the input block is cut
+    into table_bits wide digits and tables[i][d] is H times digit i set to d.
+    The reduction is folded into the tables, so X * H is the XOR of one
+    lookup per digit.
+
+    Args:
+        h (int): hash key
+        table_bits (int): 4 (32 tables of 16) or 8 (16 tables of 256)
+
+    Returns:
+        List[List[int]]
+    """
+    if table_bits not in (4, 8):
+        raise ValueError('table_bits must be 4 or 8')
+    # powers[j] = H * x^j
+    powers = []
+    for _ in range(128):
+        powers.append(h)
+        h = (h >> 1) ^ GF128_R if h & 1 else h >> 1
+    size = 1 << table_bits
+    tables = []
+    for i in range(128 // table_bits):
+        t = [0] * size
+        for d in range(1, size):
+            low = d & -d
+            t[d] = t[d ^ low] ^ powers[table_bits * (i + 1) - low.bit_length()]
+        tables.append(t)
+    return tables
+
+
+def ghash_blocks(tables: List[List[int]], y: int, data: Buffer) -> int:
+    """
+
+    absorb whole blocks into the GHASH state y
+    """
+    if len(tables) == 16:
+        t0, t1, t2, t3, t4, t5, t6, t7, t8, t9, t10, t11, t12, t13, t14, t15 = tables
+        for i in range(0, len(data), 16):
+            x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15 = (
+                y ^ int.from_bytes(data[i:i+16], 'big')).to_bytes(16, 'big')
+            y = (t0[x0] ^ t1[x1] ^ t2[x2] ^ t3[x3] ^ t4[x4] ^ t5[x5] ^ t6[x6] ^ t7[x7]
+                 ^ t8[x8] ^ t9[x9] ^ t10[x10] ^ t11[x11] ^ t12[x12] ^ t13[x13] ^ t14[x14] ^ t15[x15])
+        return y
+    shifts = range(124, -1, -4)
+    for i in range(0, len(data), 16):
+        x = y ^ int.from_bytes(data[i:i+16], 'big')
+        y = 0
+        for t, s in zip(tables, shifts):
+            y ^= t[x >> s & 0xf]
+    return y
+
+
+class GHash:
+    """
+
+    Incremental GHASH; input is buffered until a whole block is available
+    """
+
+    def __init__(self, tables: List[List[int]]) -> None:
+        self.tables = tables
+        self.y = 0
+        self._pending = bytearray()
+
+    def update(self, data: Buffer) -> None:
+        view = input_view(data)
+        pending = self._pending
+        pos = 0
+        if pending:
+            pos = min(len(view), 16 - len(pending))
+            pending += view[:pos]
+            if len(pending) < 16:
+                return
+            self.y = ghash_blocks(self.tables, self.y, pending)
+            pending.clear()
+        end = pos + (len(view) - pos) // 16 * 16
+        self.y = ghash_blocks(self.tables, self.y, view[pos:end])
+        pending += view[end:]
+
+    def pad(self) -> None:
+        """
+
+        zero-pad a partial block and absorb it
+        """
+        if self._pending:
+            self._pending += bytes(16 - len(self._pending))
+            self.y = ghash_blocks(self.tables, self.y, self._pending)
+            self._pending.clear()
+
+
+class GCMContext(BlockCipherContext):
+    """
+
+    Incremental GCM encryption or decryption. Additional authenticated data
+    is fed with update_aad() before the first update(); the tag is available
+    after finalize() and decryption is checked with verify().
+    """
+
+    def __init__(self, cipher_algo: BlockCipherAlgo, j0: bytes, tables: List[List[int]], tag_size: int,
+                 decrypt: bool, pool: Optional[WorkerPool] = None) -> None:
+        super().__init__()
+        self.cipher_algo = cipher_algo
+        self.tag_size = tag_size
+        self.tag: Optional[bytes] = None
+        self._decrypt = decrypt
+        self._j0 = j0
+        self._ctr = CTRContext(cipher_algo, j0, pool, counter_bits=32)
+        self._ctr.seek(16)
+        self._ghash = GHash(tables)
+        self._aad_len = 0
+        self._data_len = 0
+        self._aad_closed = False
+
+    def update_aad(self, data: Buffer) -> None:
+        """
+
+        authenticate additional data that is not encrypted
+
+        Args:
+            data (Buffer): chunk of AAD
+        """
+        if self._finalized:
+            raise ValueError('context is already finalized')
+        if self._aad_closed:
+            raise ValueError('AAD must be supplied before the data')
+        self._ghash.update(data)
+        self._aad_len += len(data)
+
+    def _process(self, src: memoryview, dst: memoryview) -> None:
+        if not self._aad_closed:
+            self._ghash.pad()
+            self._aad_closed = True
+        self._data_len += len(src)
+        if self._decrypt:
+            # hash before decrypting, dst may overlap src
+            self._ghash.update(src)
+            self._ctr.update_into(src, dst)
+        else:
+            self._ctr.update_into(src, dst)
+            self._ghash.update(dst)
+
+    def _finish(self, tail: bytes, dst: memoryview) -> int:
+        ghash = self._ghash
+        ghash.pad()
+        ghash.update((self._aad_len * 8).to_bytes(8, 'big') + (self._data_len * 8).to_bytes(8, 'big'))
+        s = bytes2long(self.cipher_algo.encrypt_block(self._j0)) ^ ghash.y
+        self.tag = s.to_bytes(16, 'big')[:self.tag_size]
+        return 0
+
+    def verify(self, tag: bytes) -> None:
+        """
+
+        check the received tag against the computed one
+
+        Args:
+            tag (bytes): received tag
+        """
+        if self.tag is None:
+            raise ValueError('context is not finalized')
+        if not compare_digest(self.tag, tag):
+            raise ValueError('MAC check failed')
+
+
+class GCMMode(BlockCipherMode):
+    def __init__(self, cipher_algo: BlockCipherAlgo, nonce: bytes, workers: Optional[int] = None,
+                 tag_size: int = 16, table_bits: int = 8) -> None:
+        if cipher_algo.block_size != 16:
+            raise ValueError('GCM mode requires a 128-bit block cipher')
+        if not 4 <= tag_size <= 16:
+            raise ValueError('invalid tag size')
+        if not nonce:
+            raise ValueError('nonce must not be empty')
+        super().__init__(cipher_algo, workers)
+        self.nonce = nonce
+        self.tag_size = tag_size
+        self.tables = ghash_tables(bytes2long(cipher_algo.encrypt_block(bytes(16))), table_bits)
+        if len(nonce) == 12:
+            self._j0 = nonce + b'\x00\x00\x00\x01'
+        else:
+            ghash = GHash(self.tables)
+            ghash.update(nonce)
+            ghash.pad()
+            ghash.update((len(nonce) * 8).to_bytes(16, 'big'))
+            self._j0 = ghash.y.to_bytes(16, 'big')
+
+    def encryptor(self, aad: Buffer = b'') -> GCMContext:
+        ctx = GCMContext(self.cipher_algo, self._j0, self.tables, self.tag_size, False, self.pool)
+        ctx.update_aad(aad)
+        return ctx
+
+    def decryptor(self, aad: Buffer = b'') -> GCMContext:
+        ctx = GCMContext(self.cipher_algo, self._j0, self.tables, self.tag_size, True, self.pool)
+        ctx.update_aad(aad)
+        return ctx
+
+    # the one-shot methods of BlockCipherMode would drop or skip the tag
+    def encrypt(self, plain: Buffer) -> bytes:
+        raise ValueError(UNAUTHENTICATED)
+
+    def decrypt(self, cipher: Buffer) -> bytes:
+        raise ValueError(UNAUTHENTICATED)
+
+    def encrypt_into(self, plain: Buffer, dst: Buffer) -> int:
+        raise ValueError(UNAUTHENTICATED)
+
+    def decrypt_into(self, cipher: Buffer, dst: Buffer) -> int:
+        raise ValueError(UNAUTHENTICATED)
+
+    def encrypt_and_digest(self, plain: Buffer, aad: Buffer = b'') -> Tuple[bytes, bytes]:
+        """
+
+        encrypt and authenticate a whole message
+
+        Args:
+            plain (Buffer): plaintext
+            aad (Buffer, optional): additional authenticated data
+
+        Returns:
+            Tuple[bytes, bytes]: ciphertext and tag
+        """
+        ctx = self.encryptor(aad)
+        cipher = ctx.update(plain) + ctx.finalize()
+        return cipher, ctx.tag
+
+    def decrypt_and_verify(self, cipher: Buffer, tag: bytes, aad: Buffer = b'') -> bytes:
+        """
+
+        decrypt a whole message, raising ValueError if the tag does not match
+
+        Args:
+            cipher (Buffer): ciphertext
+            tag (bytes): received tag
+            aad (Buffer, optional): additional authenticated data
+
+        Returns:
+            bytes: plaintext
+        """
+        ctx = self.decryptor(aad)
+        plain = ctx.update(cipher) + ctx.finalize()
+        ctx.verify(tag)
+        return plain
@@ -1,25 +1,61 @@
 from __future__ import annotations
-from cryptolib.cipher._block_common import BlockCipherMode, split_block
-from cryptolib.util.binary import xor_bytes
-from typing import TYPE_CHECKING
+from cryptolib.cipher._block_common import KeystreamMode, KeystreamContext
+from typing import Dict, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
     from cryptolib.cipher._block_common import BlockCipherAlgo
 
 
-class OFBMode(BlockCipherMode):
-    def __init__(self, key: bytes, cipher_algo: BlockCipherAlgo, iv: bytes) -> None:
-        super().__init__(key, cipher_algo)
-        self.iv = iv
+# keystream blocks between two cached OFB registers
+CHECKPOINT_BLOCKS = 1024
+
+
+class OFBContext(KeystreamContext):
+    # checkpoints is shared by the contexts of one mode: register after k * CHECKPOINT_BLOCKS
+    # blocks, keyed by k. Contexts only add the entry following one they started from, so the
+    # keys stay 0..len-1 and concurrent contexts at worst write the same value twice.
+    def __init__(self, cipher_algo: BlockCipherAlgo, checkpoints: Dict[int, bytes]) -> None:
+        super().__init__(cipher_algo.block_size)
+        self.cipher_algo = cipher_algo
+        self._checkpoints = checkpoints
+        self._register = checkpoints[0]
+        self._index = 0
+
+    def _seek_block(self, index: int) -> None:
+        checkpoint = min(index // CHECKPOINT_BLOCKS, len(self._checkpoints) - 1)
+        self._register = self._checkpoints[checkpoint]
+        self._index = checkpoint * CHECKPOINT_BLOCKS
+        if index > self._index:
+            self._keystream(index - self._index)
+
+    def _keystream(self, nblocks: int) -> bytes:
+        encrypt_block = self.cipher_algo.encrypt_block
+        checkpoints = self._checkpoints
+        tmp, index = self._register, self._index
+        blocks = []
+        for _ in range(nblocks):
+            tmp = encrypt_block(tmp)
+            blocks.append(tmp)
+            index += 1
+            if index % CHECKPOINT_BLOCKS == 0 and index // CHECKPOINT_BLOCKS not in checkpoints:
+                checkpoints[index // CHECKPOINT_BLOCKS] = tmp
+        self._register, self._index = tmp, index
+        return b''.join(blocks)
 
-    def encrypt(self, plain: bytes) -> bytes:
-        rslt = b''
-        tmp = self.iv
-        for block in split_block(plain, self.cipher_algo):
-            tmp = self.cipher_algo.encrypt(tmp, self.key)
-            rslt += xor_bytes(block, tmp)
-        return rslt
 
-    def decrypt(self, cipher: bytes) -> bytes:
-        return self.encrypt(cipher)
+class OFBMode(KeystreamMode):
+    """
+
+    OFB mode; the register is cached every CHECKPOINT_BLOCKS blocks so
+    that seeking back into a keystream already produced by this object
+    does not recompute it from the IV.
+    """
+
+    def __init__(self, cipher_algo: BlockCipherAlgo, iv: bytes) -> None:
+        super().__init__(cipher_algo)
+        self.iv = iv
+        self._checkpoints = {0: bytes(iv)}
+
+    def encryptor(self) -> OFBContext:
+        return OFBContext(self.cipher_algo, self._checkpoints)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+from typing import Optional
+import os
+
+
+PADDING_PKCS7 = 'pkcs7'
+PADDING_ISO10126 = 'iso10126'
+PADDING_ZERO = 'zero'
+
+PADDINGS = (PADDING_PKCS7, PADDING_ISO10126, PADDING_ZERO)
+
+
+def check_padding(padding: Optional[str]) -> None:
+    if padding is not None and padding not in PADDINGS:
+        raise ValueError('invalid padding')
+
+
+def pad(tail: bytes, block_size: int, padding: str) -> bytes:
+    """
+
+    pad the last partial block
+
+    Args:
+        tail (bytes): less than block_size bytes
+        block_size (int): block size
+        padding (str): 'pkcs7', 'iso10126' or 'zero'
+
+    Returns:
+        bytes: one full block (pkcs7, iso10126); zero padding adds nothing to an empty tail
+    """
+    n = block_size - len(tail)
+    if padding == PADDING_PKCS7:
+        return tail + bytes([n]) * n
+    elif padding == PADDING_ISO10126:
+        return tail + os.urandom(n - 1) + bytes([n])
+    return tail + bytes(n % block_size)
+
+
+def unpad_length(block: memoryview, padding: str) -> int:
+    """
+
+    length of the padding at the end of the last plaintext block. Every
+    byte of the block is examined whatever its content, and the error is
+    raised only after the whole block has been checked.
+
+    Args:
+        block (memoryview): last decrypted block
+        padding (str): 'pkcs7', 'iso10126' or 'zero'
+
+    Returns:
+        int
+    """
+    size = len(block)
+    if padding == PADDING_ZERO:
+        n, nonzero = 0, 0
+        for i in range(size - 1, -1, -1):
+            nonzero |= block[i]
+            n += nonzero == 0
+        return n
+    n = block[-1]
+    bad = (n == 0) | (n > size)
+    if padding == PADDING_PKCS7:
+        for i in range(size):
+            bad |= (size - i <= n) & (block[i] != n)
+    if bad:
+        raise ValueError('invalid padding')
+    return n
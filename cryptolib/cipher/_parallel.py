@@ -0,0 +1,90 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, TYPE_CHECKING
+from itertools import repeat
+import threading
+import weakref
+
+
+if TYPE_CHECKING:
+    from cryptolib.cipher._block_common import BlockCipherAlgo, Buffer
+
+
+# blocks handed to a worker per task; small batches are not worth the IPC
+CHUNK_BLOCKS = 1024
+
+
+class WorkerPool:
+    """
+
+    Lazily started process pool shared by the contexts of one mode object;
+    the contexts may run in several threads at once
+
+    Args:
+        workers (int): number of worker processes
+    """
+
+    def __init__(self, workers: int) -> None:
+        if workers < 1:
+            raise ValueError('workers must be positive')
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._finalizer = None
+        self._lock = threading.Lock()
+
+    def map(self, fn: Callable[..., Any], *iterables: Iterable[Any]) -> List[Any]:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.workers)
+                self._finalizer = weakref.finalize(self, self._executor.shutdown)
+            executor = self._executor
+        return list(executor.map(fn, *iterables))
+
+    def close(self) -> None:
+        with self._lock:
+            finalizer, self._executor, self._finalizer = self._finalizer, None, None
+        if finalizer is not None:
+            finalizer()
+
+
+def chunk_ranges(nblocks: int, chunk_blocks: int = CHUNK_BLOCKS) -> List[range]:
+    return [range(i, min(i + chunk_blocks, nblocks)) for i in range(0, nblocks, chunk_blocks)]
+
+
+def _encrypt_blocks(cipher_algo: BlockCipherAlgo, data: bytes) -> bytes:
+    return cipher_algo.encrypt_blocks(data)
+
+
+def _decrypt_blocks(cipher_algo: BlockCipherAlgo, data: bytes) -> bytes:
+    return cipher_algo.decrypt_blocks(data)
+
+
+def encrypt_blocks(pool: Optional[WorkerPool], cipher_algo: BlockCipherAlgo, data: Buffer) -> bytes:
+    """
+
+    encrypt independent blocks, spread across `pool` when it is worth it
+
+    Args:
+        pool (WorkerPool, optional): worker pool
+        cipher_algo (BlockCipherAlgo): keyed block cipher
+        data (Buffer): a multiple of block_size bytes
+
+    Returns:
+        bytes
+    """
+    return _map_blocks(pool, cipher_algo, _encrypt_blocks, data)
+
+
+def decrypt_blocks(pool: Optional[WorkerPool], cipher_algo: BlockCipherAlgo, data: Buffer) -> bytes:
+    return _map_blocks(pool, cipher_algo, _decrypt_blocks, data)
+
+
+def _map_blocks(pool: Optional[WorkerPool], cipher_algo: BlockCipherAlgo,
+                fn: Callable[[BlockCipherAlgo, bytes], bytes], data: Buffer) -> bytes:
+    bs = cipher_algo.block_size
+    nblocks = len(data) // bs
+    if pool is None or nblocks < 2 * CHUNK_BLOCKS:
+        return fn(cipher_algo, data)
+    view = memoryview(data)
+    chunks = [bytes(view[r.start*bs:r.stop*bs]) for r in chunk_ranges(nblocks)]
+    return b''.join(pool.map(fn, repeat(cipher_algo), chunks))
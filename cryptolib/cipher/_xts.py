@@ -0,0 +1,220 @@
+from __future__ import annotations
+from cryptolib.cipher._block_common import BlockCipherMode, BlockCipherContext, input_view, output_view
+from typing import Callable, Iterable, List, Tuple, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from cryptolib.cipher._block_common import BlockCipherAlgo, Buffer
+
+
+# bytes processed per pass of XTSMode.encrypt_inplace/decrypt_inplace, rounded down to whole sectors
+INPLACE_WINDOW = 1 << 16
+
+MASK128 = (1 << 128) - 1
+
+
+def mul_alpha(t: int) -> int:
+    # tweak times the primitive element of GF(2^128); tweaks are little-endian
+    return ((t << 1) & MASK128) ^ (0x87 if t >> 127 else 0)
+
+
+def tweak_stream(t: int, nblocks: int) -> Tuple[bytes, int]:
+    """
+
+    tweaks of nblocks consecutive blocks starting from t
+
+    Returns:
+        Tuple[bytes, int]: concatenated tweaks and the tweak of the next block
+    """
+    out = []
+    for _ in range(nblocks):
+        out.append(t.to_bytes(16, 'little'))
+        t = mul_alpha(t)
+    return b''.join(out), t
+
+
+def xex_blocks(crypt_blocks: Callable[[bytes], bytes], data: Buffer, tweaks: bytes) -> bytes:
+    t = int.from_bytes(tweaks, 'big')
+    x = (int.from_bytes(data, 'big') ^ t).to_bytes(len(tweaks), 'big')
+    return (int.from_bytes(crypt_blocks(x), 'big') ^ t).to_bytes(len(tweaks), 'big')
+
+
+def steal(crypt_blocks: Callable[[bytes], bytes], tail: bytes, t: int, decrypt: bool) -> bytes:
+    """
+
+    ciphertext stealing over the last full block and the partial block after it
+
+    Args:
+        crypt_blocks (Callable): encrypt_blocks or decrypt_blocks of the data key
+        tail (bytes): 17 to 31 bytes
+        t (int): tweak of the last full block
+        decrypt (bool): direction
+
+    Returns:
+        bytes
+    """
+    r = len(tail) - 16
+    tweaks = [t.to_bytes(16, 'little'), mul_alpha(t).to_bytes(16, 'little')]
+    if decrypt:
+        # the last full ciphertext block was produced with the next tweak
+        tweaks.reverse()
+    cc = xex_blocks(crypt_blocks, tail[:16], tweaks[0])
+    last = xex_blocks(crypt_blocks, tail[16:] + cc[r:], tweaks[1])
+    return last + cc[:r]
+
+
+class XTSContext(BlockCipherContext):
+    """
+
+    Incremental XTS over one data unit. The last full block is held back
+    until finalize() so that a partial final block can steal from it.
+    """
+    unit = 16
+
+    def __init__(self, crypt_blocks: Callable[[bytes], bytes], t: int, decrypt: bool) -> None:
+        super().__init__()
+        self.crypt_blocks = crypt_blocks
+        self._t = t
+        self._decrypt = decrypt
+        self._started = False
+
+    def update_size(self, length: int) -> int:
+        return max(0, ((len(self._pending) + length) // 16 - 1) * 16)
+
+    def update_into(self, data: Buffer, dst: Buffer) -> int:
+        if self._finalized:
+            raise ValueError('context is already finalized')
+        src = input_view(data)
+        size = self.update_size(len(src))
+        out = output_view(dst, size)
+        pending = self._pending
+        k = len(pending)
+        if not size:
+            pending += src
+            return 0
+        if size <= k:
+            self._process(memoryview(bytes(pending[:size])), out[:size])
+            del pending[:size]
+            pending += src
+            return size
+        m = -(-k // 16) * 16
+        if m:
+            self._process(memoryview(bytes(pending) + bytes(src[:m - k])), out[:m])
+        self._process(src[m - k:size - k], out[m:size])
+        pending[:] = src[size - k:]
+        return size
+
+    def _process(self, src: memoryview, dst: memoryview) -> None:
+        self._started = True
+        tweaks, self._t = tweak_stream(self._t, len(src) // 16)
+        dst[:] = xex_blocks(self.crypt_blocks, src, tweaks)
+
+    def _finish(self, tail: bytes, dst: memoryview) -> int:
+        if not tail:
+            return 0
+        if len(tail) < 16 and not self._started:
+            raise ValueError('XTS requires at least one full block')
+        if len(tail) == 16:
+            self._process(memoryview(tail), dst[:16])
+        else:
+            dst[:len(tail)] = steal(self.crypt_blocks, tail, self._t, self._decrypt)
+        return len(tail)
+
+
+class XTSMode(BlockCipherMode):
+    """
+
+    XTS (IEEE 1619) over a data key and a tweak key. Data units are
+    addressed by sector number; the tweak passed as `tweak` is used by
+    encrypt()/decrypt() and the streaming contexts.
+    """
+
+    def __init__(self, cipher_algo: BlockCipherAlgo, tweak_algo: BlockCipherAlgo, tweak: bytes) -> None:
+        if cipher_algo.block_size != 16:
+            raise ValueError('XTS mode requires a 128-bit block cipher')
+        if len(tweak) != 16:
+            raise ValueError('tweak must be 16 bytes')
+        super().__init__(cipher_algo)
+        self.tweak_algo = tweak_algo
+        self.tweak = tweak
+
+    def _tweak(self, tweak: bytes) -> int:
+        return int.from_bytes(self.tweak_algo.encrypt_block(tweak), 'little')
+
+    def encryptor(self) -> XTSContext:
+        return XTSContext(self.cipher_algo.encrypt_blocks, self._tweak(self.tweak), False)
+
+    def decryptor(self) -> XTSContext:
+        return XTSContext(self.cipher_algo.decrypt_blocks, self._tweak(self.tweak), True)
+
+    def _crypt_sectors(self, sectors: Iterable[Tuple[int, Buffer]], decrypt: bool) -> List[bytes]:
+        sectors = [(index, input_view(data)) for index, data in sectors]
+        crypt_blocks = self.cipher_algo.decrypt_blocks if decrypt else self.cipher_algo.encrypt_blocks
+        # the initial tweaks of every sector in one batch
+        encrypted = self.tweak_algo.encrypt_blocks(b''.join([index.to_bytes(16, 'little') for index, _ in sectors]))
+        bodies, tweaks, tails = [], [], []
+        for i, (_, data) in enumerate(sectors):
+            if len(data) < 16:
+                raise ValueError('XTS requires at least one full block')
+            body = len(data) if len(data) % 16 == 0 else (len(data) // 16 - 1) * 16
+            t = int.from_bytes(encrypted[16*i:16*i+16], 'little')
+            stream, t = tweak_stream(t, body // 16)
+            bodies.append(data[:body])
+            tweaks.append(stream)
+            tails.append((bytes(data[body:]), t))
+        out = memoryview(xex_blocks(crypt_blocks, b''.join(bodies), b''.join(tweaks)))
+        results = []
+        pos = 0
+        for body, (tail, t) in zip(bodies, tails):
+            result = bytes(out[pos:pos+len(body)])
+            pos += len(body)
+            if tail:
+                result += steal(crypt_blocks, tail, t, decrypt)
+            results.append(result)
+        return results
+
+    def encrypt_sectors(self, sectors: Iterable[Tuple[int, Buffer]]) -> List[bytes]:
+        """
+
+        encrypt a batch of data units
+
+        Args:
+            sectors (Iterable[Tuple[int, Buffer]]): (sector_index, data) pairs
+
+        Returns:
+            List[bytes]: ciphertext of each data unit, in input order
+        """
+        return self._crypt_sectors(sectors, False)
+
+    def decrypt_sectors(self, sectors: Iterable[Tuple[int, Buffer]]) -> List[bytes]:
+        return self._crypt_sectors(sectors, True)
+
+    def _crypt_inplace(self, buf: Buffer, sector_size: int, first_sector: int, decrypt: bool) -> None:
+        if sector_size < 16:
+            raise ValueError('sector_size must be at least one block')
+        step = max(1, INPLACE_WINDOW // sector_size) * sector_size
+        # views of an mmap must be released before it can be closed
+        with output_view(buf, 0) as view:
+            for start in range(0, len(view), step):
+                end = min(start + step, len(view))
+                window = bytes(view[start:end])
+                sectors = [
+                    (first_sector + (start + off) // sector_size, window[off:off+sector_size])
+                    for off in range(0, end - start, sector_size)
+                ]
+                view[start:end] = b''.join(self._crypt_sectors(sectors, decrypt))
+
+    def encrypt_inplace(self, buf: Buffer, sector_size: int, first_sector: int = 0) -> None:
+        """
+
+        encrypt consecutive sectors of a writable buffer (bytearray, mmap) in place
+
+        Args:
+            buf (Buffer): sectors laid out back to back; the last one may be shorter
+            sector_size (int): bytes per sector
+            first_sector (int, optional): sector index of the start of buf
+        """
+        self._crypt_inplace(buf, sector_size, first_sector, False)
+
+    def decrypt_inplace(self, buf: Buffer, sector_size: int, first_sector: int = 0) -> None:
+        self._crypt_inplace(buf, sector_size, first_sector, True)
@@ -0,0 +1,244 @@
+from __future__ import annotations
+from concurrent.futures import Executor, ProcessPoolExecutor
+from collections import deque
+from typing import Any, Callable, List, Optional, Tuple, TYPE_CHECKING
+import asyncio
+
+from cryptolib.cipher._block_common import input_view
+from cryptolib.cipher._ecb import ECBMode
+from cryptolib.cipher._cbc import CBCMode
+from cryptolib.cipher._ctr import CTRMode
+from cryptolib.cipher._gcm import GCMMode, UNAUTHENTICATED
+
+
+if TYPE_CHECKING:
+    from cryptolib.cipher._block_common import BlockCipherAlgo, BlockCipherContext, BlockCipherMode, Buffer
+
+
+# bytes per executor job; a multiple of every block size
+CHUNK_SIZE = 1 << 16
+# executor jobs (or chunks read ahead) in flight at once
+MAX_INFLIGHT = 4
+
+
+# job functions are module level so a process executor can pickle them
+
+def _encrypt(data: bytes, cipher: BlockCipherMode) -> bytes:
+    return cipher.encrypt(data)
+
+
+def _decrypt(data: bytes, cipher: BlockCipherMode) -> bytes:
+    return cipher.decrypt(data)
+
+
+def _ctr_range(data: bytes, cipher: CTRMode, offset: int) -> bytes:
+    return cipher.encrypt_range(data, offset)
+
+
+def _cbc_decrypt(data: bytes, cipher_algo: BlockCipherAlgo, iv: bytes, padding: Optional[str]) -> bytes:
+    return CBCMode(cipher_algo, iv, padding=padding).decrypt(data)
+
+
+Job = Tuple[Callable[..., bytes], int, int, Tuple[Any, ...]]
+
+
+def split_jobs(cipher: BlockCipherMode, data: memoryview, decrypt: bool, chunk_size: int = CHUNK_SIZE) -> List[Job]:
+    """
+
+    cut a message into jobs that can run concurrently. ECB, CTR and CBC
+    decryption have no dependency between chunks; the other modes chain
+    every block and become one job.
+
+    Args:
+        cipher (BlockCipherMode): cipher object
+        data (memoryview): whole message
+        decrypt (bool): direction
+        chunk_size (int, optional): bytes per job, rounded down to whole blocks
+
+    Returns:
+        List[Job]: (function, start, end, extra arguments); the function takes data[start:end] first
+    """
+    bs = cipher.cipher_algo.block_size
+    chunk_size = max(bs, chunk_size // bs * bs)
+    n = len(data)
+    chunks = [(lo, min(lo + chunk_size, n)) for lo in range(0, n, chunk_size)] or [(0, 0)]
+    last = chunks[-1][0]
+    if isinstance(cipher, CTRMode):
+        return [(_ctr_range, lo, hi, (cipher, lo)) for lo, hi in chunks]
+    if isinstance(cipher, ECBMode):
+        # only the last chunk carries the padding
+        body = ECBMode(cipher.cipher_algo)
+        fn = _decrypt if decrypt else _encrypt
+        return [(fn, lo, hi, (cipher if lo == last else body,)) for lo, hi in chunks]
+    if isinstance(cipher, CBCMode) and decrypt:
+        return [
+            (_cbc_decrypt, lo, hi, (
+                cipher.cipher_algo,
+                cipher.iv if lo == 0 else bytes(data[lo-bs:lo]),
+                cipher.padding if lo == last else None,
+            ))
+            for lo, hi in chunks
+        ]
+    return [(_decrypt if decrypt else _encrypt, 0, n, (cipher,))]
+
+
+async def _crypt_async(cipher: BlockCipherMode, data: Buffer, decrypt: bool, executor: Optional[Executor],
+                       chunk_size: int, max_inflight: int) -> bytes:
+    if isinstance(cipher, GCMMode):
+        raise ValueError(UNAUTHENTICATED)
+    loop = asyncio.get_running_loop()
+    view = input_view(data)
+    semaphore = asyncio.Semaphore(max_inflight)
+
+    async def run(job: Job) -> bytes:
+        fn, lo, hi, args = job
+        async with semaphore:
+            # the chunk is copied only once its job is about to start
+            return await loop.run_in_executor(executor, fn, bytes(view[lo:hi]), *args)
+
+    results = await asyncio.gather(*[run(job) for job in split_jobs(cipher, view, decrypt, chunk_size)])
+    return b''.join(results)
+
+
+async def encrypt_async(cipher: BlockCipherMode, plain: Buffer, executor: Optional[Executor] = None,
+                        chunk_size: int = CHUNK_SIZE, max_inflight: int = MAX_INFLIGHT) -> bytes:
+    """
+
+    encrypt without blocking the event loop
+
+    Args:
+        cipher (BlockCipherMode): cipher object
+        plain (Buffer): plaintext
+        executor (Executor, optional): thread or process executor (default: the loop's default executor)
+        chunk_size (int, optional): bytes per job in ECB and CTR mode
+        max_inflight (int, optional): jobs submitted to the executor at once
+
+    Returns:
+        bytes: ciphertext
+    """
+    return await _crypt_async(cipher, plain, False, executor, chunk_size, max_inflight)
+
+
+async def decrypt_async(cipher: BlockCipherMode, cipher_text: Buffer, executor: Optional[Executor] = None,
+                        chunk_size: int = CHUNK_SIZE, max_inflight: int = MAX_INFLIGHT) -> bytes:
+    return await _crypt_async(cipher, cipher_text, True, executor, chunk_size, max_inflight)
+
+
+async def _read_ahead(reader: asyncio.StreamReader, queue: asyncio.Queue, chunk_size: int) -> None:
+    # chunks until the empty one at EOF; a read error is handed to the consumer,
+    # which would otherwise wait for a chunk forever
+    try:
+        while True:
+            chunk = await reader.read(chunk_size)
+            await queue.put(chunk)
+            if not chunk:
+                return
+    except Exception as exc:
+        await queue.put(exc)
+
+
+async def crypt_stream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, ctx: BlockCipherContext,
+                       executor: Optional[Executor] = None, chunk_size: int = CHUNK_SIZE,
+                       max_inflight: int = MAX_INFLIGHT) -> int:
+    """
+
+    pipe a stream through a cipher context. Up to max_inflight chunks are
+    read ahead while the context processes the current one; the context
+    stays in this process, so a process executor falls back to the loop's
+    default executor.
+
+    Args:
+        reader (asyncio.StreamReader): input, read until EOF
+        writer (asyncio.StreamWriter): output, drained after every chunk
+        ctx (BlockCipherContext): fresh encryptor or decryptor; it is finalized on return
+        executor (Executor, optional): thread executor
+        chunk_size (int, optional): bytes per read
+        max_inflight (int, optional): chunks buffered ahead
+
+    Returns:
+        int: bytes written
+    """
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        executor = None
+    queue: asyncio.Queue = asyncio.Queue(max_inflight)
+    reading = asyncio.ensure_future(_read_ahead(reader, queue, chunk_size))
+    written = 0
+    try:
+        while True:
+            chunk = await queue.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            out = await loop.run_in_executor(executor, ctx.update, chunk) if chunk else ctx.finalize()
+            writer.write(out)
+            await writer.drain()
+            written += len(out)
+            if not chunk:
+                break
+    finally:
+        reading.cancel()
+    return written
+
+
+async def _ctr_stream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, cipher: CTRMode,
+                      executor: Optional[Executor], chunk_size: int, max_inflight: int) -> int:
+    # CTR chunks are independent: keep up to max_inflight jobs running and write in order
+    loop = asyncio.get_running_loop()
+    inflight: deque = deque()
+    offset = written = 0
+
+    async def flush() -> int:
+        out = await inflight.popleft()
+        writer.write(out)
+        await writer.drain()
+        return len(out)
+
+    while True:
+        chunk = await reader.read(chunk_size)
+        if not chunk:
+            break
+        inflight.append(loop.run_in_executor(executor, _ctr_range, chunk, cipher, offset))
+        offset += len(chunk)
+        if len(inflight) >= max_inflight:
+            written += await flush()
+    while inflight:
+        written += await flush()
+    return written
+
+
+async def encrypt_stream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, cipher: BlockCipherMode,
+                         executor: Optional[Executor] = None, chunk_size: int = CHUNK_SIZE,
+                         max_inflight: int = MAX_INFLIGHT) -> int:
+    """
+
+    encrypt a stream; CTR mode runs up to max_inflight chunks concurrently
+    in the executor (threads or processes), other modes go through
+    crypt_stream. GCM is rejected: run crypt_stream on an encryptor and
+    read its tag instead.
+
+    Args:
+        reader (asyncio.StreamReader): plaintext, read until EOF
+        writer (asyncio.StreamWriter): ciphertext
+        cipher (BlockCipherMode): cipher object
+        executor (Executor, optional): thread or process executor
+        chunk_size (int, optional): bytes per read
+        max_inflight (int, optional): chunks in flight at once
+
+    Returns:
+        int: bytes written
+    """
+    if isinstance(cipher, GCMMode):
+        raise ValueError(UNAUTHENTICATED)
+    if isinstance(cipher, CTRMode):
+        return await _ctr_stream(reader, writer, cipher, executor, chunk_size, max_inflight)
+    return await crypt_stream(reader, writer, cipher.encryptor(), executor, chunk_size, max_inflight)
+
+
+async def decrypt_stream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, cipher: BlockCipherMode,
+                         executor: Optional[Executor] = None, chunk_size: int = CHUNK_SIZE,
+                         max_inflight: int = MAX_INFLIGHT) -> int:
+    if isinstance(cipher, GCMMode):
+        raise ValueError(UNAUTHENTICATED)
+    if isinstance(cipher, CTRMode):
+        return await _ctr_stream(reader, writer, cipher, executor, chunk_size, max_inflight)
+    return await crypt_stream(reader, writer, cipher.decryptor(), executor, chunk_size, max_inflight)
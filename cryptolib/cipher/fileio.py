@@ -0,0 +1,112 @@
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+import mmap
+import os
+
+from cryptolib.cipher._gcm import GCMMode, UNAUTHENTICATED
+
+
+if TYPE_CHECKING:
+    from cryptolib.cipher._block_common import BlockCipherContext, BlockCipherMode
+
+
+# bytes of the source fed to the context per step
+WINDOW = 1 << 20
+# slack for output beyond the input length (padding, a held back block)
+OUTPUT_SLACK = 64
+
+
+def _prefetch(fd: int, src: Optional[mmap.mmap], offset: int, length: int) -> None:
+    # a non-blocking hint: kernel readahead fills the next window while this one is processed
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_WILLNEED)
+    elif src is not None and hasattr(src, 'madvise'):
+        src.madvise(mmap.MADV_WILLNEED, offset, length)
+
+
+def _release(src: mmap.mmap, offset: int, length: int) -> None:
+    # drop processed pages from the mapping so RSS stays at about one window
+    if hasattr(src, 'madvise') and hasattr(mmap, 'MADV_DONTNEED'):
+        src.madvise(mmap.MADV_DONTNEED, offset, length)
+
+
+def _preallocate(fd: int, size: int) -> None:
+    if size and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass
+    os.ftruncate(fd, size)
+
+
+def crypt_file(src_path: str, dst_path: str, ctx: BlockCipherContext, window: int = WINDOW) -> int:
+    """
+
+    stream a file through a cipher context into another file. The source
+    is memory-mapped and consumed window by window, so memory use does not
+    depend on the file size. Before a window is processed the kernel is
+    advised that the next one will be needed, and its readahead loads it
+    in the background.
+
+    Args:
+        src_path (str): input file
+        dst_path (str): output file, created or truncated
+        ctx (BlockCipherContext): fresh encryptor or decryptor; it is finalized on return
+        window (int, optional): bytes per step, rounded down to a multiple of the page size
+
+    Returns:
+        int: bytes written
+    """
+    window = max(mmap.PAGESIZE, window // mmap.PAGESIZE * mmap.PAGESIZE)
+    out = bytearray(window + OUTPUT_SLACK)
+    written = 0
+    with open(src_path, 'rb') as fin, open(dst_path, 'wb') as fout:
+        size = os.fstat(fin.fileno()).st_size
+        _preallocate(fout.fileno(), size)
+        src = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        try:
+            _prefetch(fin.fileno(), src, 0, window)
+            for offset in range(0, size, window):
+                length = min(window, size - offset)
+                if offset + length < size:
+                    _prefetch(fin.fileno(), src, offset + length, window)
+                with memoryview(src)[offset:offset+length] as chunk:
+                    n = ctx.update_into(chunk, out)
+                fout.write(memoryview(out)[:n])
+                written += n
+                _release(src, offset, length)
+        finally:
+            if src is not None:
+                src.close()
+        tail = ctx.finalize()
+        fout.write(tail)
+        written += len(tail)
+        fout.truncate(written)
+    return written
+
+
+def encrypt_file(src_path: str, dst_path: str, cipher: BlockCipherMode, window: int = WINDOW) -> int:
+    """
+
+    encrypt a file into another file without loading it into memory. GCM
+    is rejected: run crypt_file on an encryptor and read its tag instead.
+
+    Args:
+        src_path (str): plaintext file
+        dst_path (str): ciphertext file, created or truncated
+        cipher (BlockCipherMode): cipher object, e.g. from AES.new
+        window (int, optional): bytes per step
+
+    Returns:
+        int: bytes written
+    """
+    if isinstance(cipher, GCMMode):
+        raise ValueError(UNAUTHENTICATED)
+    return crypt_file(src_path, dst_path, cipher.encryptor(), window)
+
+
+def decrypt_file(src_path: str, dst_path: str, cipher: BlockCipherMode, window: int = WINDOW) -> int:
+    if isinstance(cipher, GCMMode):
+        raise ValueError(UNAUTHENTICATED)
+    return crypt_file(src_path, dst_path, cipher.decryptor(), window)
@@ -0,0 +1,229 @@
+"""
+
+Opt-in counters for block ciphers and modes.
+
+enable() wraps the methods of every BlockCipherAlgo, BlockCipherMode and
+BlockCipherContext subclass defined so far; disable() puts the originals
+back, so nothing is paid while instrumentation is off. Work done in
+worker processes (workers=, process executors) is not counted.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+import threading
+
+from cryptolib.cipher._block_common import BlockCipherAlgo, BlockCipherContext, BlockCipherMode
+
+
+Snapshot = Dict[str, Dict[str, Any]]
+
+ALGO_COUNTERS = ('key_schedules', 'blocks_encrypted', 'blocks_decrypted')
+MODE_COUNTERS = ('calls', 'bytes', 'seconds')
+
+_algos: Dict[str, Dict[str, int]] = {}
+_modes: Dict[str, Dict[str, Dict[str, float]]] = {}
+_patched: List[Tuple[type, str, Callable[..., Any]]] = []
+_local = threading.local()
+
+
+def _algo_stats(algo: BlockCipherAlgo) -> Dict[str, int]:
+    name = type(algo).__name__
+    if name not in _algos:
+        _algos[name] = dict.fromkeys(ALGO_COUNTERS, 0)
+    return _algos[name]
+
+
+def _mode_stats(mode: str, algo: str) -> Dict[str, float]:
+    algos = _modes.setdefault(mode, {})
+    if algo not in algos:
+        algos[algo] = dict.fromkeys(MODE_COUNTERS, 0)
+    return algos[algo]
+
+
+def _outermost(fn: Callable[..., Any], count: Callable[..., None]) -> Callable[..., Any]:
+    # the default encrypt_blocks loops over encrypt_block: count the outer call only
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if getattr(_local, 'busy', False):
+            return fn(self, *args, **kwargs)
+        _local.busy = True
+        try:
+            result = fn(self, *args, **kwargs)
+        finally:
+            _local.busy = False
+        count(self, *args)
+        return result
+    return wrapper
+
+
+def _count_schedule(algo: BlockCipherAlgo, *args: Any) -> None:
+    _algo_stats(algo)['key_schedules'] += 1
+
+
+def _count_blocks(counter: str, per_call: bool) -> Callable[..., None]:
+    def count(algo: BlockCipherAlgo, data: Any) -> None:
+        _algo_stats(algo)[counter] += 1 if per_call else len(data) // algo.block_size
+    return count
+
+
+ALGO_HOOKS = {
+    '__init__': _count_schedule,
+    'encrypt_block': _count_blocks('blocks_encrypted', True),
+    'decrypt_block': _count_blocks('blocks_decrypted', True),
+    'encrypt_blocks': _count_blocks('blocks_encrypted', False),
+    'decrypt_blocks': _count_blocks('blocks_decrypted', False),
+}
+
+
+def _tag_context(fn: Callable[..., BlockCipherContext]) -> Callable[..., BlockCipherContext]:
+    # contexts created by a mode are attributed to (mode, algorithm)
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        ctx = fn(self, *args, **kwargs)
+        ctx._instrument_key = (type(self).__name__, type(self.cipher_algo).__name__)
+        return ctx
+    return wrapper
+
+
+def _timed(fn: Callable[..., int], counts_input: bool) -> Callable[..., int]:
+    @wraps(fn)
+    def wrapper(self, *args):
+        key = getattr(self, '_instrument_key', None)
+        if key is None:
+            return fn(self, *args)
+        start = perf_counter()
+        try:
+            return fn(self, *args)
+        finally:
+            stats = _mode_stats(*key)
+            stats['seconds'] += perf_counter() - start
+            if counts_input:
+                stats['calls'] += 1
+                stats['bytes'] += len(args[0])
+    return wrapper
+
+
+def _subclasses(cls: type) -> List[type]:
+    out = [cls]
+    for sub in cls.__subclasses__():
+        out.extend(_subclasses(sub))
+    return out
+
+
+def _patch(cls: type, name: str, wrapper: Callable[..., Any]) -> None:
+    fn = cls.__dict__.get(name)
+    if fn is None or getattr(fn, '__isabstractmethod__', False):
+        return
+    _patched.append((cls, name, fn))
+    setattr(cls, name, wrapper)
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+def enable() -> None:
+    """
+
+    start counting; calling it again picks up classes defined since
+    """
+    disable()
+    for cls in set(_subclasses(BlockCipherAlgo)):
+        for name, count in ALGO_HOOKS.items():
+            fn = cls.__dict__.get(name)
+            if fn is not None:
+                _patch(cls, name, _outermost(fn, count))
+    for cls in set(_subclasses(BlockCipherMode)):
+        for name in ('encryptor', 'decryptor'):
+            if name in cls.__dict__:
+                _patch(cls, name, _tag_context(cls.__dict__[name]))
+    for cls in set(_subclasses(BlockCipherContext)):
+        if 'update_into' in cls.__dict__:
+            _patch(cls, 'update_into', _timed(cls.__dict__['update_into'], True))
+        if 'finalize_into' in cls.__dict__:
+            _patch(cls, 'finalize_into', _timed(cls.__dict__['finalize_into'], False))
+
+
+def disable() -> None:
+    """
+
+    stop counting and restore the original methods; counters are kept
+    """
+    while _patched:
+        cls, name, fn = _patched.pop()
+        setattr(cls, name, fn)
+
+
+def reset() -> None:
+    _algos.clear()
+    _modes.clear()
+
+
+def snapshot() -> Snapshot:
+    """
+
+    copy of the counters
+
+    Returns:
+        Snapshot: {'algorithms': {algo: counters}, 'modes': {mode: {algo: counters}}}
+    """
+    return {
+        'algorithms': {name: dict(stats) for name, stats in _algos.items()},
+        'modes': {mode: {algo: dict(stats) for algo, stats in algos.items()} for mode, algos in _modes.items()},
+    }
+
+
+def diff(after: Snapshot, before: Snapshot) -> Snapshot:
+    """
+
+    counters accumulated between two snapshots
+    """
+    algorithms = {}
+    for name, stats in after['algorithms'].items():
+        base = before['algorithms'].get(name, {})
+        algorithms[name] = {k: v - base.get(k, 0) for k, v in stats.items()}
+    modes: Dict[str, Dict[str, Any]] = {}
+    for mode, algos in after['modes'].items():
+        for algo, stats in algos.items():
+            base = before['modes'].get(mode, {}).get(algo, {})
+            modes.setdefault(mode, {})[algo] = {k: v - base.get(k, 0) for k, v in stats.items()}
+    return {'algorithms': algorithms, 'modes': modes}
+
+
+class Recording:
+    """
+
+    counters of one `recording()` block; snapshot() is live inside the
+    block and frozen after it
+    """
+
+    def __init__(self) -> None:
+        self._start = snapshot()
+        self._end = None
+
+    def snapshot(self) -> Snapshot:
+        return diff(self._end or snapshot(), self._start)
+
+
+@contextmanager
+def recording() -> Iterator[Recording]:
+    """
+
+    count the work done inside a with block
+
+        with instrument.recording() as rec:
+            aes.encrypt(data)
+        rec.snapshot()['modes']['CBCMode']['AESAlgo']['bytes']
+    """
+    was_enabled = is_enabled()
+    if not was_enabled:
+        enable()
+    rec = Recording()
+    try:
+        yield rec
+    finally:
+        rec._end = snapshot()
+        if not was_enabled:
+            disable()
@@ -82,14 +82,14 @@ def miller_rabin(n: int, k: int = 20) -> int:
         >>> miller_rabin(629685412367973552)
         False
     """
-    if n == 2:
-        return True
-    if n & 1 == 0 or n == 0:
+    if n < 4:
+        return n >= 2
+    if n & 1 == 0:
         return False
 
     mpz_n = gmpy2.mpz(n)
     r, d = 0, mpz_n - 1
-    while d & 1 != 0:
+    while d & 1 == 0:
         d >>= 1
         r += 1
 
@@ -98,7 +98,7 @@ def miller_rabin(n: int, k: int = 20) -> int:
         x = gmpy2.powmod(a, d, mpz_n)
         if x == 1 or x == mpz_n - 1:
             continue
-        for _ in range(r):
+        for _ in range(r - 1):
             x = gmpy2.powmod(x, 2, mpz_n)
             if x == mpz_n - 1:
                 break
@@ -162,21 +162,66 @@ def get_randbits(n: int) -> int:
     return secrets.randbits(n)
 
 
+# odd primes the candidates of get_prime are sieved with
+SIEVE_BOUND = 1 << 11
+SIEVE_PRIMES = [p for p in range(3, SIEVE_BOUND, 2) if all(p % q for q in range(3, math.isqrt(p) + 1, 2))]
+# odd candidates per sieve window
+SIEVE_WINDOW = 1 << 12
+
+_SIEVE_ZEROS = bytes(SIEVE_WINDOW)
+
+
+def _sieve_window(residues: List[int]) -> bytearray:
+    # sieve[i] is 1 unless base + 2i has a factor in SIEVE_PRIMES (base % p == residues[k])
+    sieve = bytearray(b'\x01') * SIEVE_WINDOW
+    for p, r in zip(SIEVE_PRIMES, residues):
+        # base + 2i ≡ 0 (mod p)  <=>  i ≡ -r / 2 (mod p)
+        i = (p - r) * ((p + 1) >> 1) % p
+        if i < SIEVE_WINDOW:
+            sieve[i::p] = _SIEVE_ZEROS[:(SIEVE_WINDOW - 1 - i) // p + 1]
+    return sieve
+
+
 def get_prime(n: int) -> int:
     """
 
-    get n bits prime number
+    get n bits prime number. A random odd start with the two top bits set
+    is sieved window by window against SIEVE_PRIMES, the residues being
+    carried from one window to the next; only the survivors go through
+    Miller-Rabin.
 
     Args:
         n (int): bits size
 
     Returns:
-        int: n bits prime number
+        int: n bits prime number (the product of two is exactly 2n bits)
     """
-    p = secrets.randbits(n)
-    while not is_prime(p):
-        p = secrets.randbits(n)
-    return p
+    if n < 2:
+        raise ValueError('invalid bit size')
+    top = 3 << (n - 2)
+    limit = 1 << n
+    if n <= SIEVE_BOUND.bit_length():
+        p = secrets.randbits(n) | top | 1
+        while not is_prime(p):
+            p = secrets.randbits(n) | top | 1
+        return p
+
+    step = 2 * SIEVE_WINDOW
+    while True:
+        base = secrets.randbits(n) | top | 1
+        residues = [base % p for p in SIEVE_PRIMES]
+        while base < limit:
+            sieve = _sieve_window(residues)
+            i = sieve.find(1)
+            while i >= 0:
+                candidate = base + 2 * i
+                if candidate >= limit:
+                    break
+                if is_prime(candidate):
+                    return candidate
+                i = sieve.find(1, i + 1)
+            base += step
+            residues = [(r + step) % p for p, r in zip(SIEVE_PRIMES, residues)]
 
 
 next_prime_cache = {}
@@ -1,10 +1,17 @@
 from __future__ import annotations
+from pyasn1.type import constraint
 from pyasn1.type import namedtype
 from pyasn1.type import univ
 from pyasn1.codec.der import decoder, encoder
 from pyasn1.error import PyAsn1Error
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from itertools import repeat
+from functools import reduce
 import math
+import os
 import random
+import threading
+import weakref
 import gmpy2
 
 from cryptolib.encoding import pem
@@ -13,9 +20,23 @@ from cryptolib.number import (
     lcm,
     inverse_mod,
     get_prime,
-    is_coprime
+    is_coprime,
+    is_prime
 )
-from typing import Union, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Union, Optional, Tuple
+
+
+class OtherPrimeInfoStruct(univ.Sequence):
+    componentType = namedtype.NamedTypes(
+        namedtype.NamedType('prime', univ.Integer()),
+        namedtype.NamedType('exponent', univ.Integer()),
+        namedtype.NamedType('coefficient', univ.Integer()),
+    )
+
+
+class OtherPrimeInfosStruct(univ.SequenceOf):
+    componentType = OtherPrimeInfoStruct()
+    sizeSpec = univ.SequenceOf.sizeSpec + constraint.ValueSizeConstraint(1, float('inf'))
 
 
 class RSAPrivateKeyStruct(univ.Sequence):
@@ -29,6 +50,7 @@ class RSAPrivateKeyStruct(univ.Sequence):
         namedtype.NamedType('exponent1', univ.Integer()),
         namedtype.NamedType('exponent2', univ.Integer()),
         namedtype.NamedType('coefficient', univ.Integer()),
+        namedtype.OptionalNamedType('otherPrimeInfos', OtherPrimeInfosStruct()),
     )
 
 
@@ -39,13 +61,241 @@ class RSAPublicKeyStruct(univ.Sequence):
     )
 
 
+# (r_i, d_i, t_i) of the third and later primes (RFC 8017 OtherPrimeInfo)
+OtherCRT = Tuple[Tuple[gmpy2.mpz, gmpy2.mpz, gmpy2.mpz], ...]
+CRTParams = Tuple[gmpy2.mpz, gmpy2.mpz, gmpy2.mpz, gmpy2.mpz, gmpy2.mpz, OtherCRT]
+
+# values per executor job in encrypt_many/decrypt_many
+BATCH_CHUNK = 256
+
+
+def _to_long(m: Union[int, bytes, str]) -> int:
+    if isinstance(m, bytes):
+        return bytes2long(m)
+    elif isinstance(m, str):
+        return bytes2long(m.encode())
+    return m
+
+
+def _crt_exponents(crt: CRTParams) -> List[Tuple[gmpy2.mpz, gmpy2.mpz]]:
+    p, q, dp, dq, _, others = crt
+    return [(p, dp), (q, dq)] + [(r, d) for r, d, _ in others]
+
+
+def _garner(ms: Sequence[gmpy2.mpz], crt: CRTParams) -> int:
+    # m = m2 + q * (qInv * (m1 - m2) mod p), then m += R * (t_i * (m_i - m) mod r_i)
+    # with R the product of the primes before r_i (RFC 8017 5.1.2)
+    p, q, _, _, qinv, others = crt
+    m = ms[1] + q * (qinv * (ms[0] - ms[1]) % p)
+    R = p * q
+    for (r, _, t), mi in zip(others, ms[2:]):
+        m += R * (t * (mi - m) % r)
+        R *= r
+    return int(m)
+
+
+def _crt_consistent(crt: CRTParams, d: int) -> bool:
+    p, q, dp, dq, qinv, others = crt
+    if dp != d % (p - 1) or dq != d % (q - 1) or qinv * q % p != 1:
+        return False
+    R = p * q
+    for r, di, ti in others:
+        if di != d % (r - 1) or ti * R % r != 1:
+            return False
+        R *= r
+    return True
+
+
+def _crt_decrypt(c: int, crt: CRTParams) -> int:
+    return _garner([gmpy2.powmod(c, d, r) for r, d in _crt_exponents(crt)], crt)
+
+
+def _powmod_each(values: Sequence[int], exp: gmpy2.mpz, mod: gmpy2.mpz) -> List[gmpy2.mpz]:
+    return [gmpy2.powmod(v, exp, mod) for v in values]
+
+
+# powmod_base_list appeared in gmpy2 2.1; Pipfile.lock pins 2.0.8
+_powmod_base_list = getattr(gmpy2, 'powmod_base_list', _powmod_each)
+
+
+# job functions are module level so a process executor can pickle them
+
+def _powmod_list(values: List[int], exp: gmpy2.mpz, mod: gmpy2.mpz) -> List[int]:
+    return [int(v) for v in _powmod_base_list(values, exp, mod)]
+
+
+def _crt_list(values: List[int], crt: CRTParams) -> List[int]:
+    residues = [_powmod_base_list(values, d, r) for r, d in _crt_exponents(crt)]
+    return [_garner(ms, crt) for ms in zip(*residues)]
+
+
+def _crt_for_exponent(crt: CRTParams, e: int) -> CRTParams:
+    # CRT values taking e-th roots, e being any exponent coprime to every r_i - 1
+    p, q, _, _, qinv, others = crt
+    try:
+        return (
+            p, q, gmpy2.invert(e, p - 1), gmpy2.invert(e, q - 1), qinv,
+            tuple((r, gmpy2.invert(e, r - 1), t) for r, _, t in others),
+        )
+    except ZeroDivisionError:
+        raise ValueError('invalid public exponent')
+
+
+def _crt_root(c: gmpy2.mpz, e: int, crt: CRTParams) -> int:
+    return _crt_decrypt(c, _crt_for_exponent(crt, e))
+
+
+def _batch_split(a: gmpy2.mpz, cs: List[gmpy2.mpz], es: List[int], n: gmpy2.mpz) -> List[gmpy2.mpz]:
+    # a = prod(m_i); peel off the right half with x ≡ 0 (mod E_left), x ≡ 1 (mod E_right):
+    # a^x = prod_right(m_i) * prod_left(c_i^(x/e_i)) * prod_right(c_i^((x-1)/e_i))
+    if len(cs) == 1:
+        return [a]
+    h = len(cs) // 2
+    el, er = math.prod(es[:h]), math.prod(es[h:])
+    x = el * gmpy2.invert(el, er)
+    den = gmpy2.mpz(1)
+    for c, e in zip(cs[:h], es[:h]):
+        den = den * gmpy2.powmod(c, x // e, n) % n
+    for c, e in zip(cs[h:], es[h:]):
+        den = den * gmpy2.powmod(c, (x - 1) // e, n) % n
+    ar = gmpy2.powmod(a, x, n) * gmpy2.invert(den, n) % n
+    al = a * gmpy2.invert(ar, n) % n
+    return _batch_split(al, cs[:h], es[:h], n) + _batch_split(ar, cs[h:], es[h:], n)
+
+
+def _batch_decrypt(cs: List[int], es: List[int], crt: CRTParams) -> List[int]:
+    """
+
+    Fiat's batch RSA: decrypt ciphertexts under the same modulus and
+    pairwise coprime public exponents with one full-size root of
+    prod(c_i^(E/e_i)), E = prod(e_i), and small exponentiations
+
+    Args:
+        cs (List[int]): ciphertexts
+        es (List[int]): public exponent of each ciphertext
+        crt (CRTParams): CRT values of the private key
+
+    Returns:
+        List[int]: plaintexts
+    """
+    if len(cs) == 1:
+        return [_crt_root(gmpy2.mpz(cs[0]), es[0], crt)]
+    n = math.prod(r for r, _ in _crt_exponents(crt))
+    cs = [gmpy2.mpz(c) % n for c in cs]
+    E = math.prod(es)
+    a = gmpy2.mpz(1)
+    for c, e in zip(cs, es):
+        a = a * gmpy2.powmod(c, E // e, n) % n
+    a = gmpy2.mpz(_crt_root(a, E, crt))
+    return [int(m) for m in _batch_split(a, cs, es, n)]
+
+
+def _batches(exponents: Sequence[int]) -> List[List[int]]:
+    # indices grouped so that the exponents in one group are distinct and pairwise coprime
+    groups: Dict[int, List[int]] = {}
+    for i, e in enumerate(exponents):
+        groups.setdefault(e, []).append(i)
+    distinct = list(groups)
+    if any(math.gcd(a, b) != 1 for i, a in enumerate(distinct) for b in distinct[i+1:]):
+        return [[i] for i in range(len(exponents))]
+    rounds = max(map(len, groups.values()), default=0)
+    return [[g[k] for g in groups.values() if k < len(g)] for k in range(rounds)]
+
+
+def _exponent_groups(exponents: Sequence[int], e: int) -> Tuple[Dict[int, List[int]], List[List[int]]]:
+    # e and exponents left alone in a batch go through _crt_list with one set of
+    # CRT values per exponent; batch RSA only for groups of distinct exponents
+    single: Dict[int, List[int]] = {}
+    rest = []
+    for i, ei in enumerate(exponents):
+        if ei == e:
+            single.setdefault(ei, []).append(i)
+        else:
+            rest.append(i)
+    batches = []
+    for batch in _batches([exponents[i] for i in rest]):
+        batch = [rest[j] for j in batch]
+        if len(batch) == 1:
+            single.setdefault(exponents[batch[0]], []).append(batch[0])
+        else:
+            batches.append(batch)
+    return single, batches
+
+
+def _decrypt_groups(values: List[int], exponents: Sequence[int], e: int, crt: CRTParams,
+                    executor: Optional[Executor], chunk_size: int) -> Iterator[Tuple[List[int], List[int]]]:
+    # (indices, plaintexts) per group of ciphertexts decrypted together
+    single, batches = _exponent_groups(exponents, e)
+    for ei, indices in single.items():
+        crt_e = crt if ei == e else _crt_for_exponent(crt, ei)
+        yield indices, _run_chunks(_crt_list, [values[i] for i in indices], (crt_e,), executor, chunk_size)
+    cs = [[values[i] for i in batch] for batch in batches]
+    es = [[exponents[i] for i in batch] for batch in batches]
+    results = (executor.map if executor else map)(_batch_decrypt, cs, es, repeat(crt, len(batches)))
+    yield from zip(batches, results)
+
+
+def _run_chunks(fn: Callable[..., List[int]], values: List[int], args: Tuple, executor: Optional[Executor],
+                chunk_size: int) -> List[int]:
+    if executor is None or len(values) <= chunk_size:
+        return fn(values, *args)
+    chunks = [values[i:i+chunk_size] for i in range(0, len(values), chunk_size)]
+    out: List[int] = []
+    for part in executor.map(fn, chunks, *(repeat(a, len(chunks)) for a in args)):
+        out.extend(part)
+    return out
+
+
 class RSA:
-    def __init__(self, n: int, e: int, p: Optional[int] = None, q: Optional[int] = None, d: Optional[int] = None) -> None:
+    def __init__(self, n: int, e: int, p: Optional[int] = None, q: Optional[int] = None, d: Optional[int] = None,
+                 dp: Optional[int] = None, dq: Optional[int] = None, qinv: Optional[int] = None,
+                 other_primes: Sequence[int] = (), other_crt: Sequence[Tuple[int, int]] = ()) -> None:
         self.n = n
         self.p = p
         self.q = q
         self.e = e
         self.d = d
+        # third and later primes of a multi-prime key
+        self.other_primes = list(other_primes)
+        # (p, q, d, other primes) the cached CRT values were derived for
+        self._crt_for: Optional[Tuple[int, int, int, Tuple[int, ...]]] = None
+        self._crt: Optional[CRTParams] = None
+        if p and q and d and dp and dq and qinv and len(other_crt) == len(self.other_primes):
+            others = tuple(
+                (gmpy2.mpz(r), gmpy2.mpz(di), gmpy2.mpz(ti))
+                for r, (di, ti) in zip(self.other_primes, other_crt)
+            )
+            crt = (*map(gmpy2.mpz, (p, q, dp, dq, qinv)), others)
+            # values that do not match the key (e.g. coefficient = p^-1 mod q) are recomputed on first use
+            if _crt_consistent(crt, d):
+                self._crt_for = (p, q, d, tuple(self.other_primes))
+                self._crt = crt
+
+    @property
+    def primes(self) -> List[int]:
+        return [self.p, self.q] + self.other_primes
+
+    def crt_params(self) -> Optional[CRTParams]:
+        """
+
+        CRT values of the private key, computed on first use and cached
+
+        Returns:
+            Optional[CRTParams]: (p, q, dP, dQ, qInv, ((r_i, d_i, t_i), ...)) as mpz, None without p, q and d
+        """
+        if not (self.p and self.q and self.d):
+            return None
+        key = (self.p, self.q, self.d, tuple(self.other_primes))
+        if self._crt_for != key:
+            p, q, d = map(gmpy2.mpz, (self.p, self.q, self.d))
+            others = []
+            R = p * q
+            for r in map(gmpy2.mpz, self.other_primes):
+                others.append((r, d % (r - 1), gmpy2.invert(R, r)))
+                R *= r
+            self._crt = (p, q, d % (p - 1), d % (q - 1), gmpy2.invert(q, p), tuple(others))
+            self._crt_for = key
+        return self._crt
 
     def encrypt(self, m: Union[int, bytes, str]) -> int:
         """RSA encrypt
@@ -58,10 +308,7 @@ class RSA:
         Returns:
             int: ciphertext
         """
-        if isinstance(m, bytes):
-            m = bytes2long(m)
-        elif isinstance(m, str):
-            m = bytes2long(m.encode())
+        m = _to_long(m)
 
         if self.n is None:
             raise ValueError('public key is not exist')
@@ -69,6 +316,27 @@ class RSA:
             raise ValueError('public exponent is not exist')
         return pow(m, self.e, self.n)
 
+    def encrypt_many(self, messages: Iterable[Union[int, bytes, str]], executor: Optional[Executor] = None,
+                     chunk_size: int = BATCH_CHUNK) -> List[int]:
+        """
+
+        encrypt many plaintexts under this key
+
+        Args:
+            messages (Iterable[Union[int, bytes, str]]): plaintexts
+            executor (Executor, optional): process executor the chunks are spread across
+            chunk_size (int, optional): plaintexts per executor job
+
+        Returns:
+            List[int]: ciphertexts, in input order
+        """
+        if self.n is None:
+            raise ValueError('public key is not exist')
+        if self.e is None:
+            raise ValueError('public exponent is not exist')
+        values = [_to_long(m) for m in messages]
+        return _run_chunks(_powmod_list, values, (gmpy2.mpz(self.e), gmpy2.mpz(self.n)), executor, chunk_size)
+
     def decrypt(self, c: int) -> int:
         """RSA decrypt
 
@@ -84,7 +352,50 @@ class RSA:
             raise ValueError('public key is not exist')
         elif self.d is None:
             raise ValueError('private exponent is not exist')
-        return pow(c, self.d, self.n)
+        crt = self.crt_params()
+        if crt is None:
+            return pow(c, self.d, self.n)
+        return _crt_decrypt(c, crt)
+
+    def decrypt_many(self, ciphertexts: Iterable[int], exponents: Optional[Sequence[int]] = None,
+                     executor: Optional[Executor] = None, chunk_size: int = BATCH_CHUNK) -> List[int]:
+        """
+
+        decrypt many ciphertexts under this key, with CRT when p and q are
+        known. `exponents` gives the public exponent each ciphertext was
+        encrypted with under this modulus; ciphertexts with distinct,
+        pairwise coprime exponents are then decrypted together with
+        batch RSA.
+
+        Args:
+            ciphertexts (Iterable[int]): ciphertexts
+            exponents (Sequence[int], optional): public exponent of each ciphertext (default: e)
+            executor (Executor, optional): process executor the chunks are spread across
+            chunk_size (int, optional): ciphertexts per executor job
+
+        Returns:
+            List[int]: plaintexts, in input order
+        """
+        if self.n is None:
+            raise ValueError('public key is not exist')
+        values = list(ciphertexts)
+        crt = self.crt_params()
+        if exponents is None:
+            if self.d is None:
+                raise ValueError('private exponent is not exist')
+            if crt is None:
+                return _run_chunks(_powmod_list, values, (gmpy2.mpz(self.d), gmpy2.mpz(self.n)), executor, chunk_size)
+            return _run_chunks(_crt_list, values, (crt,), executor, chunk_size)
+
+        if len(exponents) != len(values):
+            raise ValueError('one exponent per ciphertext needed')
+        if crt is None:
+            raise ValueError('primes are not exist')
+        plain = [0] * len(values)
+        for indices, ms in _decrypt_groups(values, exponents, self.e, crt, executor, chunk_size):
+            for i, m in zip(indices, ms):
+                plain[i] = m
+        return plain
 
     def export_key(self, enc_format: str = "pem") -> bytes:
         """
@@ -112,16 +423,27 @@ class RSA:
             raise ValueError('format is not found')
 
     def _der_encoded_privkey(self) -> bytes:
+        _, _, dp, dq, qinv, others = self.crt_params()
         key_struct = RSAPrivateKeyStruct()
-        key_struct['version'] = 0
+        # version 1 (multi) when otherPrimeInfos is present
+        key_struct['version'] = 1 if others else 0
         key_struct['modulus'] = self.n
         key_struct['publicExponent'] = self.e
         key_struct['privateExponent'] = self.d
         key_struct['prime1'] = self.p
         key_struct['prime2'] = self.q
-        key_struct['exponent1'] = self.d % (self.p - 1)
-        key_struct['exponent2'] = self.d % (self.q - 1)
-        key_struct['coefficient'] = inverse_mod(self.p, self.q)
+        key_struct['exponent1'] = int(dp)
+        key_struct['exponent2'] = int(dq)
+        key_struct['coefficient'] = int(qinv)
+        if others:
+            infos = OtherPrimeInfosStruct()
+            for r, di, ti in others:
+                info = OtherPrimeInfoStruct()
+                info['prime'] = int(r)
+                info['exponent'] = int(di)
+                info['coefficient'] = int(ti)
+                infos.append(info)
+            key_struct['otherPrimeInfos'] = infos
         encoded = encoder.encode(key_struct)
         return encoded
 
@@ -133,7 +455,7 @@ class RSA:
         return encoded
 
 
-def calc_privatekey(p: int, q: int, e: int) -> int:
+def calc_privatekey(p: int, q: int, e: int, other_primes: Sequence[int] = ()) -> int:
     """Calc private key
 
     calculate RSA private key
@@ -142,11 +464,12 @@ def calc_privatekey(p: int, q: int, e: int) -> int:
         p (long): prime 1
         q (long): prime 2
         e (long): public key e
+        other_primes (Sequence[int], optional): further primes of a multi-prime key
 
     Returns:
         long: private key
     """
-    L = lcm(p - 1, q - 1)
+    L = reduce(lcm, (r - 1 for r in other_primes), lcm(p - 1, q - 1))
     d = inverse_mod(e, L)
     return d
 
@@ -188,29 +511,22 @@ def decrypt(c: int, d: int, n: int) -> int:
     return pow(c, d, n)
 
 
-def keygen(k: int) -> Tuple[int, int, int]:
+def keygen(k: int, executor: Optional[Executor] = None) -> Tuple[int, int, int]:
     """RSA keygen
 
     generate RSA key
 
     Args:
         k (int): security paramator
+        executor (Executor, optional): process executor the primes are searched in, in parallel
 
     Returns:
         long: public key n
         long: public key e
         long: private key d
     """
-    p = get_prime(k // 2)
-    q = get_prime(k // 2)
-
-    while not is_coprime(p, q):
-        q = get_prime(k // 2)
-
-    n = p * q
-    e = 65537
-    d = calc_privatekey(p, q, e)
-    return n, e, d
+    key = generate(k, executor=executor)
+    return key.n, key.e, key.d
 
 
 def _primes_from_privatekey(e: int, d: int, n: int, t: int = 100) -> Tuple[int, int]:
@@ -247,7 +563,32 @@ def _primes_from_privatekey(e: int, d: int, n: int, t: int = 100) -> Tuple[int,
     return -1, -1
 
 
-def generate(k: int, e: int = 65537) -> RSA:
+def _rsa_prime(bits: int, e: int) -> int:
+    # p - 1 must be coprime to e for d to exist
+    p = get_prime(bits)
+    while not is_coprime(p - 1, e):
+        p = get_prime(bits)
+    return p
+
+
+def _prime_sizes(k: int, primes: int) -> List[int]:
+    if primes < 2:
+        raise ValueError('invalid number of primes')
+    if primes > 2 and k // primes < 16:
+        raise ValueError(f'key size too small for {primes} primes')
+    return [k // primes + (i < k % primes) for i in range(primes)]
+
+
+def _key_from_primes(k: int, e: int, primes: List[int], new_prime: Callable[[int], int]) -> RSA:
+    # the product of three or more primes can come out one bit short; the primes must be distinct
+    while math.prod(primes).bit_length() != k or len(set(primes)) != len(primes):
+        primes[-1] = new_prime(primes[-1].bit_length())
+    p, q, *others = primes
+    d = calc_privatekey(p, q, e, others)
+    return RSA(math.prod(primes), e, p, q, d, other_primes=others)
+
+
+def generate(k: int, e: int = 65537, primes: int = 2, executor: Optional[Executor] = None) -> RSA:
     """
 
     generate RSA key
@@ -255,22 +596,214 @@ def generate(k: int, e: int = 65537) -> RSA:
     Args:
         k (int): security paramator
         e (int): public exponent
+        primes (int, optional): number of primes; more than 2 makes a multi-prime key (RFC 8017)
+        executor (Executor, optional): process executor the primes are searched in, in parallel
 
     Returns:
         RSA: RSA object
     """
-    p = get_prime(k // 2)
-    q = get_prime(k // 2)
+    sizes = _prime_sizes(k, primes)
+    if executor is None:
+        found = [_rsa_prime(bits, e) for bits in sizes]
+    else:
+        found = list(executor.map(_rsa_prime, sizes, repeat(e)))
+    return _key_from_primes(k, e, found, lambda bits: _rsa_prime(bits, e))
 
-    while not is_coprime(p, q):
-        q = get_prime(k // 2)
 
-    n = p * q
-    d = calc_privatekey(p, q, e)
-    return RSA(n, e, p, q, d)
+class KeyPool:
+    """
 
+    Pre-generated RSA keys. Ready keys are kept per (bits, e, primes); when
+    fewer than low_water are left a background thread tops the pool up to
+    size. Primes are searched in parallel in a lazily started process pool,
+    primes found beyond those a key needs are kept for the next key.
 
-def construct(n: int, e: int, p: Optional[int] = None, q: Optional[int] = None, d: Optional[int] = None) -> RSA:
+        pool = KeyPool(size=8, workers=4)
+        pool.prefill(2048)
+        key = pool.get(2048)
+
+    Args:
+        size (int, optional): ready keys kept per (bits, e, primes)
+        low_water (int, optional): refill threshold (default size // 2)
+        workers (int, optional): processes searching primes (default os.cpu_count())
+    """
+    METRICS = ('hits', 'misses', 'refills', 'generated')
+
+    def __init__(self, size: int = 4, low_water: Optional[int] = None, workers: Optional[int] = None) -> None:
+        if size < 1:
+            raise ValueError('size must be positive')
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError('workers must be positive')
+        self.size = size
+        self.low_water = size // 2 if low_water is None else low_water
+        self.workers = workers
+        self._ready: Dict[Tuple[int, int, int], List[RSA]] = {}
+        self._spare: Dict[Tuple[int, int], List[int]] = {}
+        self._refilling: Dict[Tuple[int, int, int], threading.Thread] = {}
+        self._metrics = dict.fromkeys(self.METRICS, 0)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._finalizer = None
+
+    def __enter__(self) -> KeyPool:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get(self, bits: int, e: int = 65537, primes: int = 2) -> RSA:
+        """
+
+        take a ready key, or generate one now when the pool is empty
+
+        Args:
+            bits (int): modulus size
+            e (int, optional): public exponent
+            primes (int, optional): number of primes of the modulus
+
+        Returns:
+            RSA: RSA object, handed out once
+        """
+        _prime_sizes(bits, primes)
+        with self._lock:
+            if self._closed:
+                raise ValueError('pool is closed')
+            ready = self._ready.setdefault((bits, e, primes), [])
+            key = ready.pop() if ready else None
+            self._metrics['misses' if key is None else 'hits'] += 1
+            left = len(ready)
+        if key is None or left < self.low_water:
+            self._start_refill(bits, e, primes)
+        return self._generate(bits, e, primes) if key is None else key
+
+    def prefill(self, bits: int, e: int = 65537, primes: int = 2) -> None:
+        """
+
+        generate keys until size are ready, in the calling thread
+        """
+        if self._is_closed():
+            raise ValueError('pool is closed')
+        self._fill(bits, e, primes)
+
+    def _fill(self, bits: int, e: int, primes: int) -> None:
+        while self.ready(bits, e, primes) < self.size and not self._is_closed():
+            self._put(bits, e, primes, self._generate(bits, e, primes))
+
+    def _is_closed(self) -> bool:
+        with self._lock:
+            return self._closed
+
+    def ready(self, bits: int, e: int = 65537, primes: int = 2) -> int:
+        with self._lock:
+            return len(self._ready.get((bits, e, primes), []))
+
+    def metrics(self) -> Dict[str, int]:
+        """
+
+        counters: hits and misses of get(), background refills started and
+        keys generated
+        """
+        with self._lock:
+            return dict(self._metrics)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+
+        wait for the running refills to finish
+        """
+        with self._lock:
+            threads = list(self._refilling.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def close(self) -> None:
+        """
+
+        stop refilling and shut the process pool down; get() and prefill()
+        raise ValueError afterwards
+        """
+        with self._lock:
+            self._closed = True
+        self.wait()
+        if self._finalizer is not None:
+            self._finalizer()
+        self._executor = None
+        self._finalizer = None
+
+    def _put(self, bits: int, e: int, primes: int, key: RSA) -> None:
+        with self._lock:
+            self._ready.setdefault((bits, e, primes), []).append(key)
+
+    def _start_refill(self, bits: int, e: int, primes: int) -> None:
+        with self._lock:
+            if self._closed or (bits, e, primes) in self._refilling:
+                return
+            thread = threading.Thread(target=self._refill, args=(bits, e, primes), daemon=True)
+            self._refilling[bits, e, primes] = thread
+            self._metrics['refills'] += 1
+        thread.start()
+
+    def _refill(self, bits: int, e: int, primes: int) -> None:
+        try:
+            self._fill(bits, e, primes)
+        except ValueError:
+            # close() ran while a key was being generated: stop quietly
+            if not self._is_closed():
+                raise
+        finally:
+            with self._lock:
+                del self._refilling[bits, e, primes]
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                if self._closed:
+                    raise ValueError('pool is closed')
+                self._executor = ProcessPoolExecutor(self.workers)
+                self._finalizer = weakref.finalize(self, self._executor.shutdown)
+            return self._executor
+
+    def _stash(self, spare: List[int], future: Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            if len(spare) < 2 * self.workers:
+                spare.append(future.result())
+
+    def _primes(self, bits: int, e: int, count: int) -> List[int]:
+        # every worker searches; the first count primes are returned, the rest are stashed
+        spare = self._spare.setdefault((bits, e), [])
+        with self._lock:
+            primes = [spare.pop() for _ in range(min(count, len(spare)))]
+        if len(primes) == count:
+            return primes
+        futures = [self._pool().submit(_rsa_prime, bits, e) for _ in range(max(count, self.workers))]
+        done = set()
+        for future in as_completed(futures):
+            done.add(future)
+            primes.append(future.result())
+            if len(primes) == count:
+                break
+        for future in futures:
+            if future not in done:
+                future.add_done_callback(lambda f: self._stash(spare, f))
+        return primes
+
+    def _generate(self, bits: int, e: int, primes: int) -> RSA:
+        sizes = _prime_sizes(bits, primes)
+        found: List[int] = []
+        for size in sorted(set(sizes), reverse=True):
+            found.extend(self._primes(size, e, sizes.count(size)))
+        key = _key_from_primes(bits, e, found, lambda size: self._primes(size, e, 1)[0])
+        with self._lock:
+            self._metrics['generated'] += 1
+        return key
+
+
+def construct(n: int, e: int, p: Optional[int] = None, q: Optional[int] = None, d: Optional[int] = None,
+              other_primes: Sequence[int] = ()) -> RSA:
     """
 
     Construct
@@ -281,6 +814,7 @@ def construct(n: int, e: int, p: Optional[int] = None, q: Optional[int] = None,
         p (int, optional): prime 1
         q (int, optional): prime 2
         d (int, optional): private exponent
+        other_primes (Sequence[int], optional): further primes of a multi-prime key
 
     Returns:
         RSA: RSA object
@@ -288,12 +822,16 @@ def construct(n: int, e: int, p: Optional[int] = None, q: Optional[int] = None,
     if not n or not e:
         raise ValueError('n or e needed!')
 
-    if d:
+    # recovery from d only splits n in two: a multi-prime key needs its primes,
+    # otherwise p and q stay unset and decrypt falls back to pow(c, d, n)
+    if d and not (p and q):
         p, q = _primes_from_privatekey(e, d, n)
+        if p * q != n or not (is_prime(p) and is_prime(q)):
+            p = q = None
 
     if p and q and not d:
-        d = calc_privatekey(p, q, e)
-    return RSA(n, e, p, q, d)
+        d = calc_privatekey(p, q, e, other_primes)
+    return RSA(n, e, p, q, d, other_primes=other_primes)
 
 
 def import_key_der(data: bytes) -> RSA:
@@ -321,12 +859,22 @@ def import_key_der(data: bytes) -> RSA:
                     int(key_data['publicExponent'])
                 )
             else:
-                return construct(
+                infos = key_data['otherPrimeInfos']
+                others = [
+                    (int(info['prime']), int(info['exponent']), int(info['coefficient']))
+                    for info in (infos if infos.isValue else [])
+                ]
+                return RSA(
                     int(key_data['modulus']),
                     int(key_data['publicExponent']),
                     int(key_data['prime1']),
                     int(key_data['prime2']),
-                    int(key_data['privateExponent'])
+                    int(key_data['privateExponent']),
+                    int(key_data['exponent1']),
+                    int(key_data['exponent2']),
+                    int(key_data['coefficient']),
+                    [r for r, _, _ in others],
+                    [(di, ti) for _, di, ti in others]
                 )
         except PyAsn1Error:
             continue
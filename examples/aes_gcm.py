@@ -0,0 +1,28 @@
+import os
+import time
+from cryptolib.cipher import AES
+
+key = os.urandom(16)
+nonce = os.urandom(12)
+aad = b'header'
+plaintext = b'This is AES-GCM!'
+
+gcm = AES.new(key, AES.MODE_GCM, nonce)
+encrypted, tag = gcm.encrypt_and_digest(plaintext, aad)
+decrypted = gcm.decrypt_and_verify(encrypted, tag, aad)
+
+print(f"plaintext: {plaintext}")
+print("-" * 20)
+print(f"encrypt!: {encrypted.hex()} tag: {tag.hex()}")
+print(f"decrypt!: {decrypted}")
+
+# GCM against plain CTR on 1MB
+data = os.urandom(1 << 20)
+for name, cipher in [
+    ('CTR', AES.new(key, AES.MODE_CTR, nonce + b'\x00' * 4)),
+    ('GCM', AES.new(key, AES.MODE_GCM, nonce)),
+]:
+    start = time.perf_counter()
+    cipher.encrypt(data)
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {len(data) / elapsed / 1e6:.2f} MB/s")
@@ -0,0 +1,13 @@
+from cryptolib.attack.block_cipher import des_key_search
+from cryptolib.cipher import DES
+import pytest
+
+
+@pytest.mark.parametrize('lanes', [8, 64, 100])
+def test_des_key_search(lanes):
+    KEY = bytes([0x13, 0x34, 0x57, 0x79, 0x9b, 0xbc, 0xdf, 0xf1])
+    PLAIN = b'knownpt!'
+    cipher = DES.encrypt(PLAIN, KEY)
+    candidates = [KEY[:6] + bytes([i, j]) for i in range(0xc1, 0x100, 2) for j in range(0xe1, 0x100, 2)]
+    assert des_key_search(PLAIN, cipher, candidates, lanes) == KEY
+    assert des_key_search(PLAIN, cipher, candidates[:100], lanes) is None
@@ -31,3 +31,88 @@ def test_AES(plain, key, cipher):
     dec = AES.decrypt(enc, key)
     assert enc == cipher
     assert dec == plain
+
+
+def _reference_encrypt(plain, key, nr):
+    subkeys = AES.subkey_gen(key, nr)
+    s = AES.ByteMatrix(plain)
+    AES.add_round_key(s, subkeys[0])
+    for i in range(1, nr):
+        AES.sub_bytes(s)
+        AES.shift_rows(s)
+        AES.mix_columns(s)
+        AES.add_round_key(s, subkeys[i])
+    AES.sub_bytes(s)
+    AES.shift_rows(s)
+    AES.add_round_key(s, subkeys[-1])
+    return s.bytes()
+
+
+def _reference_decrypt(cipher, key, nr):
+    subkeys = AES.subkey_gen(key, nr)
+    s = AES.ByteMatrix(cipher)
+    AES.add_round_key(s, subkeys[-1])
+    for i in range(nr - 1, 0, -1):
+        AES.inv_shift_rows(s)
+        AES.inv_sub_bytes(s)
+        AES.add_round_key(s, subkeys[i])
+        AES.inv_mix_columns(s)
+    AES.inv_shift_rows(s)
+    AES.inv_sub_bytes(s)
+    AES.add_round_key(s, subkeys[0])
+    return s.bytes()
+
+
+def test_ByteMatrix_column_major():
+    data = bytes(range(16))
+    st = AES.ByteMatrix(data)
+    assert st.bytes() == data
+    assert st.at(1, 2) == st[1, 2] == 6
+    assert st[:, 1] == [1, 5, 9, 13]
+    assert st[2, :] == [8, 9, 10, 11]
+    st[:, 1] = [0xa0, 0xa1, 0xa2, 0xa3]
+    st[3, 3] = 0xff
+    assert st.bytes() == bytes([0, 0xa0, 2, 3, 4, 0xa1, 6, 7, 8, 0xa2, 10, 11, 12, 0xa3, 14, 0xff])
+    with pytest.raises(AttributeError):
+        st.matrix = None
+
+
+@pytest.mark.parametrize(('key_size', 'nr'), [(16, 10), (24, 12), (32, 14)])
+def test_AES_ttable_matches_reference(key_size, nr):
+    key = bytes(range(0x20, 0x20 + key_size))
+    plain = bytes(range(0x80, 0x90))
+    for _ in range(8):
+        enc = AES.encrypt(plain, key)
+        assert enc == _reference_encrypt(plain, key, nr)
+        assert _reference_decrypt(enc, key, nr) == plain
+        assert AES.decrypt(enc, key) == plain
+        plain = enc
+
+
+def test_AES_invalid_key_length():
+    with pytest.raises(ValueError):
+        AES.new(b'\x00' * 15, AES.MODE_ECB)
+
+
+@pytest.mark.parametrize(('mode', 'option'), [
+    (AES.MODE_CBC, {'segment_size': 8}),
+    (AES.MODE_CTR, {'padding': 'pkcs7'}),
+    (AES.MODE_OFB, {'workers': 2}),
+    (AES.MODE_XTS, {'workers': 2}),
+])
+def test_AES_unsupported_option(mode, option):
+    with pytest.raises(ValueError, match=f'{next(iter(option))} is only supported in'):
+        AES.new(bytes(32), mode, **option)
+
+
+@pytest.mark.parametrize('key_size', [16, 24, 32])
+def test_AES_numpy_blocks(key_size):
+    np = pytest.importorskip('numpy')
+    algo = AES.AESAlgo(bytes(range(key_size)))
+    data = bytes(range(256)) * 16
+    blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, 16)
+    enc = algo.encrypt_array(blocks)
+    assert enc.tobytes() == b''.join(algo.encrypt_block(data[i:i+16]) for i in range(0, len(data), 16))
+    assert algo.decrypt_array(enc).tobytes() == data
+    assert algo.encrypt_blocks(data) == enc.tobytes()
+    assert algo.decrypt_blocks(enc.tobytes()) == data
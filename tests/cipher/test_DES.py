@@ -29,3 +29,39 @@ def test_DES(plain, key, cipher):
     dec = DES.decrypt(enc, key)
     assert enc == cipher
     assert dec == plain
+
+
+def test_DES_key_bound_ecb():
+    des = DES.new(unhexlify('0001020304050607'), DES.MODE_ECB)
+    plain = unhexlify('00010203040506074142434445464748')
+    enc = des.encrypt(plain)
+    assert enc == unhexlify('e1b246e5a7c74cbc09f36c50507f0d7c')
+    assert des.decrypt(enc) == plain
+
+
+def test_DES_invalid_key_length():
+    with pytest.raises(ValueError):
+        DES.new(b'\x00' * 7, DES.MODE_ECB)
+
+
+@pytest.mark.parametrize('nblocks', [128, 300, 4100])
+def test_DES_bitslice_blocks(nblocks):
+    algo = DES.DESAlgo(unhexlify('0001020304050607'))
+    data = bytes(range(256)) * (nblocks // 32 + 1)
+    data = data[:nblocks * 8]
+    enc = algo.encrypt_blocks(data)
+    assert enc == b''.join(algo.encrypt_block(data[i:i+8]) for i in range(0, len(data), 8))
+    assert algo.decrypt_blocks(enc) == data
+
+
+@pytest.mark.parametrize(('table', 'size'), [
+    (DES.IP, 64), (DES.INV_IP, 64), (DES.PC1, 64), (DES.PC2, 56), (DES.E, 32),
+])
+def test_DES_permute_tables(table, size):
+    tables = DES.permute_tables(table, size)
+    for x in [0, 1, 0x0123456789abcdef, 0xfedcba9876543210, (1 << size) - 1]:
+        x &= (1 << size) - 1
+        fast = 0
+        for j, t in enumerate(tables):
+            fast |= t[(x >> (size - 8 * (j + 1))) & 0xff]
+        assert fast == DES.permute(table, size, x)
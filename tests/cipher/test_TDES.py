@@ -0,0 +1,48 @@
+from cryptolib.cipher import DES, TDES
+from binascii import unhexlify
+import pytest
+
+
+def test_TDES_ede3():
+    # NIST SP 800-67 example
+    key = unhexlify('0123456789abcdef23456789abcdef01456789abcdef0123')
+    plain = b'The qufck brown fox jump'
+    cipher = unhexlify('a826fd8ce53b855fcce21c8112256fe668d5c05dd9b6b900')
+    tdes = TDES.new(key, TDES.MODE_ECB)
+    assert tdes.encrypt(plain) == cipher
+    assert tdes.decrypt(cipher) == plain
+
+
+@pytest.mark.parametrize('key', [
+    unhexlify('0123456789abcdef23456789abcdef01'),
+    unhexlify('0123456789abcdef23456789abcdef01456789abcdef0123'),
+])
+def test_TDES_matches_chained_DES(key):
+    k1, k2, k3 = key[:8], key[8:16], key[16:] or key[:8]
+    plain = unhexlify('4142434445464748')
+    cipher = DES.encrypt(DES.decrypt(DES.encrypt(plain, k1), k2), k3)
+    assert TDES.encrypt(plain, key) == cipher
+    assert TDES.decrypt(cipher, key) == plain
+
+
+def test_TDES_invalid_key_length():
+    with pytest.raises(ValueError):
+        TDES.new(b'\x00' * 8, TDES.MODE_ECB)
+
+
+@pytest.mark.parametrize('mode', [TDES.MODE_CBC, TDES.MODE_OFB, TDES.MODE_CFB, TDES.MODE_CTR])
+def test_TDES_modes(mode):
+    key = unhexlify('0123456789abcdef23456789abcdef01456789abcdef0123')
+    iv = unhexlify('f69f2445df4f9b17')
+    plain = bytes(range(256)) * 5
+    enc = TDES.new(key, mode, iv).encrypt(plain)
+    assert TDES.new(key, mode, iv).decrypt(enc) == plain
+
+
+@pytest.mark.parametrize('nblocks', [4, 300])
+def test_TDES_blocks(nblocks):
+    algo = TDES.TDESAlgo(unhexlify('0123456789abcdef23456789abcdef01456789abcdef0123'))
+    data = (bytes(range(256)) * (nblocks // 32 + 1))[:nblocks * 8]
+    enc = algo.encrypt_blocks(data)
+    assert enc == b''.join(algo.encrypt_block(data[i:i+8]) for i in range(0, len(data), 8))
+    assert algo.decrypt_blocks(enc) == data
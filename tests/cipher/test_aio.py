@@ -0,0 +1,113 @@
+from cryptolib.cipher import AES, aio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import pytest
+
+
+KEY = bytes(range(16))
+IV = bytes(range(16, 32))
+PLAIN = bytes(range(256)) * 40 + b'tail'
+
+
+class Sink:
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+
+def make_reader(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+@pytest.fixture(scope='module', params=['thread', 'process'])
+def executor(request):
+    pool = ThreadPoolExecutor(2) if request.param == 'thread' else ProcessPoolExecutor(2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.parametrize(('mode', 'padding'), [
+    (AES.MODE_ECB, 'pkcs7'),
+    (AES.MODE_CBC, 'pkcs7'),
+    (AES.MODE_CTR, None),
+    (AES.MODE_OFB, None),
+])
+def test_crypt_async(executor, mode, padding):
+    aes = AES.new(KEY, mode, IV, padding=padding)
+
+    async def main():
+        enc = await aio.encrypt_async(aes, PLAIN, executor, chunk_size=1000, max_inflight=2)
+        dec = await aio.decrypt_async(aes, enc, executor, chunk_size=1000, max_inflight=2)
+        return enc, dec
+
+    enc, dec = asyncio.run(main())
+    assert enc == aes.encrypt(PLAIN)
+    assert dec == PLAIN
+
+
+@pytest.mark.parametrize(('mode', 'padding'), [
+    (AES.MODE_CBC, 'pkcs7'),
+    (AES.MODE_CTR, None),
+])
+def test_crypt_stream(executor, mode, padding):
+    aes = AES.new(KEY, mode, IV, padding=padding)
+
+    async def main():
+        enc, dec = Sink(), Sink()
+        await aio.encrypt_stream(make_reader(PLAIN), enc, aes, executor, chunk_size=1000)
+        await aio.decrypt_stream(make_reader(bytes(enc.data)), dec, aes, executor, chunk_size=1000)
+        return bytes(enc.data), bytes(dec.data)
+
+    enc, dec = asyncio.run(main())
+    assert enc == aes.encrypt(PLAIN)
+    assert dec == PLAIN
+
+
+def test_split_jobs():
+    aes = AES.new(KEY, AES.MODE_CBC, IV)
+    jobs = aio.split_jobs(aes, memoryview(PLAIN), True, 1000)
+    assert [(lo, hi) for _, lo, hi, _ in jobs] == [(lo, min(lo + 992, len(PLAIN))) for lo in range(0, len(PLAIN), 992)]
+    assert len(aio.split_jobs(aes, memoryview(PLAIN), False, 1000)) == 1
+
+
+def test_crypt_stream_reader_error():
+    aes = AES.new(KEY, AES.MODE_CBC, IV, padding='pkcs7')
+
+    async def main():
+        reader = asyncio.StreamReader()
+        reader.feed_data(PLAIN)
+        reader.set_exception(OSError('connection reset'))
+        await asyncio.wait_for(aio.crypt_stream(reader, Sink(), aes.encryptor(), chunk_size=1000), 10)
+
+    with pytest.raises(OSError, match='connection reset'):
+        asyncio.run(main())
+
+
+def test_ctr_stream_shared_workers(monkeypatch):
+    from cryptolib.cipher import _parallel
+    started = []
+
+    class CountingExecutor(ProcessPoolExecutor):
+        def __init__(self, *args):
+            started.append(self)
+            super().__init__(*args)
+
+    monkeypatch.setattr(_parallel, 'ProcessPoolExecutor', CountingExecutor)
+    plain = PLAIN * 32
+    with AES.new(KEY, AES.MODE_CTR, IV, workers=2) as aes:
+        sink = Sink()
+
+        async def main():
+            await aio.encrypt_stream(make_reader(plain), sink, aes, chunk_size=1 << 16)
+
+        asyncio.run(main())
+        assert bytes(sink.data) == AES.new(KEY, AES.MODE_CTR, IV).encrypt(plain)
+    assert len(started) == 1
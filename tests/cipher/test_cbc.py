@@ -76,3 +76,38 @@ def test_cbc(vectors):
     dec = unpad(aes.decrypt(enc))
     assert enc == cipher
     assert dec == plain
+
+
+def stream(ctx, data, chunk_size):
+    out = b''
+    for i in range(0, len(data), chunk_size):
+        out += ctx.update(data[i:i+chunk_size])
+    return out + ctx.finalize()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 16, 33])
+def test_cbc_stream(vectors, chunk_size):
+    plain, key, cipher = vectors
+    iv = unhexlify('000102030405060708090a0b0c0d0e0f')
+    aes = AES.new(key, AES.MODE_CBC, iv=iv)
+    padded = pad(aes.cipher_algo.block_size, plain)
+    assert stream(aes.encryptor(), padded, chunk_size) == cipher
+    assert stream(aes.decryptor(), cipher, chunk_size) == padded
+
+
+def test_cbc_partial_block():
+    aes = AES.new(b'\x00' * 16, AES.MODE_CBC)
+    with pytest.raises(ValueError):
+        aes.encrypt(b'\x00' * 17)
+    ctx = aes.encryptor()
+    assert len(ctx.update(b'\x00' * 20)) == 16
+    with pytest.raises(ValueError):
+        ctx.finalize()
+
+
+def test_cbc_parallel_decrypt():
+    key, iv = bytes(range(16)), bytes(range(16, 32))
+    plain = bytes(range(256)) * 160
+    cipher = AES.new(key, AES.MODE_CBC, iv).encrypt(plain)
+    with AES.new(key, AES.MODE_CBC, iv, workers=2) as aes:
+        assert aes.decrypt(cipher) == plain
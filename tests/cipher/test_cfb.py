@@ -65,3 +65,66 @@ def test_cfb(vectors):
     dec = aes.decrypt(enc)
     assert enc == cipher
     assert dec == plain
+
+
+def stream(ctx, data, chunk_size):
+    out = b''
+    for i in range(0, len(data), chunk_size):
+        out += ctx.update(data[i:i+chunk_size])
+    return out + ctx.finalize()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 16, 33])
+def test_cfb_stream(vectors, chunk_size):
+    plain, key, cipher = vectors
+    aes = AES.new(key, AES.MODE_CFB, 0x000102030405060708090a0b0c0d0e0f.to_bytes(16, "big"))
+    data = plain
+    enc = stream(aes.encryptor(), data, chunk_size)
+    assert enc == aes.encrypt(data)
+    assert stream(aes.decryptor(), enc, chunk_size) == data
+
+
+def test_cfb_parallel_decrypt():
+    key, iv = bytes(range(16)), bytes(range(16, 32))
+    plain = bytes(range(256)) * 10
+    cipher = AES.new(key, AES.MODE_CFB, iv).encrypt(plain)
+    with AES.new(key, AES.MODE_CFB, iv, workers=2) as aes:
+        assert aes.decrypt(cipher) == plain
+
+
+# NIST SP 800-38A F.3.7 (CFB8-AES128) and F.3.13 (CFB128-AES128)
+@pytest.mark.parametrize(('segment_size', 'plain', 'cipher'), [
+    (
+        8,
+        '6bc1bee22e409f96e93d7e117393172aae2d',
+        '3b79424c9c0dd436bace9e0ed4586a4f32b9',
+    ),
+    (
+        128,
+        '6bc1bee22e409f96e93d7e117393172aae2d8a571e03ac9c9eb76fac45af8e51',
+        '3b3fd92eb72dad20333449f8e83cfb4ac8a64537a0b3a93fcde3cdad9f1ce58b',
+    ),
+])
+def test_cfb_segment_size(segment_size, plain, cipher):
+    plain, cipher = unhexlify(plain), unhexlify(cipher)
+    key = unhexlify('2b7e151628aed2a6abf7158809cf4f3c')
+    iv = unhexlify('000102030405060708090a0b0c0d0e0f')
+    aes = AES.new(key, AES.MODE_CFB, iv, segment_size=segment_size)
+    assert aes.encrypt(plain) == cipher
+    assert aes.decrypt(cipher) == plain
+
+
+@pytest.mark.parametrize('length', [7, 8, 29])
+def test_cfb64_stream(length):
+    key, iv = bytes(range(16)), bytes(range(16, 32))
+    plain = bytes(range(length))
+    aes = AES.new(key, AES.MODE_CFB, iv, segment_size=64)
+    cipher = aes.encrypt(plain)
+    assert stream(aes.encryptor(), plain, 3) == cipher
+    assert stream(aes.decryptor(), cipher, 5) == plain
+
+
+@pytest.mark.parametrize('segment_size', [0, 4, 136])
+def test_cfb_invalid_segment_size(segment_size):
+    with pytest.raises(ValueError):
+        AES.new(bytes(16), AES.MODE_CFB, segment_size=segment_size)
@@ -66,3 +66,54 @@ def test_ctr(vectors):
     assert _plain == plain
     assert _cipher == cipher
 
+
+def test_ctr_into(vectors):
+    plain, key, cipher = vectors
+    nonce = 0x000102030405060708090a0b0c0d0e0f.to_bytes(16, "big")
+    aes = AES.new(key, AES.MODE_CTR, nonce)
+    dst = bytearray(len(plain))
+    assert aes.encrypt_into(bytearray(plain), memoryview(dst)) == len(plain)
+    assert dst == cipher
+    aes.decrypt_into(memoryview(cipher), dst)
+    assert dst == plain
+
+
+def stream(ctx, data, chunk_size):
+    out = b''
+    for i in range(0, len(data), chunk_size):
+        out += ctx.update(data[i:i+chunk_size])
+    return out + ctx.finalize()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 16, 33])
+def test_ctr_stream(vectors, chunk_size):
+    plain, key, cipher = vectors
+    aes = AES.new(key, AES.MODE_CTR, 0x000102030405060708090a0b0c0d0e0f.to_bytes(16, "big"))
+    data = plain
+    enc = stream(aes.encryptor(), data, chunk_size)
+    assert enc == aes.encrypt(data)
+    assert stream(aes.decryptor(), enc, chunk_size) == data
+
+
+def test_ctr_parallel():
+    key = bytes(range(16))
+    nonce = (2 ** 128 - 1000).to_bytes(16, "big")
+    plain = bytes(range(256)) * 200 + b'tail'
+    serial = AES.new(key, AES.MODE_CTR, nonce)
+    with AES.new(key, AES.MODE_CTR, nonce, workers=2) as parallel:
+        enc = parallel.encrypt(plain)
+        assert enc == serial.encrypt(plain)
+        assert parallel.decrypt(enc) == plain
+
+
+@pytest.mark.parametrize('offset', [0, 5, 16, 21, 100])
+def test_ctr_range(offset):
+    key = bytes(range(16))
+    nonce = (2 ** 128 - 3).to_bytes(16, "big")
+    plain = bytes(range(200))
+    aes = AES.new(key, AES.MODE_CTR, nonce)
+    cipher = aes.encrypt(plain)
+    assert aes.decrypt_range(cipher[offset:offset+37], offset) == plain[offset:offset+37]
+    ctx = aes.decryptor()
+    ctx.seek(offset)
+    assert ctx.update(memoryview(cipher)[offset:]) == plain[offset:]
@@ -89,3 +89,38 @@ def test_ecb(vectors):
     dec = unpad(aes.decrypt(enc))
     assert enc == cipher
     assert dec == plain
+
+
+def test_ecb_into(vectors):
+    plain, key, cipher = vectors
+    aes = AES.new(key, AES.MODE_ECB)
+    padded = bytearray(pad(aes.cipher_algo.block_size, plain))
+    dst = bytearray(len(padded) + 16)
+    assert aes.encrypt_into(memoryview(padded), dst) == len(cipher)
+    assert dst[:len(cipher)] == cipher
+    out = bytearray(len(cipher))
+    aes.decrypt_into(cipher, out)
+    assert unpad(out) == plain
+
+
+def test_ecb_into_small_buffer():
+    aes = AES.new(b'\x00' * 16, AES.MODE_ECB)
+    with pytest.raises(ValueError):
+        aes.encrypt_into(b'\x00' * 32, bytearray(16))
+
+
+def stream(ctx, data, chunk_size):
+    out = b''
+    for i in range(0, len(data), chunk_size):
+        out += ctx.update(data[i:i+chunk_size])
+    return out + ctx.finalize()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 16, 33])
+def test_ecb_stream(vectors, chunk_size):
+    plain, key, cipher = vectors
+    aes = AES.new(key, AES.MODE_ECB)
+    data = pad(aes.cipher_algo.block_size, plain)
+    enc = stream(aes.encryptor(), data, chunk_size)
+    assert enc == aes.encrypt(data)
+    assert stream(aes.decryptor(), enc, chunk_size) == data
@@ -0,0 +1,40 @@
+from cryptolib.cipher import AES, fileio
+import os
+import pytest
+
+
+KEY = bytes(range(16))
+IV = bytes(range(16, 32))
+
+
+@pytest.fixture(params=[0, 100, 4096 * 3 + 48, 4096 * 5 + 7])
+def plain_file(request, tmp_path):
+    path = tmp_path / 'plain'
+    path.write_bytes(os.urandom(request.param))
+    return path
+
+
+@pytest.mark.parametrize(('mode', 'key'), [
+    (AES.MODE_CTR, KEY),
+    (AES.MODE_OFB, KEY),
+    (AES.MODE_CFB, KEY),
+    (AES.MODE_XTS, KEY * 2),
+])
+def test_encrypt_file(plain_file, tmp_path, mode, key):
+    plain = plain_file.read_bytes()
+    if mode == AES.MODE_XTS and 0 < len(plain) < 16:
+        pytest.skip('XTS needs a full block')
+    enc_path, dec_path = tmp_path / 'enc', tmp_path / 'dec'
+    assert fileio.encrypt_file(str(plain_file), str(enc_path), AES.new(key, mode, IV), window=4096) == len(plain)
+    assert enc_path.read_bytes() == AES.new(key, mode, IV).encrypt(plain)
+    fileio.decrypt_file(str(enc_path), str(dec_path), AES.new(key, mode, IV), window=4096)
+    assert dec_path.read_bytes() == plain
+
+
+def test_crypt_file_gcm(plain_file, tmp_path):
+    plain = plain_file.read_bytes()
+    gcm = AES.new(KEY, AES.MODE_GCM, IV[:12])
+    ctx = gcm.encryptor(b'header')
+    enc_path = tmp_path / 'enc'
+    fileio.crypt_file(str(plain_file), str(enc_path), ctx, window=4096)
+    assert (enc_path.read_bytes(), ctx.tag) == gcm.encrypt_and_digest(plain, b'header')
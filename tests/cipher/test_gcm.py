@@ -0,0 +1,172 @@
+from cryptolib.cipher import AES, aio, fileio
+from cryptolib.cipher._gcm import GCMMode, gf128_mul, ghash_tables, ghash_blocks
+from binascii import unhexlify
+import asyncio
+import pytest
+
+
+# test cases 1-4 and 6 from "The Galois/Counter Mode of Operation (GCM)"
+K = 'feffe9928665731c6d6a8f9467308308'
+P = (
+    'd9313225f88406e5a55909c5aff5269a86a7a9531534f7da2e4c303d8a318a72'
+    '1c3c0c95956809532fcf0e2449a6b525b16aedf5aa0de657ba637b391aafd255'
+)
+test_vectors = [
+    (
+        '00000000000000000000000000000000', '', '', '000000000000000000000000',
+        '',
+        '58e2fccefa7e3061367f1d57a4e7455a',
+    ),
+    (
+        '00000000000000000000000000000000', '00000000000000000000000000000000', '', '000000000000000000000000',
+        '0388dace60b6a392f328c2b971b2fe78',
+        'ab6e47d42cec13bdf53a67b21257bddf',
+    ),
+    (
+        K, P, '', 'cafebabefacedbaddecaf888',
+        '42831ec2217774244b7221b784d0d49ce3aa212f2c02a4e035c17e2329aca12e'
+        '21d514b25466931c7d8f6a5aac84aa051ba30b396a0aac973d58e091473f5985',
+        '4d5c2af327cd64a62cf35abd2ba6fab4',
+    ),
+    (
+        K, P[:120], 'feedfacedeadbeeffeedfacedeadbeefabaddad2', 'cafebabefacedbaddecaf888',
+        '42831ec2217774244b7221b784d0d49ce3aa212f2c02a4e035c17e2329aca12e'
+        '21d514b25466931c7d8f6a5aac84aa051ba30b396a0aac973d58e091',
+        '5bc94fbc3221a5db94fae95ae7121a47',
+    ),
+    (
+        K, P[:120], 'feedfacedeadbeeffeedfacedeadbeefabaddad2',
+        '9313225df88406e555909c5aff5269aa6a7a9538534f7da1e4c303d2a318a728'
+        'c3c0c95156809539fcf0e2429a6b525416aedbf5a0de6a57a637b39b',
+        '8ce24998625615b603a033aca13fb894be9112a5c3a211a8ba262a3cca7e2ca7'
+        '01e4a9a4fba43c90ccdcb281d48c7c6fd62875d2aca417034c34aee5',
+        '619cc5aefffe0bfa462af43c1699d050',
+    ),
+]
+
+
+@pytest.fixture(params=test_vectors)
+def vectors(request):
+    return map(unhexlify, request.param)
+
+
+def test_gcm(vectors):
+    key, plain, aad, nonce, cipher, tag = vectors
+    aes = AES.new(key, AES.MODE_GCM, nonce)
+    assert aes.encrypt_and_digest(plain, aad) == (cipher, tag)
+    assert aes.decrypt_and_verify(cipher, tag, aad) == plain
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 16, 33])
+def test_gcm_stream(vectors, chunk_size):
+    key, plain, aad, nonce, cipher, tag = vectors
+    aes = AES.new(key, AES.MODE_GCM, nonce)
+    ctx = aes.encryptor()
+    for i in range(0, len(aad), chunk_size):
+        ctx.update_aad(aad[i:i+chunk_size])
+    out = b''.join(ctx.update(plain[i:i+chunk_size]) for i in range(0, len(plain), chunk_size))
+    assert out + ctx.finalize() == cipher
+    assert ctx.tag == tag
+    ctx = aes.decryptor(aad)
+    out = b''.join(ctx.update(cipher[i:i+chunk_size]) for i in range(0, len(cipher), chunk_size))
+    assert out + ctx.finalize() == plain
+    ctx.verify(tag)
+
+
+def test_gcm_tampered(vectors):
+    key, plain, aad, nonce, cipher, tag = vectors
+    aes = AES.new(key, AES.MODE_GCM, nonce)
+    with pytest.raises(ValueError):
+        aes.decrypt_and_verify(cipher, bytes([tag[0] ^ 1]) + tag[1:], aad)
+    with pytest.raises(ValueError):
+        aes.decrypt_and_verify(cipher, tag, aad + b'\x00')
+
+
+def test_gcm_tampered_ciphertext(vectors):
+    key, plain, aad, nonce, cipher, tag = vectors
+    if not cipher:
+        return
+    aes = AES.new(key, AES.MODE_GCM, nonce)
+    tampered = bytes([cipher[0] ^ 1]) + cipher[1:]
+    with pytest.raises(ValueError):
+        aes.decrypt_and_verify(tampered, tag, aad)
+    ctx = aes.decryptor(aad)
+    ctx.update(tampered)
+    ctx.finalize()
+    with pytest.raises(ValueError):
+        ctx.verify(tag)
+
+
+def test_gcm_rejects_unauthenticated_calls(tmp_path):
+    aes = AES.new(bytes(16), AES.MODE_GCM, bytes(12))
+    cipher, _ = aes.encrypt_and_digest(b'secret message!!')
+    tampered = bytes([cipher[0] ^ 1]) + cipher[1:]
+    with pytest.raises(ValueError, match='decrypt_and_verify'):
+        aes.decrypt(tampered)
+    with pytest.raises(ValueError, match='encrypt_and_digest'):
+        aes.encrypt(b'secret message!!')
+    with pytest.raises(ValueError):
+        aes.encrypt_into(b'secret message!!', bytearray(16))
+    with pytest.raises(ValueError):
+        aes.decrypt_into(tampered, bytearray(16))
+
+    with pytest.raises(ValueError):
+        asyncio.run(aio.decrypt_async(aes, tampered))
+    with pytest.raises(ValueError):
+        asyncio.run(aio.encrypt_async(aes, b'secret message!!'))
+
+    async def stream(fn):
+        reader = asyncio.StreamReader()
+        reader.feed_data(tampered)
+        reader.feed_eof()
+        await fn(reader, None, aes)
+    with pytest.raises(ValueError):
+        asyncio.run(stream(aio.decrypt_stream))
+    with pytest.raises(ValueError):
+        asyncio.run(stream(aio.encrypt_stream))
+
+    src = tmp_path / 'src'
+    src.write_bytes(tampered)
+    with pytest.raises(ValueError):
+        fileio.decrypt_file(str(src), str(tmp_path / 'dst'), aes)
+    with pytest.raises(ValueError):
+        fileio.encrypt_file(str(src), str(tmp_path / 'dst'), aes)
+
+
+def test_gcm_aad_after_data():
+    ctx = AES.new(bytes(16), AES.MODE_GCM, bytes(12)).encryptor()
+    ctx.update(b'data')
+    with pytest.raises(ValueError):
+        ctx.update_aad(b'aad')
+
+
+def test_gcm_requires_nonce():
+    with pytest.raises(ValueError):
+        AES.new(bytes(16), AES.MODE_GCM)
+
+
+@pytest.mark.parametrize('table_bits', [4, 8])
+def test_ghash_tables(table_bits):
+    h = 0x66e94bd4ef8a2c3b884cfa59ca342b2e
+    tables = ghash_tables(h, table_bits)
+    for x in [1, 1 << 127, 0x0388dace60b6a392f328c2b971b2fe78, (1 << 128) - 1]:
+        assert ghash_blocks(tables, 0, x.to_bytes(16, 'big')) == gf128_mul(x, h)
+
+
+def test_gcm_table_bits():
+    key, nonce = unhexlify(K), unhexlify('cafebabefacedbaddecaf888')
+    plain = unhexlify(P)
+    gcm4 = GCMMode(AES.AESAlgo(key), nonce, table_bits=4)
+    gcm8 = GCMMode(AES.AESAlgo(key), nonce, table_bits=8)
+    assert gcm4.encrypt_and_digest(plain) == gcm8.encrypt_and_digest(plain)
+
+
+def test_gcm_counter_wraps_32_bits():
+    # the counter only increments its low 32 bits
+    gcm = GCMMode(AES.AESAlgo(bytes(16)), bytes(12))
+    gcm._j0 = b'\x01' * 12 + b'\xff\xff\xff\xfe'
+    ctx = gcm.encryptor()
+    ks = ctx.update(bytes(32))
+    algo = AES.AESAlgo(bytes(16))
+    assert ks[:16] == algo.encrypt_block(b'\x01' * 12 + b'\xff\xff\xff\xff')
+    assert ks[16:] == algo.encrypt_block(b'\x01' * 12 + b'\x00\x00\x00\x00')
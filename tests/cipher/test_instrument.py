@@ -0,0 +1,60 @@
+from cryptolib.cipher import AES, DES, instrument
+from cryptolib.cipher._block_common import BlockCipherAlgo
+import pytest
+
+
+KEY = bytes(range(16))
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled_by_default():
+    assert not instrument.is_enabled()
+    assert AES.AESAlgo.encrypt_block is AES.AESAlgo.__dict__['encrypt_block']
+    AES.new(KEY, AES.MODE_CBC).encrypt(bytes(64))
+    assert instrument.snapshot() == {'algorithms': {}, 'modes': {}}
+
+
+def test_recording():
+    with instrument.recording() as rec:
+        aes = AES.new(KEY, AES.MODE_CBC)
+        enc = aes.encrypt(bytes(64))
+        aes.decrypt(enc)
+    snap = rec.snapshot()
+    assert snap['algorithms']['AESAlgo'] == {'key_schedules': 1, 'blocks_encrypted': 4, 'blocks_decrypted': 4}
+    cbc = snap['modes']['CBCMode']['AESAlgo']
+    assert cbc['calls'] == 2
+    assert cbc['bytes'] == 128
+    assert cbc['seconds'] > 0
+    assert not instrument.is_enabled()
+    AES.new(KEY, AES.MODE_ECB).encrypt(bytes(16))
+    assert rec.snapshot() == snap
+
+
+def test_default_blocks_counted_once():
+    with instrument.recording() as rec:
+        des = DES.DESAlgo(KEY[:8])
+        BlockCipherAlgo.encrypt_blocks(des, bytes(80))
+        des.encrypt_block(bytes(8))
+    assert rec.snapshot()['algorithms']['DESAlgo']['blocks_encrypted'] == 11
+
+
+def test_stream_attributed_to_mode():
+    instrument.enable()
+    ctx = AES.new(KEY, AES.MODE_GCM, bytes(12)).encryptor()
+    ctx.update(bytes(40))
+    ctx.update(bytes(8))
+    ctx.finalize()
+    snap = instrument.snapshot()
+    assert snap['modes']['GCMMode']['AESAlgo']['bytes'] == 48
+    # the CTR context inside GCM is not a mode call of its own
+    assert 'CTRMode' not in snap['modes']
+    instrument.disable()
+    assert AES.AESAlgo.encrypt_block is AES.AESAlgo.__dict__['encrypt_block']
+    assert not hasattr(AES.AESAlgo.encrypt_block, '__wrapped__')
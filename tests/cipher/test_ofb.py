@@ -76,3 +76,58 @@ def test_ofb(vectors):
     dec = unpad(aes.decrypt(enc))
     assert enc == cipher
     assert dec == plain
+
+
+def stream(ctx, data, chunk_size):
+    out = b''
+    for i in range(0, len(data), chunk_size):
+        out += ctx.update(data[i:i+chunk_size])
+    return out + ctx.finalize()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 16, 33])
+def test_ofb_stream(vectors, chunk_size):
+    plain, key, cipher = vectors
+    aes = AES.new(key, AES.MODE_OFB, 0x000102030405060708090a0b0c0d0e0f.to_bytes(16, "big"))
+    data = plain
+    enc = stream(aes.encryptor(), data, chunk_size)
+    assert enc == aes.encrypt(data)
+    assert stream(aes.decryptor(), enc, chunk_size) == data
+
+
+def test_ofb_partial_block(vectors):
+    plain, key, cipher = vectors
+    iv = 0x000102030405060708090a0b0c0d0e0f.to_bytes(16, "big")
+    aes = AES.new(key, AES.MODE_OFB, iv)
+    assert aes.encrypt(plain) == cipher[:len(plain)]
+    assert aes.decrypt(cipher[:len(plain)]) == plain
+
+
+@pytest.mark.parametrize('offset', [0, 5, 16, 21, 16 * 1024 + 3, 16 * 2048 + 40])
+def test_ofb_range(offset):
+    key = bytes(range(16))
+    iv = bytes(range(16, 32))
+    plain = bytes(range(256)) * 160
+    cipher = AES.new(key, AES.MODE_OFB, iv).encrypt(plain)
+    aes = AES.new(key, AES.MODE_OFB, iv)
+    for _ in range(2):
+        assert aes.decrypt_range(cipher[offset:offset+37], offset) == plain[offset:offset+37]
+
+
+def test_ofb_shared_checkpoints():
+    from concurrent.futures import ThreadPoolExecutor
+    from cryptolib.cipher._ofb import CHECKPOINT_BLOCKS
+    key = bytes(range(16))
+    iv = bytes(range(16, 32))
+    plain = bytes(16 * CHECKPOINT_BLOCKS * 4 + 7)
+    cipher = AES.new(key, AES.MODE_OFB, iv).encrypt(plain)
+    aes = AES.new(key, AES.MODE_OFB, iv)
+    offsets = [0, 16 * CHECKPOINT_BLOCKS + 5, 16 * CHECKPOINT_BLOCKS * 2 + 9, 3] * 2
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda offset: aes.decrypt_range(cipher[offset:], offset), offsets))
+    assert results == [plain[offset:] for offset in offsets]
+    assert sorted(aes._checkpoints) == list(range(len(aes._checkpoints)))
+    assert aes._checkpoints[0] == iv
+    for k in range(1, len(aes._checkpoints)):
+        end = 16 * CHECKPOINT_BLOCKS * k
+        assert aes._checkpoints[k] == cipher[end - 16:end]
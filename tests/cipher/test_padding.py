@@ -0,0 +1,83 @@
+from cryptolib.cipher import AES, DES
+from cryptolib.cipher._padding import pad, unpad_length
+from binascii import unhexlify
+import pytest
+
+
+KEY = unhexlify('000102030405060708090a0b0c0d0e0f')
+IV = unhexlify('0f0e0d0c0b0a09080706050403020100')
+
+
+@pytest.mark.parametrize(('tail', 'padding', 'padded'), [
+    (b'', 'pkcs7', b'\x08' * 8),
+    (b'abc', 'pkcs7', b'abc\x05\x05\x05\x05\x05'),
+    (b'abcdefg', 'pkcs7', b'abcdefg\x01'),
+    (b'abc', 'zero', b'abc\x00\x00\x00\x00\x00'),
+    (b'', 'zero', b''),
+])
+def test_pad(tail, padding, padded):
+    assert pad(tail, 8, padding) == padded
+
+
+def test_pad_iso10126():
+    block = pad(b'abc', 8, 'iso10126')
+    assert block[:3] == b'abc' and block[-1] == 5
+    assert unpad_length(memoryview(block), 'iso10126') == 5
+
+
+@pytest.mark.parametrize('block', [
+    b'abcdefg\x00', b'abcdefg\x09', b'abcd\x04\x04\x03\x04', b'\x05' * 7 + b'\x08',
+])
+def test_unpad_invalid(block):
+    with pytest.raises(ValueError):
+        unpad_length(memoryview(block), 'pkcs7')
+
+
+@pytest.mark.parametrize('mode', [AES.MODE_ECB, AES.MODE_CBC])
+@pytest.mark.parametrize('padding', ['pkcs7', 'iso10126', 'zero'])
+@pytest.mark.parametrize('length', [0, 1, 15, 16, 17, 100])
+def test_padding_modes(mode, padding, length):
+    plain = bytes(range(1, length + 1))
+    aes = AES.new(KEY, mode, IV, padding=padding)
+    enc = aes.encrypt(plain)
+    assert len(enc) % 16 == 0
+    if padding != 'zero':
+        assert len(enc) == (length // 16 + 1) * 16
+    assert aes.decrypt(enc) == plain
+
+
+def test_padding_pkcs7_ciphertext():
+    plain = b'YELLOW SUBMARINE!'
+    enc = AES.new(KEY, AES.MODE_CBC, IV, padding='pkcs7').encrypt(plain)
+    assert enc == AES.new(KEY, AES.MODE_CBC, IV).encrypt(plain + b'\x0f' * 15)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 16, 33])
+def test_padding_stream(chunk_size):
+    plain = bytes(range(100))
+    aes = AES.new(KEY, AES.MODE_CBC, IV, padding='pkcs7')
+    enc = aes.encrypt(plain)
+    ctx = aes.decryptor()
+    out = b''.join(ctx.update(enc[i:i+chunk_size]) for i in range(0, len(enc), chunk_size))
+    assert out + ctx.finalize() == plain
+    ctx = aes.encryptor()
+    out = b''.join(ctx.update(plain[i:i+chunk_size]) for i in range(0, len(plain), chunk_size))
+    assert out + ctx.finalize() == enc
+
+
+def test_padding_bad_ciphertext():
+    aes = AES.new(KEY, AES.MODE_ECB, padding='pkcs7')
+    with pytest.raises(ValueError):
+        aes.decrypt(AES.new(KEY, AES.MODE_ECB).encrypt(b'A' * 16))
+
+
+def test_padding_des():
+    des = DES.new(KEY[:8], DES.MODE_CBC, IV[:8], padding='pkcs7')
+    assert des.decrypt(des.encrypt(b'hello')) == b'hello'
+
+
+def test_padding_invalid():
+    with pytest.raises(ValueError):
+        AES.new(KEY, AES.MODE_ECB, padding='ansi')
+    with pytest.raises(ValueError):
+        AES.new(KEY, AES.MODE_CTR, IV, padding='pkcs7')
@@ -0,0 +1,70 @@
+from cryptolib.cipher import AES
+from binascii import unhexlify
+import mmap
+import pytest
+
+
+KEY1 = 'fffefdfcfbfaf9f8f7f6f5f4f3f2f1f0'
+KEY2 = 'bfbebdbcbbbab9b8b7b6b5b4b3b2b1b0'
+
+# IEEE 1619 vectors 1 and 15-18
+test_vectors = [
+    ('00' * 32, 0, '00' * 32, '917cf69ebd68b2ec9b9fe9a3eadda692cd43d2f59598ed858c02c2652fbf922e'),
+    (KEY1 + KEY2, 0x123456789a, '000102030405060708090a0b0c0d0e0f10', '6c1625db4671522d3d7599601de7ca09ed'),
+    (KEY1 + KEY2, 0x123456789a, '000102030405060708090a0b0c0d0e0f1011', 'd069444b7a7e0cab09e24447d24deb1fedbf'),
+    (KEY1 + KEY2, 0x123456789a, '000102030405060708090a0b0c0d0e0f101112', 'e5df1351c0544ba1350b3363cd8ef4beedbf9d'),
+    (KEY1 + KEY2, 0x123456789a, '000102030405060708090a0b0c0d0e0f10111213', '9d84c813f719aa2c7be3f66171c7c5c2edbf9dac'),
+]
+
+
+@pytest.fixture(params=test_vectors)
+def vectors(request):
+    key, sector, plain, cipher = request.param
+    return unhexlify(key), sector, unhexlify(plain), unhexlify(cipher)
+
+
+def test_xts(vectors):
+    key, sector, plain, cipher = vectors
+    aes = AES.new(key, AES.MODE_XTS, sector.to_bytes(16, 'little'))
+    assert aes.encrypt(plain) == cipher
+    assert aes.decrypt(cipher) == plain
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 16, 17])
+def test_xts_stream(vectors, chunk_size):
+    key, sector, plain, cipher = vectors
+    aes = AES.new(key, AES.MODE_XTS, sector.to_bytes(16, 'little'))
+    ctx = aes.encryptor()
+    out = b''.join(ctx.update(plain[i:i+chunk_size]) for i in range(0, len(plain), chunk_size))
+    assert out + ctx.finalize() == cipher
+
+
+def test_xts_sectors():
+    aes = AES.new(unhexlify(KEY1 + KEY2), AES.MODE_XTS)
+    sectors = [(i * 7, bytes(range(256))[:n]) for i, n in enumerate([16, 17, 100, 256, 31])]
+    enc = aes.encrypt_sectors(sectors)
+    for (index, data), c in zip(sectors, enc):
+        assert c == AES.new(unhexlify(KEY1 + KEY2), AES.MODE_XTS, index.to_bytes(16, 'little')).encrypt(data)
+    assert aes.decrypt_sectors(zip([index for index, _ in sectors], enc)) == [data for _, data in sectors]
+
+
+def test_xts_inplace(tmp_path):
+    aes = AES.new(unhexlify(KEY1 + KEY2), AES.MODE_XTS)
+    plain = bytes(range(256)) * 20 + b'tail of image' * 3
+    path = tmp_path / 'image'
+    path.write_bytes(plain)
+    with open(path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as m:
+        aes.encrypt_inplace(m, 512, first_sector=3)
+        enc = bytes(m)
+        aes.decrypt_inplace(m, 512, first_sector=3)
+        assert bytes(m) == plain
+    sectors = [(3 + i // 512, plain[i:i+512]) for i in range(0, len(plain), 512)]
+    assert enc == b''.join(aes.encrypt_sectors(sectors))
+
+
+def test_xts_short_data():
+    aes = AES.new(bytes(32), AES.MODE_XTS)
+    with pytest.raises(ValueError):
+        aes.encrypt(b'short')
+    with pytest.raises(ValueError):
+        aes.encrypt_sectors([(0, b'short')])
@@ -0,0 +1,43 @@
+from cryptolib import number
+import gmpy2
+import pytest
+
+
+@pytest.mark.parametrize('n', [2, 3, 8, 12, 13, 32, 256, 1024])
+def test_get_prime(n):
+    for _ in range(8):
+        p = number.get_prime(n)
+        assert p.bit_length() == n
+        assert n == 2 or p >> (n - 2) == 3
+        assert gmpy2.is_prime(p)
+
+
+def test_get_prime_invalid():
+    with pytest.raises(ValueError):
+        number.get_prime(1)
+
+
+def test_sieve_window():
+    base = (1 << 100) + 1
+    residues = [base % p for p in number.SIEVE_PRIMES]
+    sieve = number._sieve_window(residues)
+    for i in range(number.SIEVE_WINDOW):
+        assert sieve[i] == all((base + 2 * i) % p for p in number.SIEVE_PRIMES)
+
+
+@pytest.mark.parametrize(('n', 'expected'), [
+    (-7, False),
+    (0, False),
+    (1, False),
+    (2, True),
+    (4, False),
+    (3, True),
+    (561, False),
+    (41041, False),
+    (2 ** 61 - 1, True),
+    (98959625207757469, True),
+    (629685412367973552, False),
+])
+def test_miller_rabin(n, expected):
+    assert number.miller_rabin(n) == expected
+    assert number.is_prime(n) == expected